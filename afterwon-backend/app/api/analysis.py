@@ -1,8 +1,8 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 import uuid
 from ..services.file_service import FileService
 from ..services.ai_service import AIService
-from ..services.chart_service import ChartService
+from ..services.chart_service import ChartService, to_json_bytes
 from ..models.file import AnalysisRequest, AnalysisResponse
 
 router = APIRouter(prefix="/api/analysis", tags=["analysis"])
@@ -73,7 +73,8 @@ async def analyze_data(request: AnalysisRequest):
             follow_up_questions=analysis_result.get("follow_up_questions", [])
         )
         
-        return response
+        # 차트 dict를 orjson으로 한 번에 직렬화 (numpy 배열 포함)
+        return Response(content=to_json_bytes(response.model_dump()), media_type="application/json")
         
     except Exception as e:
         import traceback
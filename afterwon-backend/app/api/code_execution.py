@@ -119,18 +119,104 @@ def prepare_dataframe_context(context: Dict[str, Any]) -> Dict[str, Any]:
 
     return enhanced_context
 
+def _execute_with_context(code: str, local_vars: Dict[str, Any]) -> CodeExecutionResponse:
+    """준비된 실행 컨텍스트에서 코드를 실행하고 결과를 응답 형태로 반환"""
+    start_time = datetime.now()
+
+    # 출력 캡처를 위한 StringIO 객체
+    output_buffer = io.StringIO()
+    error_buffer = io.StringIO()
+
+    # 코드 실행
+    with contextlib.redirect_stdout(output_buffer), contextlib.redirect_stderr(error_buffer):
+        try:
+            # exec을 사용하여 코드 실행
+            exec(code, SAFE_GLOBALS, local_vars)
+
+            # 결과 추출 (마지막 변수나 표현식 결과)
+            result = None
+            chart_data = None
+
+            if local_vars:
+                # chart_json 변수가 있으면 차트 데이터로 사용
+                if 'chart_json' in local_vars:
+                    try:
+                        import json
+                        chart_json_str = local_vars['chart_json']
+                        if isinstance(chart_json_str, str):
+                            chart_data = json.loads(chart_json_str)
+                        else:
+                            chart_data = chart_json_str
+                        # 차트 데이터도 NumPy 타입 변환 적용
+                        chart_data = convert_numpy_types(chart_data)
+                        print("🎨 차트 데이터가 추출되었습니다!")
+                    except Exception as e:
+                        print(f"⚠️ 차트 데이터 처리 오류: {e}")
+
+                # 마지막에 정의된 변수 중에서 결과를 찾기
+                for key, value in local_vars.items():
+                    if not key.startswith('_') and key not in ['pd', 'np', 'plt', 'sns', 'px', 'go', 'json', 'datetime', 'chart_json', 'fig']:
+                        # NumPy 타입을 Python 기본 타입으로 변환
+                        result = convert_numpy_types(value)
+
+            output = output_buffer.getvalue()
+            error_output = error_buffer.getvalue()
+
+            # 출력이 없으면 기본 메시지 제공
+            if not output.strip() and not error_output:
+                output = "코드가 성공적으로 실행되었습니다."
+
+            end_time = datetime.now()
+            execution_time = (end_time - start_time).total_seconds()
+
+            # 응답 데이터 구성
+            response_data = {
+                "success": True,
+                "output": output,
+                "error": error_output if error_output else None,
+                "result": str(convert_numpy_types(result)) if result is not None else None,
+                "execution_time": execution_time
+            }
+
+            # 차트 데이터가 있으면 추가
+            if chart_data:
+                response_data["chart_data"] = chart_data
+
+            # 전체 응답 데이터에 NumPy 타입 변환 적용
+            response_data = convert_numpy_types(response_data)
+
+            return CodeExecutionResponse(**response_data)
+
+        except Exception as e:
+            error_output = error_buffer.getvalue()
+            error_message = f"{str(e)}\n{traceback.format_exc()}"
+
+            end_time = datetime.now()
+            execution_time = (end_time - start_time).total_seconds()
+
+            return CodeExecutionResponse(
+                success=False,
+                output=output_buffer.getvalue(),
+                error=error_message,
+                result=None,
+                execution_time=execution_time
+            )
+
+async def run_code(code: str, df: pd.DataFrame, extra_vars: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    데이터프레임과 함께 코드를 프로세스 내에서 직접 실행합니다.
+    (같은 서버의 서비스에서 HTTP/직렬화 없이 호출, extra_vars는 추가 실행 변수)
+    """
+    # 실행 코드가 원본 데이터프레임을 변경하지 않도록 복사본 사용
+    df = df.copy()
+    return _execute_with_context(code, {**(extra_vars or {}), 'df': df, 'data': df}).model_dump()
+
 @router.post("/execute", response_model=CodeExecutionResponse)
 async def execute_code(request: CodeExecutionRequest):
     """
     Python 코드를 안전하게 실행합니다.
     """
     try:
-        start_time = datetime.now()
-
-        # 출력 캡처를 위한 StringIO 객체
-        output_buffer = io.StringIO()
-        error_buffer = io.StringIO()
-
         # 실행 컨텍스트 준비
         local_vars = {}
         if request.context:
@@ -138,80 +224,7 @@ async def execute_code(request: CodeExecutionRequest):
             enhanced_context = prepare_dataframe_context(request.context)
             local_vars.update(enhanced_context)
 
-        # 코드 실행
-        with contextlib.redirect_stdout(output_buffer), contextlib.redirect_stderr(error_buffer):
-            try:
-                # exec을 사용하여 코드 실행
-                exec(request.code, SAFE_GLOBALS, local_vars)
-
-                # 결과 추출 (마지막 변수나 표현식 결과)
-                result = None
-                chart_data = None
-
-                if local_vars:
-                    # chart_json 변수가 있으면 차트 데이터로 사용
-                    if 'chart_json' in local_vars:
-                        try:
-                            import json
-                            chart_json_str = local_vars['chart_json']
-                            if isinstance(chart_json_str, str):
-                                chart_data = json.loads(chart_json_str)
-                            else:
-                                chart_data = chart_json_str
-                            # 차트 데이터도 NumPy 타입 변환 적용
-                            chart_data = convert_numpy_types(chart_data)
-                            print("🎨 차트 데이터가 추출되었습니다!")
-                        except Exception as e:
-                            print(f"⚠️ 차트 데이터 처리 오류: {e}")
-
-                    # 마지막에 정의된 변수 중에서 결과를 찾기
-                    for key, value in local_vars.items():
-                        if not key.startswith('_') and key not in ['pd', 'np', 'plt', 'sns', 'px', 'go', 'json', 'datetime', 'chart_json', 'fig']:
-                            # NumPy 타입을 Python 기본 타입으로 변환
-                            result = convert_numpy_types(value)
-
-                output = output_buffer.getvalue()
-                error_output = error_buffer.getvalue()
-
-                # 출력이 없으면 기본 메시지 제공
-                if not output.strip() and not error_output:
-                    output = "코드가 성공적으로 실행되었습니다."
-
-                end_time = datetime.now()
-                execution_time = (end_time - start_time).total_seconds()
-
-                # 응답 데이터 구성
-                response_data = {
-                    "success": True,
-                    "output": output,
-                    "error": error_output if error_output else None,
-                    "result": str(convert_numpy_types(result)) if result is not None else None,
-                    "execution_time": execution_time
-                }
-
-                # 차트 데이터가 있으면 추가
-                if chart_data:
-                    response_data["chart_data"] = chart_data
-
-                # 전체 응답 데이터에 NumPy 타입 변환 적용
-                response_data = convert_numpy_types(response_data)
-
-                return CodeExecutionResponse(**response_data)
-
-            except Exception as e:
-                error_output = error_buffer.getvalue()
-                error_message = f"{str(e)}\n{traceback.format_exc()}"
-
-                end_time = datetime.now()
-                execution_time = (end_time - start_time).total_seconds()
-
-                return CodeExecutionResponse(
-                    success=False,
-                    output=output_buffer.getvalue(),
-                    error=error_message,
-                    result=None,
-                    execution_time=execution_time
-                )
+        return _execute_with_context(request.code, local_vars)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"코드 실행 중 오류가 발생했습니다: {str(e)}")
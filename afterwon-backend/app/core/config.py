@@ -9,7 +9,11 @@ class Settings:
     REDIS_URL = os.getenv("REDIS_URL")
     UPLOAD_FOLDER = os.getenv("UPLOAD_FOLDER", "./uploads")
     MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", 50)) * 1024 * 1024  # MB to bytes
+    METADATA_FLUSH_INTERVAL_MS = int(os.getenv("METADATA_FLUSH_INTERVAL_MS", 200))  # 업로드 메타데이터 디스크 기록 지연 (ms)
     DEBUG = os.getenv("DEBUG", "False").lower() == "true"
+    VALIDATE_FIGURES = os.getenv("VALIDATE_FIGURES", "False").lower() == "true"  # 차트 dict를 plotly graph_objects로 검증
     PORT = int(os.getenv("PORT", 8000))
+    TITLE_MODEL = os.getenv("TITLE_MODEL", "gpt-4o-mini")
+    TITLE_MODEL_URL = os.getenv("TITLE_MODEL_URL")  # 예: http://localhost:11434/api/chat (Ollama)
 
 settings = Settings()
\ No newline at end of file
@@ -3,8 +3,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.encoders import jsonable_encoder
 from .api import files, analysis, websocket, chat, code_execution
 from .core.config import settings
+from .services.file_service import FileService
 import json
 import numpy as np
+from contextlib import asynccontextmanager
 from typing import Any
 
 # NumPy JSON Encoder - 근본적 해결책
@@ -58,10 +60,17 @@ def convert_numpy_types_global(obj: Any) -> Any:
             # JSON 직렬화 실패시 문자열로 변환
             return str(obj)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # 종료 전에 아직 기록되지 않은 파일 메타데이터 저장
+    FileService().flush_metadata()
+
 app = FastAPI(
     title="AfterWon API",
     description="Julius.ai를 뛰어넘는 자연어 데이터 분석 플랫폼",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # NumPy 타입 자동 변환 미들웨어
@@ -4,6 +4,7 @@ import re
 import httpx
 import json
 import asyncio
+import hashlib
 import matplotlib
 matplotlib.use('Agg')  # 브라우저 자동 열기 방지
 import matplotlib.pyplot as plt
@@ -15,9 +16,28 @@ pio.renderers.default = "json"  # Plotly 브라우저 자동 열기 방지
 import io
 import sys
 from contextlib import redirect_stdout, redirect_stderr
+from cachetools import TTLCache
 from openai import AsyncOpenAI
 from typing import Dict, Any, List
 from ..core.config import settings
+from ..api.code_execution import run_code
+
+# 동일한 첫 메시지에 대한 채팅 제목 캐시 (SHA256 키, 24시간 유지)
+_title_cache = TTLCache(maxsize=10_000, ttl=86400)
+
+# 마크다운 코드 블록: 첫 번째 블록 내용 추출 (닫는 펜스가 없으면 끝까지)
+_FENCE_RE = re.compile(r'```(?:python)?[ \t]*\n?(.*?)(?:```|\Z)', re.DOTALL)
+
+# 생성 코드 정제: 제거할 프롬프트 잔여 문구 / 유지할 코드 라인 접두어
+_DROP_RE = re.compile(r'Task:|Numbers:|Calculate|CRITICAL:|Required format:')
+_KEEP_RE = re.compile(r'print\(|result|data')
+
+def _extract_code_block(text: str) -> str:
+    """AI 응답에서 마크다운 코드 블록 내용만 추출 (블록이 없으면 원문 그대로)"""
+    if '```' not in text:
+        return text
+    match = _FENCE_RE.search(text)
+    return match.group(1) if match else text
 
 def convert_numpy_types(obj):
     """NumPy/pandas 타입을 JSON 직렬화 가능한 Python 타입으로 변환"""
@@ -1253,12 +1273,37 @@ RESPONSE FORMAT (JSON only):
     async def generate_chat_title(self, first_message: str) -> str:
         """사용자의 첫 메시지를 바탕으로 적절한 채팅 제목을 생성합니다."""
         try:
-            # Check if API key is properly set
-            if not settings.OPENAI_API_KEY or settings.OPENAI_API_KEY == "your_openai_api_key_here":
+            # Check if API key is properly set (로컬 제목 모델 사용 시 불필요)
+            if not settings.TITLE_MODEL_URL and (not settings.OPENAI_API_KEY or settings.OPENAI_API_KEY == "your_openai_api_key_here"):
                 return "새 채팅"
+
+            # 동일한 메시지는 캐시된 제목 재사용 (LLM 호출 생략)
+            cache_key = hashlib.sha256(first_message.strip().lower().encode()).hexdigest()
+            cached_title = _title_cache.get(cache_key)
+            if cached_title is not None:
+                return cached_title
+
+            if settings.TITLE_MODEL_URL:
+                # 로컬 소형 모델 (Ollama) - 짧은 지시문 사용
+                async with httpx.AsyncClient(timeout=30.0) as client:
+                    response = await client.post(
+                        settings.TITLE_MODEL_URL,
+                        json={
+                            "model": settings.TITLE_MODEL,
+                            "messages": [
+                                {"role": "system", "content": "사용자 메시지의 채팅 제목을 한국어 3-6단어로 작성하세요.\n따옴표나 특수문자 없이 제목만 출력하세요."},
+                                {"role": "user", "content": first_message}
+                            ],
+                            "stream": False,
+                            "options": {"temperature": 0.3, "num_predict": 50}
+                        }
+                    )
+                response.raise_for_status()
+                title = response.json()["message"]["content"].strip()
+                return self._finalize_chat_title(title, cache_key)
             
             response = await self.client.chat.completions.create(
-                model="gpt-4o-mini",
+                model=settings.TITLE_MODEL,
                 messages=[
                     {
                         "role": "system", 
@@ -1285,21 +1330,25 @@ RESPONSE FORMAT (JSON only):
             )
             
             title = response.choices[0].message.content.strip()
-            
-            # 제목이 너무 길면 잘라내기 (최대 30자)
-            if len(title) > 30:
-                title = title[:30] + "..."
-            
-            # 빈 제목이거나 너무 짧으면 기본 제목 반환
-            if not title or len(title) < 3:
-                return "새 채팅"
-                
-            return title
+            return self._finalize_chat_title(title, cache_key)
             
         except Exception as e:
             print(f"Chat title generation AI error: {str(e)}")
             return "새 채팅"
 
+    def _finalize_chat_title(self, title: str, cache_key: str) -> str:
+        """생성된 제목을 정리하고 캐시에 저장"""
+        # 제목이 너무 길면 잘라내기 (최대 30자)
+        if len(title) > 30:
+            title = title[:30] + "..."
+
+        # 빈 제목이거나 너무 짧으면 기본 제목 반환 (캐시하지 않음)
+        if not title or len(title) < 3:
+            return "새 채팅"
+
+        _title_cache[cache_key] = title
+        return title
+
     async def analyze_with_code_execution(self, df: pd.DataFrame, question: str) -> Dict[str, Any]:
         """코드 실행을 통한 정확한 데이터 분석"""
         try:
@@ -1426,29 +1475,8 @@ RESPONSE FORMAT (JSON only):
     async def _execute_analysis_code(self, code: str, df: pd.DataFrame) -> Dict[str, Any]:
         """분석 코드를 안전하게 실행"""
         try:
-            # 코드 실행 API 호출
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "http://localhost:8000/api/code/execute",
-                    json={
-                        "code": code,
-                        "context": {
-                            "data": df.to_dict(),  # 데이터프레임을 딕셔너리로 전달
-                            "df": df.to_dict()  # 호환성을 위한 별칭
-                        }
-                    },
-                    timeout=30.0
-                )
-
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return {
-                        "success": False,
-                        "output": "",
-                        "error": f"실행 실패: {response.status_code}",
-                        "execution_time": 0
-                    }
+            # 같은 프로세스에서 바로 실행 (localhost HTTP 왕복과 데이터프레임 직렬화 없음)
+            return await run_code(code, df)
 
         except Exception as e:
             return {
@@ -1506,22 +1534,28 @@ RESPONSE FORMAT (JSON only):
                 else:
                     print(f"📊 차트 데이터 없음 - 텍스트 분석으로 진행")
 
-            # 4단계: AI 인사이트 생성 (ChatGPT 스타일)
-            print(f"🧠 AI 인사이트 분석 시작...")
-            insights = await self._generate_chatgpt_insights(
-                question, execution_result, chart_data, df
-            )
-
-            # 5단계: 후속 질문 생성
-            follow_up_questions = await self._generate_follow_up_questions(question, {
+            # 5단계: 후속 질문 생성 - 실행 결과만 필요하므로 인사이트/답변 생성과 동시에 진행
+            follow_up_task = asyncio.create_task(self._generate_follow_up_questions(question, {
                 'output': execution_result,
                 'chart_data': chart_data
-            })
+            }))
 
-            # 6단계: ChatGPT 스타일 완전한 답변 생성
-            comprehensive_answer = await self._generate_comprehensive_answer(
-                question, execution_result, insights, chart_data
-            )
+            try:
+                # 4단계: AI 인사이트 생성 (ChatGPT 스타일)
+                print(f"🧠 AI 인사이트 분석 시작...")
+                insights = await self._generate_chatgpt_insights(
+                    question, execution_result, chart_data, df
+                )
+
+                # 6단계: ChatGPT 스타일 완전한 답변 생성
+                comprehensive_answer = await self._generate_comprehensive_answer(
+                    question, execution_result, insights, chart_data
+                )
+            except Exception:
+                follow_up_task.cancel()
+                raise
+
+            follow_up_questions = await follow_up_task
 
             result = {
                 'answer': comprehensive_answer,
@@ -2036,10 +2070,7 @@ RESPONSE FORMAT (JSON only):
             generated_code = response.choices[0].message.content.strip()
 
             # 마크다운 코드 블록 제거
-            if '```python' in generated_code:
-                generated_code = generated_code.split('```python')[1].split('```')[0]
-            elif '```' in generated_code:
-                generated_code = generated_code.split('```')[1].split('```')[0]
+            generated_code = _extract_code_block(generated_code)
 
             generated_code = generated_code.strip()
 
@@ -2117,12 +2148,7 @@ Return ONLY the above code. Nothing else."""
         def clean_code(code_text: str) -> str:
             """AI가 생성한 텍스트에서 순수 Python 코드만 추출"""
             # 마크다운 코드 블록 제거 (더 강력한 제거)
-            if '```python' in code_text:
-                code_text = code_text.split('```python')[1].split('```')[0]
-            elif '```' in code_text:
-                parts = code_text.split('```')
-                if len(parts) >= 3:
-                    code_text = parts[1]
+            code_text = _extract_code_block(code_text)
 
             # 불필요한 설명 텍스트 완전 제거
             if 'CRITICAL:' in code_text:
@@ -2154,11 +2180,7 @@ Return ONLY the above code. Nothing else."""
                     continue
 
                 # Python 코드가 아닌 것들 제거
-                if (stripped.startswith('Task:') or
-                    stripped.startswith('Numbers:') or
-                    stripped.startswith('Calculate') or
-                    stripped.startswith('CRITICAL:') or
-                    stripped.startswith('Required format:')):
+                if _DROP_RE.match(stripped):
                     continue
 
                 # 중복된 print 문 제거
@@ -2169,10 +2191,8 @@ Return ONLY the above code. Nothing else."""
 
                 # 유효한 Python 코드만 추가
                 if (('=' in stripped) or
-                    stripped.startswith('print(') or
-                    stripped.startswith('result') or
-                    stripped.startswith('data') or
-                    ('    ' in line and line.strip())):  # 들여쓰기된 라인
+                    _KEEP_RE.match(stripped) or
+                    ('    ' in line)):  # 들여쓰기된 라인
                     code_lines.append(line.rstrip())
 
             return '\n'.join(code_lines)
@@ -2201,31 +2221,8 @@ Return ONLY the above code. Nothing else."""
     async def _execute_analysis_code_with_data(self, code: str, df: pd.DataFrame) -> Dict[str, Any]:
         """실제 데이터와 함께 분석 코드 실행"""
         try:
-            # 코드 실행 API 호출
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "http://localhost:8000/api/code/execute",
-                    json={
-                        "code": code,
-                        "context": {
-                            "df": df.to_dict('list'),  # list 형태로 직렬화
-                            "data": df.to_dict('list'),
-                            "rows": len(df),
-                            "columns": df.columns.tolist()
-                        }
-                    },
-                    timeout=30.0
-                )
-
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return {
-                        "success": False,
-                        "output": "",
-                        "error": f"실행 실패: {response.status_code}",
-                        "execution_time": 0
-                    }
+            # 같은 프로세스에서 바로 실행 (localhost HTTP 왕복과 데이터프레임 직렬화 없음)
+            return await run_code(code, df, {"rows": len(df), "columns": df.columns.tolist()})
 
         except Exception as e:
             return {
@@ -2367,10 +2364,7 @@ df = pd.DataFrame(data)  # 금지!
             generated_code = response.choices[0].message.content.strip()
 
             # 코드 블록 마커 제거
-            if "```python" in generated_code:
-                generated_code = generated_code.split("```python")[1].split("```")[0]
-            elif "```" in generated_code:
-                generated_code = generated_code.split("```")[1].split("```")[0]
+            generated_code = _extract_code_block(generated_code)
 
             return generated_code.strip()
 
@@ -2469,10 +2463,7 @@ Python 코드가 불필요한 경우:
                     generated_code += chunk.choices[0].delta.content
 
             # 코드 블록 마커 제거
-            if "```python" in generated_code:
-                generated_code = generated_code.split("```python")[1].split("```")[0]
-            elif "```" in generated_code:
-                generated_code = generated_code.split("```")[1].split("```")[0]
+            generated_code = _extract_code_block(generated_code)
 
             return generated_code.strip()
 
@@ -2540,16 +2531,13 @@ print("📊 계산 완료!")
             }
 
     async def _execute_code_via_api(self, code: str, df: pd.DataFrame) -> dict:
-        """🚀 프론트엔드 성공 파이프라인과 완전히 동일한 방식으로 실행"""
+        """🚀 프론트엔드 성공 파이프라인과 같은 데이터 전처리 후 코드 실행 (프로세스 내 실행)"""
         try:
-            import httpx
-            import json
             import numpy as np
 
             print(f"🔥 프론트엔드 성공 파이프라인 사용 - 코드 길이: {len(code)}")
 
-            # 데이터프레임을 딕셔너리로 변환 (프론트엔드와 100% 동일)
-            context = {}
+            df_clean = pd.DataFrame()
             if df is not None and not df.empty:
                 # 단계별 강력한 NaN 처리
                 df_clean = df.copy()
@@ -2564,88 +2552,29 @@ print("📊 계산 완료!")
                     else:
                         df_clean[col] = df_clean[col].fillna('')
 
-                # 3. to_dict 변환
-                df_dict = df_clean.to_dict('list')
-
-                # 4. 딕셔너리 내 모든 값을 JSON 안전 타입으로 변환
-                def clean_value(val):
-                    if pd.isna(val) or val is None:
-                        return None
-                    elif isinstance(val, (np.integer, int)):
-                        return int(val)
-                    elif isinstance(val, (np.floating, float)):
-                        if np.isnan(val) or np.isinf(val):
-                            return 0
-                        return float(val)
-                    elif isinstance(val, str):
-                        return str(val)
-                    else:
-                        return str(val)
-
-                # 5. 모든 값을 재귀적으로 정리
-                cleaned_dict = {}
-                for key, values in df_dict.items():
-                    cleaned_dict[key] = [clean_value(v) for v in values]
+                print(f"📊 데이터 준비 완료: {len(df)}행, {len(df.columns)}열 (강력한 NaN 처리 적용)")
 
-                context['df'] = cleaned_dict
-                print(f"📊 데이터 변환 완료: {len(df)}행, {len(df.columns)}열 (강력한 NaN 처리 적용)")
+            # 같은 프로세스에서 바로 실행 (localhost HTTP 왕복과 JSON 직렬화 없음)
+            result = await run_code(code, df_clean)
+            success = result.get('success', False)
+            chart_data = result.get('chart_data')
+            output = result.get('output', '')
 
-            # 요청 데이터 구성 (프론트엔드와 동일)
-            request_data = {
-                "code": code,
-                "context": context
-            }
+            print(f"✅ 프론트엔드 파이프라인 성공!")
+            print(f"  - 성공: {success}")
+            print(f"  - 출력 길이: {len(output) if output else 0}")
+            print(f"  - 차트 데이터: {'있음' if chart_data else '없음'}")
 
-            # JSON 직렬화 테스트
-            try:
-                json.dumps(request_data, ensure_ascii=False)
-                print(f"✅ JSON 직렬화 테스트 통과")
-            except Exception as json_error:
-                print(f"❌ JSON 직렬화 테스트 실패: {json_error}")
-                return {
-                    "success": False,
-                    "output": "",
-                    "error": f"데이터 직렬화 오류: {str(json_error)}"
-                }
-
-            print(f"🌐 API 호출 시작: /api/code/execute")
-
-            # 내부 API 호출 (프론트엔드와 동일한 엔드포인트)
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "http://localhost:8001/api/code/execute",
-                    json=request_data,
-                    timeout=30.0
-                )
+            if chart_data:
+                print(f"🎨 차트 데이터 크기: {len(str(chart_data))}")
 
-                if response.status_code == 200:
-                    result = response.json()
-                    success = result.get('success', False)
-                    chart_data = result.get('chart_data')
-                    output = result.get('output', '')
-
-                    print(f"✅ 프론트엔드 파이프라인 성공!")
-                    print(f"  - 성공: {success}")
-                    print(f"  - 출력 길이: {len(output) if output else 0}")
-                    print(f"  - 차트 데이터: {'있음' if chart_data else '없음'}")
-
-                    if chart_data:
-                        print(f"🎨 차트 데이터 크기: {len(str(chart_data))}")
-
-                    return {
-                        'success': success,
-                        'output': output,
-                        'error': result.get('error'),
-                        'chart_data': chart_data,
-                        'execution_time': result.get('execution_time', 0)
-                    }
-                else:
-                    print(f"❌ API 호출 실패: {response.status_code}")
-                    return {
-                        'success': False,
-                        'output': '',
-                        'error': f"API 호출 실패: HTTP {response.status_code}"
-                    }
+            return {
+                'success': success,
+                'output': output,
+                'error': result.get('error'),
+                'chart_data': chart_data,
+                'execution_time': result.get('execution_time', 0)
+            }
 
         except Exception as e:
             print(f"❌ API 실행 오류: {e}")
@@ -3216,10 +3145,7 @@ Python 코드만 반환하세요:
                 }
 
             # 코드 블록 마커 제거
-            if "```python" in generated_code:
-                generated_code = generated_code.split("```python")[1].split("```")[0]
-            elif "```" in generated_code:
-                generated_code = generated_code.split("```")[1].split("```")[0]
+            generated_code = _extract_code_block(generated_code)
 
             yield {
                 "type": "code_complete",
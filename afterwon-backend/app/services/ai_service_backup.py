@@ -2,9 +2,303 @@ import pandas as pd
 import re
 import httpx
 import json
+import asyncio
+import hashlib
+import ast
+import operator
+from functools import lru_cache
+import orjson
+import xxhash
+from cachetools import TTLCache
 from openai import OpenAI
 from typing import Dict, Any, List
 from ..core.config import settings
+from ..api.code_execution import run_code
+
+# 파일 없는 일반 계산용 빈 데이터프레임 (실행 시 복사본을 사용하므로 공유 가능)
+_EMPTY_DF = pd.DataFrame()
+
+# 동일한 첫 메시지에 대한 채팅 제목 캐시 (SHA256 키, 24시간 유지)
+_title_cache = TTLCache(maxsize=10_000, ttl=86400)
+
+# (질문, 컬럼 구성, 행 수) 별 스마트 컬럼 매핑 결과 캐시 (세션 수명 기준 1시간 유지)
+_mapping_cache = TTLCache(maxsize=2000, ttl=3600)
+
+# (질문, 분석 결과 앞 500자) 별 후속 질문 캐시 (1시간 유지)
+_follow_up_cache = TTLCache(maxsize=512, ttl=3600)
+
+# 마크다운 코드 블록: 첫 번째 블록 내용 추출 / 앞뒤 펜스만 제거
+_FENCE_RE = re.compile(r'```(?:python)?[ \t]*\n?(.*?)(?:```|\Z)', re.DOTALL)
+_FENCE_EDGE_RE = re.compile(r'\A```(?:python)?|```\Z')
+
+# 생성 코드 정제 시 제거할 프롬프트 잔여 문구 (줄 시작 기준)
+_MARKER_PREFIX_RE = re.compile(r'Task:|Numbers:|Calculate|CRITICAL:|Required format:')
+# 한글 음절 포함 여부 / 코드로 볼 수 있는 문자(=, (, [) 포함 여부
+_KOREAN_RE = re.compile('[\uac00-\ud7a3]')
+_CODEISH_RE = re.compile(r'[=(\[]')
+# 코드로 유지할 라인: print/result/data로 시작, 대입(=) 포함, 들여쓰기(공백 4칸) 포함
+_KEEP_LINE_RE = re.compile(r'^\s*(?:print\(|result|data)|=| {4}')
+
+# 코드 청크 분할 지점: import/from 문, 주석, 한 줄짜리 print 문, 빈 줄
+_CHUNK_BREAK_RE = re.compile(r'^[ \t]*(?:import |from |#|print\(.*\)[ \t\r]*$|[ \t\r]*$)', re.MULTILINE)
+
+# 일반 계산 질문의 수식/숫자 추출 패턴
+_MATH_EXPR_RE = re.compile(r'[\d\s]*[\+\-\*\/][\d\s]*')
+_MATH_EXTRACT_RE = re.compile(r'[0-9+\-*\/\(\)\.\s]+')
+_NUM_RE = re.compile(r'\d+(?:\.\d+)?')
+
+# 산술식 계산에 허용되는 연산자 (eval 대신 AST를 직접 평가)
+_SAFE_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+}
+_SAFE_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+def _evaluate_arithmetic(expression: str):
+    """숫자와 사칙연산만으로 이루어진 수식을 안전하게 계산"""
+    def _eval(node):
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            return node.value
+        if isinstance(node, ast.BinOp) and type(node.op) in _SAFE_BIN_OPS:
+            return _SAFE_BIN_OPS[type(node.op)](_eval(node.left), _eval(node.right))
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _SAFE_UNARY_OPS:
+            return _SAFE_UNARY_OPS[type(node.op)](_eval(node.operand))
+        raise ValueError(f"지원하지 않는 수식입니다: {expression}")
+
+    return _eval(ast.parse(expression, mode='eval').body)
+
+def _mark_first_seen(seen: set, value) -> bool:
+    """처음 보는 값이면 기록 후 True, 이미 본 값이면 False"""
+    if value in seen:
+        return False
+    seen.add(value)
+    return True
+
+# 마크다운 코드 블록과 설명 텍스트 제거 - 같은 응답이 반복되는 경우가 많아 결과 캐시
+@lru_cache(maxsize=256)
+def _clean_generated_code(code_text: str) -> str:
+    """AI가 생성한 텍스트에서 순수 Python 코드만 추출"""
+    # 마크다운 코드 블록 제거 (첫 번째 블록 내용만 사용, 펜스가 없으면 정규식 생략)
+    if '```' in code_text:
+        fence_match = _FENCE_RE.search(code_text)
+        if fence_match:
+            code_text = fence_match.group(1)
+
+    # 불필요한 설명 텍스트 완전 제거
+    if 'CRITICAL:' in code_text:
+        parts = code_text.split('CRITICAL:')[0].strip()
+        if parts:
+            code_text = parts
+
+    if 'Required format:' in code_text:
+        parts = code_text.split('Required format:')[1].strip()
+        if parts:
+            code_text = parts
+
+    # 중복된 print 문 방지를 위한 세트 (라인 문자열 대신 64비트 xxhash 다이제스트 저장)
+    seen_print_hashes = set()
+
+    # 전체 텍스트에 한글이 없으면 라인별 설명 텍스트 검사 생략
+    has_korean = _KOREAN_RE.search(code_text) is not None
+
+    code_lines = [
+        line.rstrip()
+        for line in code_text.splitlines()
+        if (stripped := line.strip())
+        # 설명성 텍스트 완전 제거
+        and not (has_korean and _KOREAN_RE.search(stripped) and not _CODEISH_RE.search(stripped))
+        # Python 코드가 아닌 것들 제거
+        and not _MARKER_PREFIX_RE.match(stripped)
+        # 유효한 Python 코드만 추가 (대입/print/result/data/들여쓰기된 라인)
+        and _KEEP_LINE_RE.search(line)
+        # 중복된 print 문 제거
+        and (not stripped.startswith('print(') or _mark_first_seen(seen_print_hashes, xxhash.xxh3_64_intdigest(stripped.encode())))
+    ]
+
+    return '\n'.join(code_lines)
+
+# 이전 대화를 가리키는 참조 단어 ("이것", "그것", "이 데이터", "위의 결과" 등) - 부분 문자열 매칭
+_REFERENCE_WORDS = [
+    "이것", "그것", "이거", "그거", "이", "그",
+    "이 데이터", "이 파일", "이 결과", "위의", "앞서",
+    "방금", "직전", "이전", "다시", "또", "추가로",
+    "it", "this", "that", "these", "those", "above", "previous"
+]
+_REF_RE = re.compile('|'.join(map(re.escape, _REFERENCE_WORDS)))
+
+# 이전 답변이 데이터 분석 관련인지 판단하는 키워드
+_DATA_CONTEXT_RE = re.compile('데이터|파일|분석|그래프|차트|평균|개체|컬럼')
+
+# 분석 타입별 기본 코드 템플릿 - 모듈 로드 시 한 번만 생성, 호출 시 컬럼명만 format으로 채움
+# ({column} 외의 중괄호는 생성될 코드의 f-string/dict 리터럴이므로 이중 중괄호로 이스케이프)
+# 현재 _generate_data_analysis_code는 AI 생성 코드만 사용하므로 연결되어 있지 않음 (기존 분기 주석 처리 상태 유지)
+_ANALYSIS_CODE_TEMPLATES = {
+    "gender_analysis": """import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import json
+
+# 성별 분포 분석
+print("=== 성별 분포 분석 ===")
+sex_counts = df['{column}'].value_counts()
+print("성별별 개체 수:")
+for gender, cnt in sex_counts.items():
+    percentage = (cnt / len(df)) * 100
+    print(f"  {{gender}}: {{cnt:,}}마리 ({{percentage:.1f}}%)")
+
+print(f"총 분석 개체 수: {{len(df):,}}마리")
+
+# Plotly 바 차트 생성
+fig = px.bar(
+    x=sex_counts.index,
+    y=sex_counts.values,
+    labels={{'x': '성별', 'y': '개체 수'}},
+    title='{column} 기준 개체 수 분포',
+    color=sex_counts.values,
+    color_continuous_scale='viridis'
+)
+
+fig.update_layout(
+    xaxis_title='성별',
+    yaxis_title='개체 수',
+    showlegend=False,
+    height=500
+)
+
+# 차트 데이터를 JSON으로 변환
+chart_json = fig.to_json()
+print("📊 차트가 생성되었습니다!")""",
+
+    "age_analysis": """import pandas as pd
+import plotly.express as px
+import numpy as np
+
+# 연령 분포 분석
+print("=== 연령 분포 분석 ===")
+ages = df['{column}'].dropna()
+print(f"평균 연령: {{ages.mean():.1f}}세")
+print(f"연령 범위: {{ages.min():.0f}}세 - {{ages.max():.0f}}세")
+print(f"표준편차: {{ages.std():.1f}}세")
+
+# 히스토그램 생성
+fig = px.histogram(
+    df,
+    x='{column}',
+    nbins=20,
+    title='연령 분포',
+    labels={{'{column}': '연령', 'count': '개체 수'}}
+)
+
+fig.update_layout(
+    xaxis_title='연령',
+    yaxis_title='개체 수',
+    height=500
+)
+
+chart_json = fig.to_json()
+print("\\n📊 연령 히스토그램이 생성되었습니다!")""",
+
+    "location_analysis": """import pandas as pd
+import plotly.express as px
+
+# 지역별 분포 분석
+print("=== 지역별 분포 분석 ===")
+location_counts = df['{column}'].value_counts()
+print("지역별 개체 수:")
+for location, count in location_counts.head(10).items():
+    percentage = (count / len(df)) * 100
+    print(f"  {{location}}: {{count:,}}마리 ({{percentage:.1f}}%)")
+
+if len(location_counts) > 10:
+    print(f"... 및 {{len(location_counts) - 10}}개 지역 더")
+
+# 바 차트 생성 (상위 15개 지역)
+top_locations = location_counts.head(15)
+fig = px.bar(
+    x=top_locations.values,
+    y=top_locations.index,
+    orientation='h',
+    title='지역별 개체 수 분포 (상위 15개)',
+    labels={{'x': '개체 수', 'y': '지역'}}
+)
+
+fig.update_layout(height=600, yaxis_title='지역', xaxis_title='개체 수')
+chart_json = fig.to_json()
+print("\\n📊 지역별 분포 차트가 생성되었습니다!")""",
+
+    "size_analysis": """import pandas as pd
+import plotly.express as px
+import numpy as np
+
+# 크기 분포 분석
+print("=== {column} 분포 분석 ===")
+sizes = df['{column}'].dropna()
+print(f"평균: {{sizes.mean():.2f}}")
+print(f"중앙값: {{sizes.median():.2f}}")
+print(f"범위: {{sizes.min():.2f}} - {{sizes.max():.2f}}")
+print(f"표준편차: {{sizes.std():.2f}}")
+
+# 히스토그램 생성
+fig = px.histogram(
+    df,
+    x='{column}',
+    nbins=30,
+    title='{column} 분포',
+    labels={{'{column}': '{column}', 'count': '개체 수'}}
+)
+
+fig.update_layout(height=500)
+chart_json = fig.to_json()
+print("\\n📊 크기 분포 히스토그램이 생성되었습니다!")""",
+
+    # 일반적인 데이터 요약 (기본값)
+    "general_summary": """import pandas as pd
+import plotly.express as px
+
+# 데이터 전체 요약
+print("=== 데이터 요약 ===")
+print(f"총 행 수: {{len(df):,}}")
+print(f"총 컬럼 수: {{len(df.columns)}}")
+
+print("\\n컬럼 목록:")
+for i, col in enumerate(df.columns, 1):
+    print(f"  {{i}}. {{col}}")
+
+# 숫자형 컬럼 통계
+numeric_cols = df.select_dtypes(include=['number']).columns
+if len(numeric_cols) > 0:
+    print("\\n숫자형 컬럼 통계:")
+    for col in numeric_cols[:5]:  # 최대 5개
+        values = df[col].dropna()
+        if len(values) > 0:
+            print(f"  {{col}}: 평균 {{values.mean():.2f}}, 범위 {{values.min():.2f}}-{{values.max():.2f}}")
+
+# 첫 번째 범주형 컬럼으로 간단한 차트 생성
+categorical_cols = df.select_dtypes(include=['object']).columns
+if len(categorical_cols) > 0:
+    chart_col = categorical_cols[0]
+    value_counts = df[chart_col].value_counts().head(10)
+
+    fig = px.bar(
+        x=value_counts.index,
+        y=value_counts.values,
+        title=f'{{chart_col}} 분포 (상위 10개)',
+        labels={{'x': chart_col, 'y': '개수'}}
+    )
+
+    fig.update_layout(height=500)
+    chart_json = fig.to_json()
+    print(f"\\n📊 {{chart_col}} 분포 차트가 생성되었습니다!")
+else:
+    print("\\n차트 생성을 위한 적절한 컬럼을 찾을 수 없습니다.")""",
+}
 
 class AIService:
     def __init__(self):
@@ -1195,12 +1489,39 @@ RESPONSE FORMAT (JSON only):
     async def generate_chat_title(self, first_message: str) -> str:
         """사용자의 첫 메시지를 바탕으로 적절한 채팅 제목을 생성합니다."""
         try:
-            # Check if API key is properly set
-            if not settings.OPENAI_API_KEY or settings.OPENAI_API_KEY == "your_openai_api_key_here":
+            # Check if API key is properly set (로컬 제목 모델 사용 시 불필요)
+            if not settings.TITLE_MODEL_URL and (not settings.OPENAI_API_KEY or settings.OPENAI_API_KEY == "your_openai_api_key_here"):
                 return "새 채팅"
-            
+
+            # 동일한 메시지는 캐시된 제목 재사용 (LLM 호출 생략)
+            cache_key = hashlib.sha256(first_message.strip().lower().encode()).hexdigest()
+            cached_title = _title_cache.get(cache_key)
+            if cached_title is not None:
+                print(f"🗂️ Chat title cache: HIT ({cache_key[:12]})")
+                return cached_title
+            print(f"🗂️ Chat title cache: MISS ({cache_key[:12]})")
+
+            if settings.TITLE_MODEL_URL:
+                # 로컬 소형 모델 (Ollama) - 짧은 지시문 사용
+                async with httpx.AsyncClient(timeout=30.0) as client:
+                    response = await client.post(
+                        settings.TITLE_MODEL_URL,
+                        json={
+                            "model": settings.TITLE_MODEL,
+                            "messages": [
+                                {"role": "system", "content": "사용자 메시지의 채팅 제목을 한국어 3-6단어로 작성하세요.\n따옴표나 특수문자 없이 제목만 출력하세요."},
+                                {"role": "user", "content": first_message}
+                            ],
+                            "stream": False,
+                            "options": {"temperature": 0.3, "num_predict": 50}
+                        }
+                    )
+                response.raise_for_status()
+                title = response.json()["message"]["content"].strip()
+                return self._finalize_chat_title(title, cache_key)
+
             response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
+                model=settings.TITLE_MODEL,
                 messages=[
                     {
                         "role": "system", 
@@ -1227,21 +1548,25 @@ RESPONSE FORMAT (JSON only):
             )
             
             title = response.choices[0].message.content.strip()
-            
-            # 제목이 너무 길면 잘라내기 (최대 30자)
-            if len(title) > 30:
-                title = title[:30] + "..."
-            
-            # 빈 제목이거나 너무 짧으면 기본 제목 반환
-            if not title or len(title) < 3:
-                return "새 채팅"
-                
-            return title
+            return self._finalize_chat_title(title, cache_key)
             
         except Exception as e:
             print(f"Chat title generation AI error: {str(e)}")
             return "새 채팅"
 
+    def _finalize_chat_title(self, title: str, cache_key: str) -> str:
+        """생성된 제목을 정리하고 캐시에 저장"""
+        # 제목이 너무 길면 잘라내기 (최대 30자)
+        if len(title) > 30:
+            title = title[:30] + "..."
+
+        # 빈 제목이거나 너무 짧으면 기본 제목 반환
+        if not title or len(title) < 3:
+            return "새 채팅"
+
+        _title_cache[cache_key] = title
+        return title
+
     async def analyze_with_code_execution(self, df: pd.DataFrame, question: str) -> Dict[str, Any]:
         """코드 실행을 통한 정확한 데이터 분석"""
         try:
@@ -1321,45 +1646,26 @@ RESPONSE FORMAT (JSON only):
     def _split_code_into_chunks(self, code: str) -> List[str]:
         """코드를 실행 단위별로 분할"""
         # 백틱 제거
-        code = code.strip()
-        if code.startswith('```python'):
-            code = code[9:]
-        if code.startswith('```'):
-            code = code[3:]
-        if code.endswith('```'):
-            code = code[:-3]
-
-        lines = code.split('\n')
-        chunks = []
-        current_chunk = []
-
-        for i, line in enumerate(lines):
-            current_chunk.append(line)
-
-            # 의미있는 단위로 청크 분할
-            is_break_point = (
-                line.strip().startswith('import ') or  # import 문
-                line.strip().startswith('from ') or   # from import 문
-                line.strip().startswith('#') or       # 주석
-                (line.strip().startswith('print(') and line.strip().endswith(')')) or  # 완전한 print 문
-                (line.strip() == '' and i > 0 and lines[i-1].strip() != '') or  # 빈 줄 (연속 빈 줄 제외)
-                (i == len(lines) - 1)  # 마지막 줄
-            )
-
-            if is_break_point and current_chunk:
-                chunk_text = '\n'.join(current_chunk).strip()
-                if chunk_text:
-                    chunks.append(chunk_text)
-                current_chunk = []
+        code = _FENCE_EDGE_RE.sub('', code.strip())
 
-        # 마지막 청크 추가
-        if current_chunk:
-            chunk_text = '\n'.join(current_chunk).strip()
+        # 분할 지점(import/from/주석/완전한 print 문/빈 줄)을 한 번의 정규식 스캔으로 탐색
+        chunks = []
+        start = 0
+        for match in _CHUNK_BREAK_RE.finditer(code):
+            end = code.find('\n', match.end())
+            if end == -1:
+                end = len(code)
+            chunk_text = code[start:end].strip()
             if chunk_text:
                 chunks.append(chunk_text)
+            start = end + 1
+
+        # 마지막 청크 추가
+        chunk_text = code[start:].strip()
+        if chunk_text:
+            chunks.append(chunk_text)
 
-        # 빈 청크 제거 및 최소 1개 청크 보장
-        chunks = [chunk for chunk in chunks if chunk.strip()]
+        # 최소 1개 청크 보장 (빈 청크는 위에서 이미 제외됨)
         if not chunks and code.strip():
             chunks = [code.strip()]
 
@@ -1368,29 +1674,8 @@ RESPONSE FORMAT (JSON only):
     async def _execute_analysis_code(self, code: str, df: pd.DataFrame) -> Dict[str, Any]:
         """분석 코드를 안전하게 실행"""
         try:
-            # 코드 실행 API 호출
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "http://localhost:8000/api/code/execute",
-                    json={
-                        "code": code,
-                        "context": {
-                            "data": df.to_dict(),  # 데이터프레임을 딕셔너리로 전달
-                            "df": df.to_dict()  # 호환성을 위한 별칭
-                        }
-                    },
-                    timeout=30.0
-                )
-
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return {
-                        "success": False,
-                        "output": "",
-                        "error": f"실행 실패: {response.status_code}",
-                        "execution_time": 0
-                    }
+            # 실행기를 프로세스 내에서 직접 호출 (직렬화 + HTTP 왕복 제거)
+            return await run_code(code, df)
 
         except Exception as e:
             return {
@@ -1410,16 +1695,22 @@ RESPONSE FORMAT (JSON only):
             enhanced_question = self._enhance_question_with_context(question, conversation_history)
             print(f"🔄 Enhanced question with context: {enhanced_question}")
 
+            # 관련 질문 생성은 질문만으로 먼저 시작하여 분석과 병렬로 진행 (모든 경우에 생성)
+            follow_up_task = asyncio.create_task(self._generate_follow_up_questions(question, {}))
+
             # 질문 분석 및 코드 생성
-            if df is not None and not df.empty:
-                # 파일이 있는 경우: 실제 데이터 기반 분석
-                analysis_result = await self._generate_data_analysis_code(enhanced_question, df, file_info)
-            else:
-                # 파일이 없는 경우: 일반적인 계산/분석 코드
-                analysis_result = await self._generate_general_analysis_code(enhanced_question)
+            try:
+                if df is not None and not df.empty:
+                    # 파일이 있는 경우: 실제 데이터 기반 분석
+                    analysis_result = await self._generate_data_analysis_code(enhanced_question, df, file_info)
+                else:
+                    # 파일이 없는 경우: 일반적인 계산/분석 코드
+                    analysis_result = await self._generate_general_analysis_code(enhanced_question)
+            except Exception:
+                follow_up_task.cancel()
+                raise
 
-            # 관련 질문 생성 (모든 경우에 생성)
-            follow_up_questions = await self._generate_follow_up_questions(question, analysis_result)
+            follow_up_questions = await follow_up_task
 
             # 코드 청크가 있으면 실행 상태로 설정
             code_chunks = analysis_result.get('code_chunks', [])
@@ -1474,15 +1765,15 @@ RESPONSE FORMAT (JSON only):
 
         # 컬럼 정보 수집
         column_info = {}
+        dtypes, null_counts, unique_counts = self._collect_column_stats(df[columns])
         for col in columns:
             try:
-                unique_values = df[col].dropna().unique()
-                sample_values = list(unique_values[:5]) if len(unique_values) > 0 else []
+                sample_values = self._sample_column_values(df[col]) if unique_counts[col] > 0 else []
                 column_info[col] = {
-                    'type': str(df[col].dtype),
+                    'type': dtypes[col],
                     'sample_values': sample_values,
-                    'unique_count': len(unique_values),
-                    'null_count': df[col].isnull().sum()
+                    'unique_count': unique_counts[col],
+                    'null_count': null_counts[col]
                 }
             except:
                 column_info[col] = {'type': 'unknown', 'sample_values': [], 'unique_count': 0, 'null_count': 0}
@@ -1491,183 +1782,6 @@ RESPONSE FORMAT (JSON only):
         generated_code = await self._generate_flexible_analysis_code(question, df, column_info)
         analysis_type = "ai_generated"
 
-        # 기존 하드코딩된 분석 타입들을 주석 처리하고 AI 생성으로 대체
-        # if column_mapping.get("analysis_type") == "gender_analysis" and column_mapping.get("target_column"):
-            sex_column = column_mapping["target_column"]
-            analysis_type = "gender_analysis"
-            generated_code = f"""import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import json
-
-# 성별 분포 분석
-print("=== 성별 분포 분석 ===")
-sex_counts = df['{sex_column}'].value_counts()
-print("성별별 개체 수:")
-for gender, cnt in sex_counts.items():
-    percentage = (cnt / len(df)) * 100
-    print(f"  {gender}: {cnt:,}마리 ({percentage:.1f}%)")
-
-print(f"총 분석 개체 수: {len(df):,}마리")
-
-# Plotly 바 차트 생성
-fig = px.bar(
-    x=sex_counts.index,
-    y=sex_counts.values,
-    labels={{'x': '성별', 'y': '개체 수'}},
-    title='{sex_column} 기준 개체 수 분포',
-    color=sex_counts.values,
-    color_continuous_scale='viridis'
-)
-
-fig.update_layout(
-    xaxis_title='성별',
-    yaxis_title='개체 수',
-    showlegend=False,
-    height=500
-)
-
-# 차트 데이터를 JSON으로 변환
-chart_json = fig.to_json()
-print("📊 차트가 생성되었습니다!")"""
-
-        # 나이/연령 분석
-        elif column_mapping.get("analysis_type") == "age_analysis" and column_mapping.get("target_column"):
-            age_column = column_mapping["target_column"]
-            analysis_type = "age_analysis"
-            generated_code = f"""import pandas as pd
-import plotly.express as px
-import numpy as np
-
-# 연령 분포 분석
-print("=== 연령 분포 분석 ===")
-ages = df['{age_column}'].dropna()
-print(f"평균 연령: {ages.mean():.1f}세")
-print(f"연령 범위: {ages.min():.0f}세 - {ages.max():.0f}세")
-print(f"표준편차: {ages.std():.1f}세")
-
-# 히스토그램 생성
-fig = px.histogram(
-    df,
-    x='{age_column}',
-    nbins=20,
-    title='연령 분포',
-    labels={{'{age_column}': '연령', 'count': '개체 수'}}
-)
-
-fig.update_layout(
-    xaxis_title='연령',
-    yaxis_title='개체 수',
-    height=500
-)
-
-chart_json = fig.to_json()
-print("\\n📊 연령 히스토그램이 생성되었습니다!")"""
-
-        # 지역/지역별 분석
-        elif column_mapping.get("analysis_type") == "location_analysis" and column_mapping.get("target_column"):
-            location_column = column_mapping["target_column"]
-            analysis_type = "location_analysis"
-            generated_code = f"""import pandas as pd
-import plotly.express as px
-
-# 지역별 분포 분석
-print("=== 지역별 분포 분석 ===")
-location_counts = df['{location_column}'].value_counts()
-print("지역별 개체 수:")
-for location, count in location_counts.head(10).items():
-    percentage = (count / len(df)) * 100
-    print(f"  {location}: {count:,}마리 ({percentage:.1f}%)")
-
-if len(location_counts) > 10:
-    print(f"... 및 {len(location_counts) - 10}개 지역 더")
-
-# 바 차트 생성 (상위 15개 지역)
-top_locations = location_counts.head(15)
-fig = px.bar(
-    x=top_locations.values,
-    y=top_locations.index,
-    orientation='h',
-    title='지역별 개체 수 분포 (상위 15개)',
-    labels={{'x': '개체 수', 'y': '지역'}}
-)
-
-fig.update_layout(height=600, yaxis_title='지역', xaxis_title='개체 수')
-chart_json = fig.to_json()
-print("\\n📊 지역별 분포 차트가 생성되었습니다!")"""
-
-        # 크기/길이/무게 분석
-        elif column_mapping.get("analysis_type") == "size_analysis" and column_mapping.get("target_column"):
-            size_column = column_mapping["target_column"]
-            analysis_type = "size_analysis"
-            generated_code = f"""import pandas as pd
-import plotly.express as px
-import numpy as np
-
-# 크기 분포 분석
-print("=== {size_column} 분포 분석 ===")
-sizes = df['{size_column}'].dropna()
-print(f"평균: {sizes.mean():.2f}")
-print(f"중앙값: {sizes.median():.2f}")
-print(f"범위: {sizes.min():.2f} - {sizes.max():.2f}")
-print(f"표준편차: {sizes.std():.2f}")
-
-# 히스토그램 생성
-fig = px.histogram(
-    df,
-    x='{size_column}',
-    nbins=30,
-    title=f'{size_column} 분포',
-    labels={{'{size_column}': '{size_column}', 'count': '개체 수'}}
-)
-
-fig.update_layout(height=500)
-chart_json = fig.to_json()
-print("\\n📊 크기 분포 히스토그램이 생성되었습니다!")"""
-
-        # 일반적인 데이터 요약 (기본값)
-        else:
-            analysis_type = "general_summary"
-            generated_code = f"""import pandas as pd
-import plotly.express as px
-
-# 데이터 전체 요약
-print("=== 데이터 요약 ===")
-print(f"총 행 수: {{len(df):,}}")
-print(f"총 컬럼 수: {{len(df.columns)}}")
-
-print("\\n컬럼 목록:")
-for i, col in enumerate(df.columns, 1):
-    print(f"  {{i}}. {{col}}")
-
-# 숫자형 컬럼 통계
-numeric_cols = df.select_dtypes(include=['number']).columns
-if len(numeric_cols) > 0:
-    print("\\n숫자형 컬럼 통계:")
-    for col in numeric_cols[:5]:  # 최대 5개
-        values = df[col].dropna()
-        if len(values) > 0:
-            print(f"  {{col}}: 평균 {{values.mean():.2f}}, 범위 {{values.min():.2f}}-{{values.max():.2f}}")
-
-# 첫 번째 범주형 컬럼으로 간단한 차트 생성
-categorical_cols = df.select_dtypes(include=['object']).columns
-if len(categorical_cols) > 0:
-    chart_col = categorical_cols[0]
-    value_counts = df[chart_col].value_counts().head(10)
-
-    fig = px.bar(
-        x=value_counts.index,
-        y=value_counts.values,
-        title=f'{{chart_col}} 분포 (상위 10개)',
-        labels={{'x': chart_col, 'y': '개수'}}
-    )
-
-    fig.update_layout(height=500)
-    chart_json = fig.to_json()
-    print(f"\\n📊 {{chart_col}} 분포 차트가 생성되었습니다!")
-else:
-    print("\\n차트 생성을 위한 적절한 컬럼을 찾을 수 없습니다.")"""
-
         # 코드가 생성되지 않은 경우 기본 코드
         if not generated_code:
             generated_code = """print("죄송합니다. 해당 질문에 대한 분석 코드를 생성할 수 없습니다.")
@@ -1679,7 +1793,7 @@ for i, col in enumerate(df.columns, 1):
         code_chunks = self._split_code_into_chunks(generated_code)
 
         # 실제 데이터로 코드 실행
-        execution_result = await self._execute_analysis_code_with_data(generated_code, df)
+        execution_result = await self._execute_analysis_code_with_data(generated_code, df, columns)
 
         # 실행 결과 기반 인사이트 생성
         insights = self._generate_insights_from_results(execution_result, analysis_type, df, question)
@@ -1750,21 +1864,61 @@ for i, col in enumerate(df.columns, 1):
 
         return insights
 
+    def _collect_column_stats(self, df: pd.DataFrame):
+        """컬럼별 타입, 결측값 수, 고유값 수를 컬럼 단위 일괄 연산으로 계산"""
+        dtypes = df.dtypes.astype(str).to_dict()
+        null_counts = df.isnull().sum().to_dict()
+        try:
+            unique_counts = df.nunique(dropna=True).to_dict()
+        except TypeError:
+            # 해시 불가능한 값(list 등)이 있는 경우 컬럼별로 계산
+            unique_counts = {}
+            for col in df.columns:
+                try:
+                    unique_counts[col] = df[col].nunique(dropna=True)
+                except TypeError:
+                    unique_counts[col] = 0
+        return dtypes, null_counts, unique_counts
+
+    def _dumps_column_info(self, column_info: dict) -> str:
+        """프롬프트용 컬럼 정보 JSON 문자열 생성 (orjson, NumPy 스칼라 지원)"""
+        return orjson.dumps(
+            column_info,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            default=str
+        ).decode()
+
+    def _sample_column_values(self, series: pd.Series, n: int = 5) -> list:
+        """컬럼의 샘플 고유값 추출 - 전체 컬럼 대신 앞부분만 검사"""
+        values = series.head(50).dropna().unique()[:n]
+        if len(values) == 0:
+            # 앞부분이 모두 결측값인 경우에만 전체 컬럼 검사
+            values = series.dropna().unique()[:n]
+        return list(values)
+
     async def _smart_column_mapping(self, question: str, columns: List[str], df: pd.DataFrame) -> Dict[str, str]:
         """AI를 활용한 스마트 컬럼 매핑 - 질문의 의도를 파악하여 적절한 컬럼을 찾음"""
 
+        # 같은 데이터셋에 대한 동일 질문은 이전 매핑 결과 재사용 (GPT-4o 호출 생략)
+        cache_key = hashlib.sha256(
+            (question.lower().strip() + '|' + '|'.join(map(str, df.columns)) + f'|{len(df)}').encode()
+        ).hexdigest()
+        cached_mapping = _mapping_cache.get(cache_key)
+        if cached_mapping is not None:
+            return cached_mapping
+
         # 샘플 데이터 준비 (각 컬럼의 고유값 몇 개씩)
         column_info = {}
+        dtypes, _, unique_counts = self._collect_column_stats(df[columns])
         for col in columns:
             try:
-                unique_values = df[col].dropna().unique()
-                if len(unique_values) > 0:
+                if unique_counts[col] > 0:
                     # 너무 많으면 처음 5개만
-                    sample_values = list(unique_values[:5])
+                    sample_values = self._sample_column_values(df[col])
                     column_info[col] = {
-                        'type': str(df[col].dtype),
+                        'type': dtypes[col],
                         'sample_values': sample_values,
-                        'unique_count': len(unique_values)
+                        'unique_count': unique_counts[col]
                     }
             except:
                 column_info[col] = {'type': 'unknown', 'sample_values': [], 'unique_count': 0}
@@ -1774,7 +1928,7 @@ for i, col in enumerate(df.columns, 1):
 사용자가 데이터에 대해 다음과 같이 질문했습니다: "{question}"
 
 데이터의 컬럼 정보:
-{json.dumps(column_info, ensure_ascii=False, indent=2)}
+{self._dumps_column_info(column_info)}
 
 사용자의 질문 의도를 파악하여 다음 분석 유형 중 하나와 해당하는 컬럼을 매핑해주세요:
 
@@ -1818,6 +1972,7 @@ for i, col in enumerate(df.columns, 1):
             json_match = re.search(r'\{.*\}', mapping_result, re.DOTALL)
             if json_match:
                 mapping_data = json.loads(json_match.group())
+                _mapping_cache[cache_key] = mapping_data
                 return mapping_data
             else:
                 return {"analysis_type": "general_summary", "target_column": None, "confidence": 0.0, "reasoning": "JSON 파싱 실패"}
@@ -1828,26 +1983,19 @@ for i, col in enumerate(df.columns, 1):
 
     def _enhance_question_with_context(self, question: str, conversation_history: list = None) -> str:
         """대화 히스토리를 활용하여 질문을 맥락적으로 강화"""
-        if not conversation_history or len(conversation_history) == 0:
+        if not conversation_history:
             return question
 
-        # 최근 3개 대화만 사용 (토큰 한도 고려)
-        recent_history = conversation_history[-6:] if len(conversation_history) > 6 else conversation_history
-
-        # 참조 단어들 체크 ("이것", "그것", "이 데이터", "위의 결과" 등)
-        reference_words = [
-            "이것", "그것", "이거", "그거", "이", "그",
-            "이 데이터", "이 파일", "이 결과", "위의", "앞서",
-            "방금", "직전", "이전", "다시", "또", "추가로",
-            "it", "this", "that", "these", "those", "above", "previous"
-        ]
-
-        has_reference = any(word in question.lower() for word in reference_words)
+        # 참조 단어들 체크 (미리 컴파일된 정규식 한 번으로 검사)
+        has_reference = _REF_RE.search(question.lower()) is not None
 
         if not has_reference:
             # 참조 단어가 없으면 원래 질문 그대로 반환
             return question
 
+        # 최근 3개 대화만 사용 (토큰 한도 고려)
+        recent_history = conversation_history[-6:]
+
         # 참조 단어가 있으면 대화 맥락을 포함한 강화된 질문 생성
         context_summary = ""
 
@@ -1857,7 +2005,7 @@ for i, col in enumerate(df.columns, 1):
             if msg.get('role') == 'assistant':
                 content = msg.get('content', '')
                 # 데이터 분석 관련 키워드 찾기
-                if any(keyword in content.lower() for keyword in ['데이터', '파일', '분석', '그래프', '차트', '평균', '개체', '컬럼']):
+                if _DATA_CONTEXT_RE.search(content):
                     # 핵심 정보만 추출 (첫 50자)
                     summary = content[:100] + "..." if len(content) > 100 else content
                     data_context.append(summary)
@@ -1878,7 +2026,7 @@ for i, col in enumerate(df.columns, 1):
 데이터셋 정보:
 - 총 행 수: {len(df):,}
 - 총 컬럼 수: {len(df.columns)}
-- 컬럼 정보: {json.dumps(column_info, ensure_ascii=False, indent=2)}
+- 컬럼 정보: {self._dumps_column_info(column_info)}
 
 샘플 데이터 (처음 3행):
 {df.head(3).to_dict('records')}
@@ -1925,10 +2073,9 @@ for i, col in enumerate(df.columns, 1):
             generated_code = response.choices[0].message.content.strip()
 
             # 마크다운 코드 블록 제거
-            if '```python' in generated_code:
-                generated_code = generated_code.split('```python')[1].split('```')[0]
-            elif '```' in generated_code:
-                generated_code = generated_code.split('```')[1].split('```')[0]
+            fence_match = _FENCE_RE.search(generated_code)
+            if fence_match:
+                generated_code = fence_match.group(1)
 
             generated_code = generated_code.strip()
 
@@ -1953,48 +2100,24 @@ print("\\n📊 분석이 완료되었습니다!")"""
     async def _generate_general_analysis_code(self, question: str) -> Dict[str, Any]:
         """파일이 없는 경우 일반적인 분석 코드 생성"""
 
-        # 질문에서 숫자와 연산자 추출
-        import re
-
-        # 수식 패턴 감지
-        math_expression_pattern = r'[\d+\-*\/\(\)\.\s]+'
-        has_math_expression = bool(re.search(r'[\d\s]*[\+\-\*\/][\d\s]*', question))
+        # 질문에서 숫자와 연산자 추출 (모듈 수준에서 미리 컴파일된 패턴 사용)
+        has_math_expression = bool(_MATH_EXPR_RE.search(question))
 
         if has_math_expression:
             # 수식이 있는 경우, 전체 수식을 추출
-            expression_match = re.search(r'[0-9+\-*\/\(\)\.\s]+', question)
+            expression_match = _MATH_EXTRACT_RE.search(question)
             math_expression = expression_match.group(0).strip() if expression_match else None
         else:
             # 단순 숫자 목록인 경우
             math_expression = None
 
-        numbers = re.findall(r'\d+(?:\.\d+)?', question)
+        numbers = _NUM_RE.findall(question)
 
+        # AI에 의존하지 않고 직접 코드 생성 (더 안정적)
         if math_expression:
             # 수식에서 잘못된 연산자 패턴 수정
             clean_expression = math_expression.replace('+*', '*').replace('-*', '*').replace('**', '*')
-            # 더 확실한 코드 생성을 위해 직접 구성
-            direct_code = f'result = eval("{clean_expression}")\nprint(f"결과: {{result}}")'
-
-            code_prompt = f"""You must return exactly this Python code with NO changes, NO additions, NO markdown:
-
-{direct_code}
-
-Return ONLY the above code. Nothing else."""
-        else:
-            # 숫자 리스트를 정수로 변환
-            int_numbers = [int(num) for num in numbers if num.isdigit()]
-            direct_code = f'data = {int_numbers}\nresult = sum(data)\nprint(f"총합: {{result:,}}")'
-
-            code_prompt = f"""You must return exactly this Python code with NO changes, NO additions, NO markdown:
-
-{direct_code}
-
-Return ONLY the above code. Nothing else."""
-
-        # AI에 의존하지 않고 직접 코드 생성 (더 안정적)
-        if math_expression:
-            generated_code = f'result = eval("{clean_expression}")\nprint(f"결과: {{result}}")'
+            generated_code = f'result = {clean_expression}\nprint(f"결과: {{result}}")'
         else:
             # 숫자 리스트를 정수로 변환
             int_numbers = [int(num) for num in numbers if num.isdigit()]
@@ -2002,79 +2125,38 @@ Return ONLY the above code. Nothing else."""
 
         print(f"직접 생성된 코드:\n{generated_code}")
 
-        # 마크다운 코드 블록과 설명 텍스트 제거
-        def clean_code(code_text: str) -> str:
-            """AI가 생성한 텍스트에서 순수 Python 코드만 추출"""
-            # 마크다운 코드 블록 제거 (더 강력한 제거)
-            if '```python' in code_text:
-                code_text = code_text.split('```python')[1].split('```')[0]
-            elif '```' in code_text:
-                parts = code_text.split('```')
-                if len(parts) >= 3:
-                    code_text = parts[1]
-
-            # 불필요한 설명 텍스트 완전 제거
-            if 'CRITICAL:' in code_text:
-                parts = code_text.split('CRITICAL:')[0].strip()
-                if parts:
-                    code_text = parts
-
-            if 'Required format:' in code_text:
-                parts = code_text.split('Required format:')[1].strip()
-                if parts:
-                    code_text = parts
-
-            lines = code_text.split('\n')
-            code_lines = []
-
-            # 중복된 print 문 방지를 위한 세트
-            seen_prints = set()
-
-            for line in lines:
-                stripped = line.strip()
-
-                # 빈 줄 건너뛰기
-                if not stripped:
-                    continue
-
-                # 설명성 텍스트 완전 제거
-                if (not any(c in stripped for c in ['=', '(', '[']) and
-                    any(ord(char) >= 0xAC00 and ord(char) <= 0xD7A3 for char in stripped)):
-                    continue
-
-                # Python 코드가 아닌 것들 제거
-                if (stripped.startswith('Task:') or
-                    stripped.startswith('Numbers:') or
-                    stripped.startswith('Calculate') or
-                    stripped.startswith('CRITICAL:') or
-                    stripped.startswith('Required format:')):
-                    continue
-
-                # 중복된 print 문 제거
-                if stripped.startswith('print('):
-                    if stripped in seen_prints:
-                        continue
-                    seen_prints.add(stripped)
-
-                # 유효한 Python 코드만 추가
-                if (('=' in stripped) or
-                    stripped.startswith('print(') or
-                    stripped.startswith('result') or
-                    stripped.startswith('data') or
-                    ('    ' in line and line.strip())):  # 들여쓰기된 라인
-                    code_lines.append(line.rstrip())
+        if math_expression:
+            # 순수 산술식은 코드 실행 없이 프로세스 내에서 바로 계산
+            code_chunks = self._split_code_into_chunks(generated_code)
+            try:
+                result = _evaluate_arithmetic(clean_expression)
+            except (SyntaxError, ValueError, ArithmeticError) as e:
+                return {
+                    'output': '',
+                    'code_chunks': code_chunks,
+                    'result': '',
+                    'insights': [],
+                    'success': False,
+                    'error': f"계산 오류: {str(e)}"
+                }
 
-            return '\n'.join(code_lines)
+            return {
+                'output': f"결과: {result}\n",
+                'code_chunks': code_chunks,
+                'result': str(result),
+                'insights': [
+                    "✅ 계산이 완료되었습니다."
+                ],
+                'success': True
+            }
 
-        # 원본 코드 보관 (디버깅용)
-        original_code = generated_code
-        generated_code = clean_code(generated_code)
+        generated_code = _clean_generated_code(generated_code)
 
         # 정제된 코드를 청크로 분할
         code_chunks = self._split_code_into_chunks(generated_code)
 
         # 코드 실행
-        execution_result = await self._execute_analysis_code(generated_code, pd.DataFrame())
+        execution_result = await self._execute_analysis_code(generated_code, _EMPTY_DF)
 
         # 결과 포맷팅
         return {
@@ -2087,34 +2169,11 @@ Return ONLY the above code. Nothing else."""
             'success': execution_result.get('success', False)
         }
 
-    async def _execute_analysis_code_with_data(self, code: str, df: pd.DataFrame) -> Dict[str, Any]:
-        """실제 데이터와 함께 분석 코드 실행"""
+    async def _execute_analysis_code_with_data(self, code: str, df: pd.DataFrame, columns: List[str] = None) -> Dict[str, Any]:
+        """실제 데이터와 함께 분석 코드 실행 (columns: 호출 측에서 이미 만든 컬럼 목록이 있으면 재사용)"""
         try:
-            # 코드 실행 API 호출
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "http://localhost:8000/api/code/execute",
-                    json={
-                        "code": code,
-                        "context": {
-                            "df": df.to_dict('list'),  # list 형태로 직렬화
-                            "data": df.to_dict('list'),
-                            "rows": len(df),
-                            "columns": df.columns.tolist()
-                        }
-                    },
-                    timeout=30.0
-                )
-
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return {
-                        "success": False,
-                        "output": "",
-                        "error": f"실행 실패: {response.status_code}",
-                        "execution_time": 0
-                    }
+            # 실행기를 프로세스 내에서 직접 호출 (직렬화 + HTTP 왕복 제거)
+            return await run_code(code, df, {"rows": len(df), "columns": columns if columns is not None else df.columns.tolist()})
 
         except Exception as e:
             return {
@@ -2124,15 +2183,53 @@ Return ONLY the above code. Nothing else."""
                 "execution_time": 0
             }
 
+    def _stream_follow_up_text(self, follow_up_prompt: str) -> str:
+        """후속 질문 응답을 스트리밍으로 받고, 질문 3줄이 완성되면 나머지 생성은 중단"""
+        stream = self.client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": "데이터 분석 관련 후속 질문을 생성하는 전문가입니다."},
+                {"role": "user", "content": follow_up_prompt}
+            ],
+            temperature=0.7,
+            max_tokens=200,
+            stream=True
+        )
+
+        questions_text = ""
+        try:
+            for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                questions_text += chunk.choices[0].delta.content
+                # 줄바꿈으로 끝난(완성된) 비어있지 않은 줄이 3개면 종료
+                if '\n' in chunk.choices[0].delta.content:
+                    completed_lines = questions_text.split('\n')[:-1]
+                    if sum(1 for line in completed_lines if line.strip()) >= 3:
+                        break
+        finally:
+            stream.close()
+
+        return questions_text.strip()
+
     async def _generate_follow_up_questions(self, original_question: str, analysis_result: Dict[str, Any]) -> List[str]:
         """분석 결과를 바탕으로 관련 질문 생성"""
         try:
-            follow_up_prompt = f"""
-사용자가 "{original_question}"라고 질문했고, 다음과 같은 분석 결과를 얻었습니다:
+            # 분석 결과가 아직 없으면 (분석과 병렬 실행 시) 질문만으로 생성
+            output = analysis_result.get('output', '')
+
+            # 같은 (질문, 결과 앞부분) 조합은 이전에 생성한 후속 질문 재사용 (gpt-4o-mini 호출 생략)
+            cache_key = hashlib.sha256(f"{original_question}|{output[:500]}".encode()).hexdigest()
+            cached_questions = _follow_up_cache.get(cache_key)
+            if cached_questions is not None:
+                return cached_questions
 
-결과: {analysis_result.get('output', '')[:500]}...
+            result_context = f"\n다음과 같은 분석 결과를 얻었습니다:\n결과: {output[:500]}...\n" if output else ""
 
-이 분석 결과를 바탕으로 사용자가 추가로 궁금해할 만한 관련 질문 3개를 생성해주세요.
+            follow_up_prompt = f"""
+사용자가 "{original_question}"라고 질문했습니다.
+{result_context}
+이 질문과 분석 맥락을 바탕으로 사용자가 추가로 궁금해할 만한 관련 질문 3개를 생성해주세요.
 
 요구사항:
 1. 현재 분석을 심화시킬 수 있는 질문
@@ -2147,20 +2244,11 @@ Return ONLY the above code. Nothing else."""
 다른 변수와의 상관관계는 어떻게 되나요?
 """
 
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "데이터 분석 관련 후속 질문을 생성하는 전문가입니다."},
-                    {"role": "user", "content": follow_up_prompt}
-                ],
-                temperature=0.7,
-                max_tokens=200
-            )
-
-            questions_text = response.choices[0].message.content.strip()
-            questions = [q.strip() for q in questions_text.split('\n') if q.strip()]
-
-            return questions[:3]  # 최대 3개만 반환
+            # 동기 클라이언트 호출은 스레드에서 실행하여 다른 작업과 겹칠 수 있도록 함
+            questions_text = await asyncio.to_thread(self._stream_follow_up_text, follow_up_prompt)
+            questions = [q for line in questions_text.splitlines() if (q := line.strip())][:3]  # 최대 3개만 반환
+            _follow_up_cache[cache_key] = questions
+            return questions
 
         except Exception as e:
             print(f"Follow-up questions generation error: {str(e)}")
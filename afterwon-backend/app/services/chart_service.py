@@ -1,74 +1,503 @@
+import logging
 import pandas as pd
 import numpy as np
+import re
+import orjson
 import plotly.graph_objects as go
+import plotly.io as pio
 import plotly.express as px
 import plotly.figure_factory as ff
-from typing import Dict, Any, List, Union, Tuple
+from typing import Dict, Any, List, Optional, Union, Tuple
 import warnings
+from collections import Counter
+from types import MappingProxyType
+from functools import lru_cache
+from cachetools import LRUCache
+from pandas.tseries.api import guess_datetime_format
+from ..core.config import settings
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger(__name__)
+
+# Use orjson for any fig.to_json() / pio.to_json() calls as well
+pio.json.config.default_engine = "orjson"
+
+# Column-name keyword patterns used to detect hierarchical / financial data
+_HIERARCHICAL_COL_RE = re.compile(r"parent|category|group")
+_FINANCIAL_COL_RE = re.compile(r"open|high|low|close|volume|price")
+
+# Intent keyword mapping used by ChartRecommendationEngine._analyze_user_intent
+_INTENT_KEYWORDS = {
+    "distribution": ["분포", "distribution", "histogram", "spread", "범위"],
+    "comparison": ["비교", "compare", "차이", "difference", "vs", "versus"],
+    "correlation": ["상관관계", "correlation", "관계", "relationship", "연관"],
+    "trend": ["트렌드", "trend", "변화", "change", "시간", "time", "추이"],
+    "proportion": ["비율", "proportion", "percentage", "구성", "composition"],
+    "ranking": ["순위", "rank", "top", "bottom", "highest", "lowest"],
+    "outlier": ["이상치", "outlier", "이상", "특이", "extreme"]
+}
+_INTENT_BY_KEYWORD = {keyword: intent_type for intent_type, keywords in _INTENT_KEYWORDS.items() for keyword in keywords}
+# Lookahead so overlapping keywords (e.g. "상관관계" / "관계") are all seen; longest alternative first
+_INTENT_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(_INTENT_BY_KEYWORD, key=len, reverse=True)) + "))"
+)
+
+def _classify_columns(df: pd.DataFrame) -> Tuple[List[str], List[str], List[str]]:
+    """Split columns into (numeric, categorical, datetime) in one pass over df.dtypes.
+
+    Matches select_dtypes(np.number) / (object, str, category) / naive datetime64 without three separate scans.
+    """
+    numeric_cols, categorical_cols, datetime_cols = [], [], []
+    for col, dtype in df.dtypes.items():
+        kind = dtype.kind
+        if kind in "iufcm":
+            numeric_cols.append(col)
+        elif kind == "O":
+            categorical_cols.append(col)
+        elif kind == "M" and isinstance(dtype, np.dtype):
+            datetime_cols.append(col)
+    return numeric_cols, categorical_cols, datetime_cols
+
+def _cardinality_tags(df: pd.DataFrame, categorical_cols: List[str]) -> Tuple[str, ...]:
+    """High/low cardinality tags from one batched nunique over all categorical columns.
+
+    Each tag appears once, in first-seen column order, so many categorical columns don't stack duplicate scores.
+    """
+    if not categorical_cols:
+        return ()
+    unique_ratios = (df[categorical_cols].nunique() / len(df)).to_numpy()
+    tags = np.where(unique_ratios > 0.8, "high_cardinality",
+                    np.where(unique_ratios < 0.1, "low_cardinality", ""))
+    return tuple(tag for tag in dict.fromkeys(tags.tolist()) if tag)
+
+def _value_counts_frame(series: pd.Series, x_col: str) -> pd.DataFrame:
+    """[x_col, "Count"] frame in value_counts() order (count desc, ties by first appearance).
+
+    Plain object columns are factorized once and counted with np.bincount over the integer codes,
+    which avoids re-hashing every string; other dtypes already have a fast native value_counts.
+    """
+    if series.dtype != object:
+        counts = series.value_counts().reset_index()
+        counts.columns = [x_col, "Count"]
+        return counts
+    codes, uniques = pd.factorize(series, sort=False)
+    codes = codes[codes >= 0]  # NaN -> -1, dropped like value_counts(dropna=True)
+    counts = np.bincount(codes, minlength=len(uniques))
+    order = np.argsort(-counts, kind="stable")
+    return pd.DataFrame({x_col: uniques[order], "Count": counts[order].astype(np.int64)})
+
+def _top_value_counts(series: pd.Series, k: int) -> Tuple[List[Any], List[int]]:
+    """(labels, counts) of value_counts().head(k), without sorting or materializing every category.
+
+    Short series go through a plain Counter; object columns are counted via factorize + np.bincount and
+    the top k picked with an O(u) partition. Ties keep first-appearance order as value_counts does.
+    """
+    if len(series) < 1000 and not isinstance(series.dtype, pd.CategoricalDtype):
+        top = Counter(series.dropna().tolist()).most_common(k)
+        return [label for label, _ in top], [count for _, count in top]
+    if series.dtype != object:
+        counts = series.value_counts().head(k)
+        return counts.index.tolist(), counts.tolist()
+    codes, uniques = pd.factorize(series, sort=False)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    if counts.size > k:
+        kth = np.partition(counts, counts.size - k)[counts.size - k]
+        above = np.flatnonzero(counts > kth)
+        ties = np.flatnonzero(counts == kth)[:k - above.size]
+        top = np.concatenate([above, ties])
+    else:
+        top = np.arange(counts.size)
+    top = top[np.lexsort((top, -counts[top]))]
+    return uniques[top].tolist(), counts[top].tolist()
+
+@lru_cache(maxsize=256)
+def _guess_datetime_format(sample: str) -> Optional[str]:
+    """strftime format for a sample date string (cached, since the same layouts repeat across charts)"""
+    return guess_datetime_format(sample)
+
+def _fast_to_datetime(series: pd.Series) -> pd.Series:
+    """pd.to_datetime(errors='coerce') with the format inferred once from the first non-null string.
+
+    An explicit format keeps pandas on its vectorized strptime path instead of per-element dateutil parsing.
+    """
+    fmt = None
+    if series.dtype == object or pd.api.types.is_string_dtype(series.dtype):
+        valid = series.notna().to_numpy()
+        if valid.any():
+            fmt = _guess_datetime_format(str(series.iat[int(valid.argmax())]))
+    return pd.to_datetime(series, format=fmt, errors='coerce', cache=True)
+
+def _numeric_values(series: pd.Series) -> np.ndarray:
+    """float64 values of series with unparsable entries as NaN (pd.to_numeric(errors='coerce')).
+
+    Integer/float columns are converted directly; only text columns go through pd.to_numeric parsing.
+    """
+    if series.dtype.kind in "iuf":
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+def _downsample_for_plot(frame: pd.DataFrame, max_rows: int = 10_000) -> pd.DataFrame:
+    """At most max_rows rows of frame (fixed-seed random sample); beyond that the extra lines/points add no visible detail"""
+    if len(frame) > max_rows:
+        return frame.sample(n=max_rows, random_state=0)
+    return frame
+
+def _sample_numeric_rows(frame: pd.DataFrame, numeric_cols: List[str], n: int, oversample: int = 5) -> pd.DataFrame:
+    """Up to n random rows of frame with numeric_cols coerced by pd.to_numeric and NaN rows dropped.
+
+    Large frames are sampled before coercion so only the candidate rows are parsed; if NaNs leave fewer
+    than n of them, the whole frame is coerced as before.
+    """
+    def coerce(rows: pd.DataFrame) -> pd.DataFrame:
+        return rows.assign(**{col: pd.to_numeric(rows[col], errors='coerce') for col in numeric_cols}).dropna()
+
+    if len(frame) > n * oversample:
+        candidates = coerce(frame.sample(n * oversample))
+        if len(candidates) >= n:
+            return candidates.head(n)
+    frame = coerce(frame)
+    return frame.sample(n) if len(frame) > n else frame
+
+def _nlargest_rows(df: pd.DataFrame, col: str, k: int) -> pd.DataFrame:
+    """Same rows and order as df.nlargest(k, col), selected with an O(n) partition instead of a full sort"""
+    if pd.api.types.is_integer_dtype(df[col]):
+        # A float64 view would round int64 values above 2**53 and mis-rank/tie them
+        return df.nlargest(k, col)
+    values = df[col].to_numpy(dtype=float, na_value=np.nan)
+    is_nan = np.isnan(values)
+    valid = np.flatnonzero(~is_nan)
+    n_valid = min(k, valid.size)
+    idx = valid[:0]
+    if n_valid:
+        valid_values = values[valid]
+        kth = np.partition(valid_values, valid_values.size - n_valid)[valid_values.size - n_valid]
+        # Everything above the k-th value, then the earliest ties (nlargest keep='first')
+        above = valid[valid_values > kth]
+        ties = valid[valid_values == kth][:n_valid - above.size]
+        idx = np.concatenate([above, ties])
+        idx = idx[np.lexsort((idx, -values[idx]))]
+    if n_valid < k:
+        # Like nlargest, fill the remainder with NaN rows in their original order
+        idx = np.concatenate([idx, np.flatnonzero(is_nan)[:k - n_valid]])
+    return df.iloc[idx]
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback for values it cannot encode natively (pandas Timestamps etc.)"""
+    if isinstance(obj, np.ndarray):
+        # Object / non-contiguous arrays are not handled by OPT_SERIALIZE_NUMPY
+        return obj.tolist()
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+def _datetime_arrays_to_lists(obj: Any) -> Any:
+    """Copy of a payload with datetime64 arrays turned into datetime/None lists (orjson cannot encode NaT)"""
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind == 'M':
+            return obj.astype('datetime64[us]').astype(object).tolist()
+        return obj
+    if isinstance(obj, dict):
+        return {key: _datetime_arrays_to_lists(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_datetime_arrays_to_lists(item) for item in obj]
+    return obj
+
+def to_json_bytes(payload: Any) -> bytes:
+    """Serialize a chart dict (or a response embedding one) with orjson, numpy arrays included"""
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    try:
+        return orjson.dumps(payload, default=_json_default, option=option)
+    except orjson.JSONEncodeError:
+        # A datetime64 array with NaT is rejected outright; retry with those arrays as ISO strings / null
+        return orjson.dumps(_datetime_arrays_to_lists(payload), default=_json_default, option=option)
+
+@lru_cache(maxsize=1)
+def _default_template() -> Dict[str, Any]:
+    """JSON form of the default Plotly template, as go.Figure().to_dict() would embed it"""
+    return pio.templates[pio.templates.default].to_plotly_json()
+
+def _detached(obj: Any) -> Any:
+    """Copy of a figure's dict/list structure; arrays and scalars are shared since every call builds its own.
+
+    Figures handed out of this module never alias the shared fragments or cached dicts below, so a caller
+    editing one response cannot change the next.
+    """
+    if isinstance(obj, dict):
+        return {key: _detached(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_detached(item) for item in obj]
+    return obj
+
+def _figure_dict(data: List[Dict[str, Any]], layout: Dict[str, Any]) -> Dict[str, Any]:
+    """Assemble a figure dict directly, skipping graph_objects validation unless VALIDATE_FIGURES is set.
+
+    Builders must pass only valid, non-None properties since nothing checks them on the fast path.
+    """
+    if settings.VALIDATE_FIGURES:
+        return go.Figure(data=data, layout=layout).to_dict()
+    return _detached({"data": data, "layout": {**layout, "template": _default_template()}})
+
+# Shared layout fragments for the dict-built charts (never mutated; _figure_dict detaches each figure from them)
+_INTER_FONT = {"family": "Inter, -apple-system, BlinkMacSystemFont, sans-serif", "size": 12, "color": '#374151'}
+_INTER_TITLE_BASE = {
+    "font": {"size": 20, "color": '#1f2937', "family": "Inter, -apple-system, BlinkMacSystemFont, sans-serif"},
+    "x": 0.5, "xanchor": 'center',
+    "y": 0.95, "yanchor": 'top',
+    "pad": {"b": 20}
+}
+_INTER_AXIS_TITLE_FONT = {"size": 14, "color": '#374151', "family": "Inter, sans-serif"}
+_INTER_AXIS_BASE = {
+    "gridcolor": 'rgba(229, 231, 235, 0.6)',
+    "linecolor": 'rgba(156, 163, 175, 0.4)',
+    "tickfont": {"size": 11, "color": '#6b7280', "family": "Inter, sans-serif"}
+}
+_HOVERLABEL_DARK = {
+    "bgcolor": "rgba(37, 37, 37, 0.95)",
+    "bordercolor": "rgba(255,255,255,0.2)",
+    "font": {"color": "white", "size": 14, "family": "Inter, -apple-system, sans-serif"}
+}
+_ARIAL_FONT = {"family": "Arial, sans-serif", "size": 12, "color": '#2C3E50'}
+_ARIAL_TITLE_BASE = {"font": {"size": 18, "color": '#2C3E50', "family": "Arial, sans-serif"}, "x": 0.5, "xanchor": 'center'}
+_ARIAL_AXIS_TITLE_FONT = {"size": 14, "color": '#34495E'}
+_ARIAL_MARGIN = {"l": 60, "r": 30, "t": 80, "b": 60}
+
+@lru_cache(maxsize=512)
+def _bar_chart_strings(x_col: str, y_col: str) -> MappingProxyType:
+    """Hover/title/axis strings for a bar chart, composed once per (x_col, y_col) pair"""
+    return MappingProxyType({
+        "hovertemplate": (
+            f"<b>📊 {x_col}</b>: %{{x}}<br>"
+            f"<b>📈 {y_col}</b>: %{{y:,.0f}}<br>"
+            "<extra></extra>"
+        ),
+        "title": f"<b style='color:#1f2937'>{y_col}</b> <span style='color:#6b7280'>분석 by</span> <b style='color:#1f2937'>{x_col}</b>",
+        "x_title": f"<b>{x_col}</b>",
+        "y_title": f"<b>{y_col}</b>",
+    })
+
+@lru_cache(maxsize=64)
+def _default_chart_for(error_msg: str) -> Dict[str, Any]:
+    """Error placeholder figure for a message, built once per distinct message"""
+    fig = go.Figure(data=[
+        go.Bar(
+            x=['Error'],
+            y=[1],
+            text=[f"Chart generation failed: {error_msg}"],
+            textposition='auto',
+            marker_color='rgb(200, 100, 100)'
+        )
+    ])
+    
+    fig.update_layout(
+        title="Chart Generation Error",
+        showlegend=False
+    )
+    
+    return fig.to_dict()
+
+# Plotly Express-equivalent trace/layout skeletons for charts built directly as dicts
+_PX_COLOR = '#636efa'  # first colour of the default "plotly" template colorway
+_PX_TRACE_BASE = {"legendgroup": "", "name": "", "showlegend": False, "xaxis": "x", "yaxis": "y"}
+_ARIAL_BASE_LAYOUT = {"font": _ARIAL_FONT, "paper_bgcolor": 'white'}
+
+def _arial_figure(data: Any, title: str, **layout: Any) -> go.Figure:
+    """go.Figure with the shared Arial base layout passed to the constructor (validated once, no update_layout pass)"""
+    return go.Figure(data=data, layout={**_ARIAL_BASE_LAYOUT, "title": title, **layout})
+
+def _px_axes_layout(x_title: str, y_title: str) -> Dict[str, Any]:
+    """Axis/legend/margin layout that plotly express emits for a single-panel figure"""
+    return {
+        "xaxis": {"anchor": "y", "domain": [0.0, 1.0], "title": {"text": x_title}},
+        "yaxis": {"anchor": "x", "domain": [0.0, 1.0], "title": {"text": y_title}},
+        "legend": {"tracegroupgap": 0},
+        "margin": {"t": 60},
+    }
+
+def _px_hovertemplate(x_label: str, y_label: str, with_count: bool = False) -> str:
+    """Plotly express style hover text (column=value lines)"""
+    count = "<br>count=%{z}" if with_count else ""
+    if x_label == y_label:
+        # Same column on both axes: px keeps a single (y) entry
+        return f"{y_label}=%{{y}}{count}<extra></extra>"
+    return f"{x_label}=%{{x}}<br>{y_label}=%{{y}}{count}<extra></extra>"
+
+def _px_orientation(df: pd.DataFrame, x_col: str, y_col: str) -> str:
+    """Plotly express auto-orientation: horizontal only when x is numeric and y is not"""
+    x_is_continuous = df[x_col].dtype.kind in "iufc"
+    y_is_continuous = df[y_col].dtype.kind in "iufc"
+    return "h" if x_is_continuous and not y_is_continuous else "v"
+
+def _freeze_rules(rules: Dict[str, Dict[str, List[str]]]) -> MappingProxyType:
+    """Read-only view of a two-level rule table (inner chart lists become tuples)"""
+    return MappingProxyType({
+        group: MappingProxyType({key: tuple(chart_types) for key, chart_types in group_rules.items()})
+        for group, group_rules in rules.items()
+    })
+
+# Location vocabularies for choropleth location-type detection
+_ISO2_COUNTRY_CODES = frozenset({'US', 'CN', 'JP', 'DE', 'GB', 'FR', 'IN', 'IT', 'BR', 'CA', 'RU', 'KR', 'ES', 'AU', 'MX', 'ID', 'NL', 'SA', 'TR', 'CH'})
+_ISO3_COUNTRY_CODES = frozenset({'USA', 'CHN', 'JPN', 'DEU', 'GBR', 'FRA', 'IND', 'ITA', 'BRA', 'CAN', 'RUS', 'KOR', 'ESP', 'AUS', 'MEX', 'IDN', 'NLD', 'SAU', 'TUR', 'CHE'})
+_KOREAN_LOCATIONS = frozenset({'서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종', '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주', '한국', '대한민국'})
+
+# Geo hover templates ({yname} is substituted with the value column name)
+_CHOROPLETH_HOVER = "<b>%{text}</b><br><b>{yname}</b>: %{z:,.0f}<br><extra></extra>"
+_SCATTERGEO_HOVER_NO_SIZE = "<b>위도</b>: %{lat}<br><b>경도</b>: %{lon}<br><extra></extra>"
+_SCATTERGEO_HOVER_WITH_SIZE = "<b>위도</b>: %{lat}<br><b>경도</b>: %{lon}<br><b>크기</b>: %{marker.size}<br><extra></extra>"
+
+# Geo map layout fragments (per-call dicts only add the title/scope/colorbar text)
+_GEO_BASE = {
+    "showframe": False,
+    "showcoastlines": True,
+    "coastlinecolor": "rgba(204,204,204,0.4)",
+    "showland": True,
+    "landcolor": 'rgba(243,244,246,0.3)',
+    "showocean": True,
+    "oceancolor": 'rgba(219,234,254,0.2)',
+    "showlakes": True,
+    "lakecolor": 'rgba(219,234,254,0.2)'
+}
+_CHOROPLETH_PROJECTION = {"type": 'equirectangular', "rotation": {"lon": 0, "lat": 0}}
+_SCATTERGEO_GEO = {**_GEO_BASE, "projection": {"type": 'natural earth'}}
+_GEO_TITLE_BASE = {"font": {"size": 20, "color": '#1f2937', "family": "Inter, -apple-system, sans-serif"}, "x": 0.5, "xanchor": 'center'}
+_GEO_LAYOUT_BASE = {
+    "paper_bgcolor": 'white',
+    "font": {"family": "Inter, -apple-system, sans-serif", "size": 12, "color": '#374151'},
+    "margin": {"l": 0, "r": 0, "t": 100, "b": 0},
+    "height": 600
+}
+_CHOROPLETH_COLORBAR_TITLE_FONT = {"size": 14}
+_CHOROPLETH_COLORBAR_TICKFONT = {"size": 12}
+_SCATTERGEO_MARKER_BASE = {"color": 'rgba(99, 102, 241, 0.8)', "line": {"width": 1, "color": 'white'}, "sizemode": 'diameter'}
+
+# Comprehensive chart recommendation rules (built once, shared read-only by every engine instance)
+_RECOMMENDATION_RULES = _freeze_rules({
+    "data_patterns": {
+        "single_numeric": ["histogram", "distplot", "box", "ecdf"],
+        "two_numeric": ["scatter", "line", "density_contour", "density_heatmap"],
+        "multiple_numeric": ["heatmap", "parallel_coordinates", "radar", "scatter_3d"],
+        "single_categorical": ["pie", "bar", "funnel", "treemap"],
+        "cat_vs_numeric": ["bar", "box", "violin", "strip"],
+        "time_series": ["line", "area", "candlestick", "waterfall"],
+        "hierarchical": ["treemap", "sunburst", "dendogram"],
+        "flow_data": ["sankey", "parallel_categories"],
+        "financial": ["candlestick", "ohlc", "waterfall"],
+        "geospatial": ["map", "choropleth"],
+        "network": ["sankey", "network_graph"]
+    },
+
+    "analysis_intent": {
+        "distribution": ["histogram", "distplot", "box", "violin", "ecdf"],
+        "comparison": ["bar", "line", "radar", "parallel_coordinates"],
+        "correlation": ["scatter", "heatmap", "density_contour"],
+        "trend": ["line", "area", "waterfall"],
+        "proportion": ["pie", "treemap", "sunburst", "funnel"],
+        "ranking": ["bar", "funnel"],
+        "flow": ["sankey", "parallel_categories", "waterfall"],
+        "outlier_detection": ["box", "violin", "scatter"],
+        "multivariate": ["radar", "parallel_coordinates", "heatmap"]
+    },
+
+    "data_characteristics": {
+        "small_dataset": ["scatter", "line", "bar", "box"],
+        "large_dataset": ["histogram", "heatmap", "density_heatmap", "sample_based"],
+        "high_cardinality": ["histogram", "density_plots"],
+        "low_cardinality": ["pie", "bar", "funnel"],
+        "many_dimensions": ["parallel_coordinates", "radar", "heatmap"],
+        "temporal": ["line", "area", "candlestick"],
+        "categorical": ["bar", "pie", "treemap", "sunburst"],
+        "continuous": ["histogram", "density_plots", "scatter"]
+    }
+})
+
+# Score weight per rule group (data pattern > user intent > data characteristic)
+_RULE_WEIGHTS = {"data_patterns": 3, "analysis_intent": 2, "data_characteristics": 1}
+
+# Rules flattened to {group: {key: {chart_type: weight}}} so scoring is a Counter update per matched key
+_WEIGHTED_RULES = MappingProxyType({
+    group: MappingProxyType({
+        key: {chart_type: weight for chart_type in chart_types}
+        for key, chart_types in _RECOMMENDATION_RULES[group].items()
+    })
+    for group, weight in _RULE_WEIGHTS.items()
+})
+
 class ChartRecommendationEngine:
     """Intelligent chart recommendation system based on data characteristics"""
     
+    # Per-chart display text, built once at class creation instead of on every recommendation
+    CHART_RATIONALES = {
+        "histogram": "단일 수치형 변수({numeric_count}개)의 분포를 보기에 최적",
+        "scatter": "두 수치형 변수 간의 상관관계를 시각화하기에 이상적",
+        "bar": "카테고리별 비교 분석에 가장 직관적이고 효과적",
+        "line": "시계열 데이터나 연속적인 변화 추이를 보기에 최적",
+        "pie": "전체에서 각 부분이 차지하는 비율을 한눈에 파악하기 좋음",
+        "box": "데이터의 분포, 중위값, 사분위수, 이상치를 한 번에 확인 가능",
+        "violin": "박스플롯보다 더 상세한 분포 형태를 보여주는 고급 통계 차트",
+        "heatmap": "다수의 변수 간 상관관계를 색상으로 직관적으로 표현",
+        "treemap": "계층적 데이터를 면적으로 표현하여 비율과 구조를 동시에 파악",
+        "radar": "다차원 데이터를 한 눈에 비교 분석하기에 적합"
+    }
+
+    KOREAN_CHART_NAMES = {
+        "histogram": "히스토그램", "scatter": "산포도", "bar": "막대차트", "line": "선차트",
+        "pie": "파이차트", "box": "박스플롯", "violin": "바이올린플롯", "area": "영역차트",
+        "heatmap": "히트맵", "treemap": "트리맵", "sunburst": "선버스트차트", 
+        "funnel": "깔때기차트", "waterfall": "폭포차트", "radar": "레이더차트",
+        "scatter_3d": "3D 산점도", "surface": "3D 표면차트", "candlestick": "캔들스틱",
+        "parallel_coordinates": "평행좌표", "distplot": "분포플롯", "ecdf": "누적분포함수",
+        "choropleth": "지도차트", "scattergeo": "지리적 산점도"
+    }
+
+    CHART_USE_CASES = {
+        "histogram": ["데이터 분포 확인", "이상치 탐지", "정규성 검정"],
+        "scatter": ["상관관계 분석", "회귀분석 시각화", "클러스터링 확인"],
+        "bar": ["카테고리별 비교", "순위 분석", "집계 결과 표시"],
+        "line": ["시계열 트렌드 분석", "성장률 추적", "예측 모델 결과"],
+        "pie": ["구성 비율 분석", "시장 점유율", "예산 배분"],
+        "box": ["통계 요약", "그룹간 분포 비교", "이상치 식별"],
+        "heatmap": ["상관행렬 시각화", "패턴 탐지", "히트 분석"],
+        "treemap": ["계층적 비율", "포트폴리오 분석", "조직도"],
+        "radar": ["다차원 성능 비교", "프로필 분석", "균형도 평가"],
+        "choropleth": ["지역별 데이터 분포", "국가별 통계", "행정구역별 분석"],
+        "scattergeo": ["위치 기반 분석", "지리적 클러스터링", "GPS 데이터 시각화"]
+    }
+
     def __init__(self):
-        self.recommendation_rules = self._build_recommendation_rules()
-    
-    def _build_recommendation_rules(self) -> Dict[str, Any]:
-        """Build comprehensive recommendation rules"""
-        return {
-            "data_patterns": {
-                "single_numeric": ["histogram", "distplot", "box", "ecdf"],
-                "two_numeric": ["scatter", "line", "density_contour", "density_heatmap"],
-                "multiple_numeric": ["heatmap", "parallel_coordinates", "radar", "scatter_3d"],
-                "single_categorical": ["pie", "bar", "funnel", "treemap"],
-                "cat_vs_numeric": ["bar", "box", "violin", "strip"],
-                "time_series": ["line", "area", "candlestick", "waterfall"],
-                "hierarchical": ["treemap", "sunburst", "dendogram"],
-                "flow_data": ["sankey", "parallel_categories"],
-                "financial": ["candlestick", "ohlc", "waterfall"],
-                "geospatial": ["map", "choropleth"],
-                "network": ["sankey", "network_graph"]
-            },
-            
-            "analysis_intent": {
-                "distribution": ["histogram", "distplot", "box", "violin", "ecdf"],
-                "comparison": ["bar", "line", "radar", "parallel_coordinates"],
-                "correlation": ["scatter", "heatmap", "density_contour"],
-                "trend": ["line", "area", "waterfall"],
-                "proportion": ["pie", "treemap", "sunburst", "funnel"],
-                "ranking": ["bar", "funnel"],
-                "flow": ["sankey", "parallel_categories", "waterfall"],
-                "outlier_detection": ["box", "violin", "scatter"],
-                "multivariate": ["radar", "parallel_coordinates", "heatmap"]
-            },
-            
-            "data_characteristics": {
-                "small_dataset": ["scatter", "line", "bar", "box"],
-                "large_dataset": ["histogram", "heatmap", "density_heatmap", "sample_based"],
-                "high_cardinality": ["histogram", "density_plots"],
-                "low_cardinality": ["pie", "bar", "funnel"],
-                "many_dimensions": ["parallel_coordinates", "radar", "heatmap"],
-                "temporal": ["line", "area", "candlestick"],
-                "categorical": ["bar", "pie", "treemap", "sunburst"],
-                "continuous": ["histogram", "density_plots", "scatter"]
-            }
-        }
+        # Static rule tables are shared read-only module constants
+        self.recommendation_rules = _RECOMMENDATION_RULES
+        self._weighted_rules = _WEIGHTED_RULES
+        # (schema, row count, question, top_k) -> recommendations; repeated questions on the same file skip the dtype/nunique scan
+        self._recommendation_cache = LRUCache(maxsize=128)
     
     def recommend_charts(self, df: pd.DataFrame, question: str = "", top_k: int = 5) -> List[Dict[str, Any]]:
         """Recommend best chart types for the given data and question"""
         
+        # Cardinality tags are the only data-dependent input (not implied by the schema), so they are part of the key
+        cardinality_tags = _cardinality_tags(df, _classify_columns(df)[1])
+        cache_key = (
+            tuple(zip(map(str, df.columns), map(str, df.dtypes))),
+            len(df),
+            cardinality_tags,
+            question,
+            top_k
+        )
+        cached = self._recommendation_cache.get(cache_key)
+        if cached is not None:
+            return [dict(recommendation) for recommendation in cached]
+        
         # Analyze data characteristics
-        data_analysis = self._analyze_data_characteristics(df)
+        data_analysis = self._analyze_data_characteristics(df, cardinality_tags)
         
         # Analyze user intent from question
         intent_analysis = self._analyze_user_intent(question)
         
         # Generate recommendations
         recommendations = self._generate_recommendations(data_analysis, intent_analysis, top_k)
+        self._recommendation_cache[cache_key] = [dict(recommendation) for recommendation in recommendations]
         
         return recommendations
     
-    def _analyze_data_characteristics(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_data_characteristics(self, df: pd.DataFrame, cardinality_tags: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
         """Comprehensive data analysis for chart recommendations"""
         
         analysis = {
@@ -80,69 +509,67 @@ class ChartRecommendationEngine:
         }
         
         # Column type analysis
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
-        datetime_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
+        numeric_cols, categorical_cols, datetime_cols = _classify_columns(df)
+        
+        num_n, cat_n, dt_n = len(numeric_cols), len(categorical_cols), len(datetime_cols)
+        n_rows = len(df)
+        data_patterns = analysis["data_patterns"]
+        special_characteristics = analysis["special_characteristics"]
         
         analysis["column_types"] = {
             "numeric": numeric_cols,
             "categorical": categorical_cols,
             "datetime": datetime_cols,
-            "numeric_count": len(numeric_cols),
-            "categorical_count": len(categorical_cols),
-            "datetime_count": len(datetime_cols)
+            "numeric_count": num_n,
+            "categorical_count": cat_n,
+            "datetime_count": dt_n
         }
         
-        # Data patterns identification
-        if len(numeric_cols) == 1 and len(categorical_cols) == 0:
-            analysis["data_patterns"].append("single_numeric")
-        elif len(numeric_cols) == 2:
-            analysis["data_patterns"].append("two_numeric")
-        elif len(numeric_cols) > 2:
-            analysis["data_patterns"].append("multiple_numeric")
+        # Data patterns identification (column counts computed once above)
+        if num_n > 2:
+            data_patterns.append("multiple_numeric")
+        elif num_n == 2:
+            data_patterns.append("two_numeric")
+        elif num_n == 1 and cat_n == 0:
+            data_patterns.append("single_numeric")
         
-        if len(categorical_cols) == 1 and len(numeric_cols) == 0:
-            analysis["data_patterns"].append("single_categorical")
-        elif len(categorical_cols) >= 1 and len(numeric_cols) >= 1:
-            analysis["data_patterns"].append("cat_vs_numeric")
+        if cat_n and num_n:
+            data_patterns.append("cat_vs_numeric")
+        elif cat_n == 1:
+            data_patterns.append("single_categorical")
         
-        if len(datetime_cols) > 0:
-            analysis["data_patterns"].append("time_series")
+        if dt_n:
+            data_patterns.append("time_series")
         
-        # Check for hierarchical data patterns
-        if any('parent' in col.lower() or 'category' in col.lower() or 'group' in col.lower() 
-               for col in categorical_cols):
-            analysis["data_patterns"].append("hierarchical")
+        # Check for hierarchical data patterns (one regex scan over the joined, lowercased names)
+        if _HIERARCHICAL_COL_RE.search("\n".join(str(col).lower() for col in categorical_cols)):
+            data_patterns.append("hierarchical")
         
         # Check for financial data patterns
-        financial_keywords = ['open', 'high', 'low', 'close', 'volume', 'price']
-        if any(any(keyword in col.lower() for keyword in financial_keywords) for col in df.columns):
-            analysis["data_patterns"].append("financial")
+        if _FINANCIAL_COL_RE.search("\n".join(str(col).lower() for col in df.columns)):
+            data_patterns.append("financial")
         
         # Dataset size characteristics
-        if len(df) < 100:
-            analysis["special_characteristics"].append("small_dataset")
-        elif len(df) > 10000:
-            analysis["special_characteristics"].append("large_dataset")
+        if n_rows < 100:
+            special_characteristics.append("small_dataset")
+        elif n_rows > 10000:
+            special_characteristics.append("large_dataset")
         
-        # High/low cardinality analysis
-        for col in categorical_cols:
-            unique_ratio = df[col].nunique() / len(df)
-            if unique_ratio > 0.8:
-                analysis["special_characteristics"].append("high_cardinality")
-            elif unique_ratio < 0.1:
-                analysis["special_characteristics"].append("low_cardinality")
+        # High/low cardinality analysis (reuses the tags recommend_charts already computed for its cache key)
+        if cardinality_tags is None:
+            cardinality_tags = _cardinality_tags(df, categorical_cols)
+        special_characteristics.extend(cardinality_tags)
         
         # Dimensionality
-        if len(numeric_cols) > 5:
-            analysis["special_characteristics"].append("many_dimensions")
+        if num_n > 5:
+            special_characteristics.append("many_dimensions")
         
         # Calculate complexity score
         analysis["complexity_score"] = (
-            len(numeric_cols) * 1 + 
-            len(categorical_cols) * 0.5 + 
-            len(datetime_cols) * 1.5 +
-            (len(df) / 10000)  # Dataset size factor
+            num_n * 1 + 
+            cat_n * 0.5 + 
+            dt_n * 1.5 +
+            (n_rows / 10000)  # Dataset size factor
         )
         
         return analysis
@@ -153,25 +580,12 @@ class ChartRecommendationEngine:
         question_lower = question.lower()
         intent = {
             "primary_intent": "explore",
-            "analysis_types": [],
-            "keywords": question_lower.split()
+            "analysis_types": []
         }
         
-        # Intent keyword mapping
-        intent_keywords = {
-            "distribution": ["분포", "distribution", "histogram", "spread", "범위"],
-            "comparison": ["비교", "compare", "차이", "difference", "vs", "versus"],
-            "correlation": ["상관관계", "correlation", "관계", "relationship", "연관"],
-            "trend": ["트렌드", "trend", "변화", "change", "시간", "time", "추이"],
-            "proportion": ["비율", "proportion", "percentage", "구성", "composition"],
-            "ranking": ["순위", "rank", "top", "bottom", "highest", "lowest"],
-            "outlier": ["이상치", "outlier", "이상", "특이", "extreme"]
-        }
-        
-        # Identify analysis types from question
-        for intent_type, keywords in intent_keywords.items():
-            if any(keyword in question_lower for keyword in keywords):
-                intent["analysis_types"].append(intent_type)
+        # Identify analysis types from question (single regex scan, reported in _INTENT_KEYWORDS order)
+        matched_intents = {_INTENT_BY_KEYWORD[m.group(1)] for m in _INTENT_KEYWORD_RE.finditer(question_lower)}
+        intent["analysis_types"] = [intent_type for intent_type in _INTENT_KEYWORDS if intent_type in matched_intents]
         
         # Set primary intent
         if intent["analysis_types"]:
@@ -183,28 +597,23 @@ class ChartRecommendationEngine:
                                 intent_analysis: Dict[str, Any], top_k: int) -> List[Dict[str, Any]]:
         """Generate chart recommendations with scoring"""
         
-        chart_scores = {}
-        
-        # Score based on data patterns
-        for pattern in data_analysis["data_patterns"]:
-            if pattern in self.recommendation_rules["data_patterns"]:
-                for chart_type in self.recommendation_rules["data_patterns"][pattern]:
-                    chart_scores[chart_type] = chart_scores.get(chart_type, 0) + 3
-        
-        # Score based on analysis intent
-        for intent_type in intent_analysis["analysis_types"]:
-            if intent_type in self.recommendation_rules["analysis_intent"]:
-                for chart_type in self.recommendation_rules["analysis_intent"][intent_type]:
-                    chart_scores[chart_type] = chart_scores.get(chart_type, 0) + 2
+        chart_scores = Counter()
+        matched_keys = {
+            "data_patterns": data_analysis["data_patterns"],
+            "analysis_intent": intent_analysis["analysis_types"],
+            "data_characteristics": data_analysis["special_characteristics"]
+        }
         
-        # Score based on data characteristics
-        for characteristic in data_analysis["special_characteristics"]:
-            if characteristic in self.recommendation_rules["data_characteristics"]:
-                for chart_type in self.recommendation_rules["data_characteristics"][characteristic]:
-                    chart_scores[chart_type] = chart_scores.get(chart_type, 0) + 1
+        # Score based on data patterns (+3), analysis intent (+2) and data characteristics (+1)
+        for group, keys in matched_keys.items():
+            weighted_rules = self._weighted_rules[group]
+            for key in keys:
+                weighted_charts = weighted_rules.get(key)
+                if weighted_charts:
+                    chart_scores.update(weighted_charts)
         
         # Sort by score and create recommendations
-        sorted_charts = sorted(chart_scores.items(), key=lambda x: x[1], reverse=True)[:top_k]
+        sorted_charts = chart_scores.most_common(top_k)
         
         recommendations = []
         for chart_type, score in sorted_charts:
@@ -226,54 +635,22 @@ class ChartRecommendationEngine:
     def _get_chart_rationale(self, chart_type: str, data_analysis: Dict, intent_analysis: Dict) -> str:
         """Generate rationale for chart recommendation"""
         
-        rationales = {
-            "histogram": f"단일 수치형 변수({data_analysis['column_types']['numeric_count']}개)의 분포를 보기에 최적",
-            "scatter": f"두 수치형 변수 간의 상관관계를 시각화하기에 이상적",
-            "bar": f"카테고리별 비교 분석에 가장 직관적이고 효과적",
-            "line": f"시계열 데이터나 연속적인 변화 추이를 보기에 최적",
-            "pie": f"전체에서 각 부분이 차지하는 비율을 한눈에 파악하기 좋음",
-            "box": f"데이터의 분포, 중위값, 사분위수, 이상치를 한 번에 확인 가능",
-            "violin": f"박스플롯보다 더 상세한 분포 형태를 보여주는 고급 통계 차트",
-            "heatmap": f"다수의 변수 간 상관관계를 색상으로 직관적으로 표현",
-            "treemap": f"계층적 데이터를 면적으로 표현하여 비율과 구조를 동시에 파악",
-            "radar": f"다차원 데이터를 한 눈에 비교 분석하기에 적합"
-        }
-        
-        return rationales.get(chart_type, f"{chart_type} 차트는 현재 데이터 특성에 적합합니다")
+        rationale = self.CHART_RATIONALES.get(chart_type)
+        if rationale is None:
+            return f"{chart_type} 차트는 현재 데이터 특성에 적합합니다"
+        if chart_type == "histogram":
+            return rationale.format(numeric_count=data_analysis['column_types']['numeric_count'])
+        return rationale
     
     def _get_korean_chart_name(self, chart_type: str) -> str:
         """Get Korean names for chart types"""
         
-        korean_names = {
-            "histogram": "히스토그램", "scatter": "산포도", "bar": "막대차트", "line": "선차트",
-            "pie": "파이차트", "box": "박스플롯", "violin": "바이올린플롯", "area": "영역차트",
-            "heatmap": "히트맵", "treemap": "트리맵", "sunburst": "선버스트차트", 
-            "funnel": "깔때기차트", "waterfall": "폭포차트", "radar": "레이더차트",
-            "scatter_3d": "3D 산점도", "surface": "3D 표면차트", "candlestick": "캔들스틱",
-            "parallel_coordinates": "평행좌표", "distplot": "분포플롯", "ecdf": "누적분포함수",
-            "choropleth": "지도차트", "scattergeo": "지리적 산점도"
-        }
-        
-        return korean_names.get(chart_type, chart_type)
+        return self.KOREAN_CHART_NAMES.get(chart_type, chart_type)
     
     def _get_chart_use_cases(self, chart_type: str) -> List[str]:
         """Get specific use cases for each chart type"""
         
-        use_cases = {
-            "histogram": ["데이터 분포 확인", "이상치 탐지", "정규성 검정"],
-            "scatter": ["상관관계 분석", "회귀분석 시각화", "클러스터링 확인"],
-            "bar": ["카테고리별 비교", "순위 분석", "집계 결과 표시"],
-            "line": ["시계열 트렌드 분석", "성장률 추적", "예측 모델 결과"],
-            "pie": ["구성 비율 분석", "시장 점유율", "예산 배분"],
-            "box": ["통계 요약", "그룹간 분포 비교", "이상치 식별"],
-            "heatmap": ["상관행렬 시각화", "패턴 탐지", "히트 분석"],
-            "treemap": ["계층적 비율", "포트폴리오 분석", "조직도"],
-            "radar": ["다차원 성능 비교", "프로필 분석", "균형도 평가"],
-            "choropleth": ["지역별 데이터 분포", "국가별 통계", "행정구역별 분석"],
-            "scattergeo": ["위치 기반 분석", "지리적 클러스터링", "GPS 데이터 시각화"]
-        }
-        
-        return use_cases.get(chart_type, ["데이터 시각화"])
+        return self.CHART_USE_CASES.get(chart_type, ["데이터 시각화"])
     
     def _get_default_recommendations(self, data_analysis: Dict) -> List[Dict[str, Any]]:
         """Provide default recommendations when no specific match"""
@@ -301,17 +678,41 @@ class ChartRecommendationEngine:
         return defaults[:3]
 
 class ChartService:
-    
+    # Modern vibrant color palette with gradients
+    _BAR_COLORS: Tuple[str, ...] = (
+        'rgba(99, 102, 241, 0.8)',    # Modern Purple
+        'rgba(14, 165, 233, 0.8)',    # Sky Blue
+        'rgba(34, 197, 94, 0.8)',     # Emerald Green
+        'rgba(251, 113, 133, 0.8)',   # Rose Pink
+        'rgba(249, 115, 22, 0.8)',    # Orange
+        'rgba(139, 92, 246, 0.8)',    # Violet
+        'rgba(6, 182, 212, 0.8)',     # Cyan
+        'rgba(245, 158, 11, 0.8)',    # Amber
+        'rgba(236, 72, 153, 0.8)',    # Fuchsia
+        'rgba(16, 185, 129, 0.8)'     # Teal
+    )
+
     def __init__(self):
         """Initialize comprehensive chart support"""
+        # One PCG64 generator shared by every chart this service builds (strip-chart jitter)
+        self._rng = np.random.default_rng()
+        # (include, column/dtype schema) -> matching column names, shared by every chart drawn from the same frame
+        self._dtype_cols_cache = LRUCache(maxsize=128)
         try:
             self.chart_registry = self._build_chart_registry()
+            # Bind chart builders once so dispatch is a single dict lookup
+            self._dispatch = {
+                chart_type: getattr(self, info["method"])
+                for chart_type, info in self.chart_registry.items()
+                if hasattr(self, info["method"])
+            }
             self.recommendation_engine = ChartRecommendationEngine()
             print("✅ ChartService initialized successfully")
         except Exception as e:
             print(f"❌ Error initializing ChartService: {e}")
             # Fallback initialization
             self.chart_registry = {}
+            self._dispatch = {}
             self.recommendation_engine = None
     
     def _build_chart_registry(self) -> Dict[str, Dict[str, Any]]:
@@ -398,19 +799,31 @@ class ChartService:
         prepared_data = self._prepare_data_for_chart(df, chart_columns, chart_info, chart_config)
         
         try:
-            # Get the method and call it
-            method_name = chart_info["method"]
-            if hasattr(self, method_name):
-                method = getattr(self, method_name)
+            # Get the pre-bound method and call it
+            method = self._dispatch.get(chart_type)
+            if method is not None:
                 return method(prepared_data["df"], prepared_data["x_col"], prepared_data.get("y_col"), chart_config)
             else:
-                print(f"Method {method_name} not implemented yet, falling back to bar chart")
+                print(f"Method {chart_info['method']} not implemented yet, falling back to bar chart")
                 return self._create_bar_chart(df, prepared_data["x_col"], prepared_data.get("y_col", "Count"), chart_config)
         
         except Exception as e:
             print(f"Error creating {chart_type} chart: {e}")
             return self._create_default_chart(df, str(e))
     
+    def _columns_of_dtype(self, df: pd.DataFrame, include: str) -> List[str]:
+        """Memoized df.select_dtypes(include=[include]).columns, keyed by the frame's column/dtype schema"""
+        cache_key = (include, tuple(zip(df.columns, df.dtypes)))
+        cols = self._dtype_cols_cache.get(cache_key)
+        if cols is None:
+            cols = tuple(df.select_dtypes(include=[include]).columns)
+            self._dtype_cols_cache[cache_key] = cols
+        return list(cols)
+
+    def _numeric_cols(self, df: pd.DataFrame) -> List[str]:
+        """Numeric column names (select_dtypes(include=[np.number]))"""
+        return self._columns_of_dtype(df, 'number')
+
     def _prepare_data_for_chart(self, df: pd.DataFrame, chart_columns: Dict[str, str], chart_info: Dict[str, Any], chart_config: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare data based on chart type requirements"""
 
@@ -442,12 +855,23 @@ class ChartService:
 
         print(f"✅ Final columns - X: {x_col}, Y: {y_col}")
 
-        result_df = df.copy()
+        # No eager copy: every branch below builds a new frame or only reads from df
+        result_df = df
+
+        # X column dtype / cardinality computed once and reused by both branches below
+        x_is_categorical = False
+        if x_col and x_col in df.columns:
+            x_dtype = df[x_col].dtype
+            x_is_categorical = (
+                pd.api.types.is_object_dtype(x_dtype)
+                or pd.api.types.is_string_dtype(x_dtype)
+                or df[x_col].nunique() < len(df) * 0.5
+            )
 
         # Enhanced logic for categorical vs numeric relationships
         if x_col and y_col and x_col in df.columns and y_col in df.columns:
-            x_is_categorical = df[x_col].dtype == 'object' or df[x_col].nunique() < len(df) * 0.5
-            y_is_numeric = df[y_col].dtype in ['int64', 'float64', 'int32', 'float32', 'int', 'float']
+            y_dtype = df[y_col].dtype
+            y_is_numeric = pd.api.types.is_numeric_dtype(y_dtype) and not pd.api.types.is_bool_dtype(y_dtype)
 
             # Handle categorical X vs numeric Y (common for correlation analysis)
             if x_is_categorical and y_is_numeric:
@@ -461,7 +885,8 @@ class ChartService:
                     result_df = df[[x_col, y_col]].dropna()
                 else:
                     # For bar charts, scatter, etc., aggregate by mean
-                    df_grouped = df.groupby(x_col)[y_col].agg(['mean', 'count', 'std']).reset_index()
+                    # observed=True: categorical X groups on its integer codes without materializing unused categories
+                    df_grouped = df.groupby(x_col, observed=True)[y_col].agg(['mean', 'count', 'std']).reset_index()
                     df_grouped.columns = [x_col, y_col, 'count', 'std']
                     result_df = df_grouped
 
@@ -475,26 +900,26 @@ class ChartService:
                 }
 
         # Handle count-based analysis for charts that don't have a specific Y column
+        counts_built = False
         if not chart_info["requires_y"] or y_col == "Count" or y_col is None:
             if x_col and x_col in df.columns:
                 # Create value counts for categorical analysis
-                if df[x_col].dtype == 'object' or df[x_col].nunique() < len(df) * 0.5:
-                    df_grouped = df[x_col].value_counts().reset_index()
-                    df_grouped.columns = [x_col, "Count"]
-                    result_df = df_grouped
+                if x_is_categorical:
+                    result_df = _value_counts_frame(df[x_col], x_col)
                     y_col = "Count"
+                    counts_built = True
 
         # Additional validation to ensure we have proper count data
-        if y_col == "Count" and x_col in result_df.columns:
+        if not counts_built and y_col == "Count" and x_col in result_df.columns:
             if "Count" not in result_df.columns:
                 # Fallback: Create proper counts if missing
-                value_counts = df[x_col].value_counts().reset_index()
-                value_counts.columns = [x_col, "Count"]
-                result_df = value_counts
+                result_df = _value_counts_frame(df[x_col], x_col)
+                counts_built = True
 
-        # Ensure numeric data types for counts
-        if "Count" in result_df.columns:
-            result_df["Count"] = pd.to_numeric(result_df["Count"], errors='coerce').fillna(0)
+        # Ensure numeric data types for counts (value_counts output is already int64)
+        if not counts_built and "Count" in result_df.columns and not pd.api.types.is_integer_dtype(result_df["Count"].dtype):
+            # assign() returns a new frame, so a "Count" column in the caller's df is never mutated
+            result_df = result_df.assign(Count=pd.to_numeric(result_df["Count"], errors='coerce').fillna(0))
 
         return {
             "df": result_df,
@@ -512,15 +937,16 @@ class ChartService:
                 return self._get_fallback_recommendations(df)
             
             recommendations = self.recommendation_engine.recommend_charts(df, question, top_k=5)
+            numeric_cols, categorical_cols, datetime_cols = _classify_columns(df)
             
             return {
                 "recommendations": recommendations,
                 "data_summary": {
                     "rows": len(df),
                     "columns": len(df.columns),
-                    "numeric_columns": len(df.select_dtypes(include=[np.number]).columns),
-                    "categorical_columns": len(df.select_dtypes(include=['object']).columns),
-                    "datetime_columns": len(df.select_dtypes(include=['datetime64']).columns)
+                    "numeric_columns": len(numeric_cols),
+                    "categorical_columns": len(categorical_cols),
+                    "datetime_columns": len(datetime_cols)
                 },
                 "suggested_message": self._generate_suggestion_message(recommendations)
             }
@@ -531,8 +957,9 @@ class ChartService:
     def _get_fallback_recommendations(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Fallback recommendations when recommendation engine fails"""
         
-        numeric_cols = len(df.select_dtypes(include=[np.number]).columns)
-        categorical_cols = len(df.select_dtypes(include=['object']).columns)
+        numeric_col_list, categorical_col_list, datetime_col_list = _classify_columns(df)
+        numeric_cols = len(numeric_col_list)
+        categorical_cols = len(categorical_col_list)
         
         recommendations = []
         
@@ -570,7 +997,7 @@ class ChartService:
                 "columns": len(df.columns),
                 "numeric_columns": numeric_cols,
                 "categorical_columns": categorical_cols,
-                "datetime_columns": len(df.select_dtypes(include=['datetime64']).columns)
+                "datetime_columns": len(datetime_col_list)
             },
             "suggested_message": self._generate_suggestion_message(recommendations)
         }
@@ -582,6 +1009,10 @@ class ChartService:
             return "데이터 분석을 위한 기본 차트를 추천드립니다."
         
         top_recommendation = recommendations[0]
+        other_recommendations = "".join(
+            f"{i}. {rec['korean_name']} - {rec['rationale']}\n"
+            for i, rec in enumerate(recommendations[1:4], 2)
+        )
         
         message = f"""
 📊 **데이터 분석을 위한 차트 추천**
@@ -590,149 +1021,113 @@ class ChartService:
 **추천 이유**: {top_recommendation['rationale']}
 
 **다른 추천 차트들**:
-"""
-        
-        for i, rec in enumerate(recommendations[1:4], 2):
-            message += f"{i}. {rec['korean_name']} - {rec['rationale']}\n"
-        
-        message += "\n💡 원하는 차트 이름을 말씀해주시면 바로 생성해드립니다!"
+{other_recommendations}
+💡 원하는 차트 이름을 말씀해주시면 바로 생성해드립니다!"""
         
         return message.strip()
     
     def _create_bar_chart(self, df: pd.DataFrame, x_col: str, y_col: str, chart_config: Dict[str, Any]) -> Dict[str, Any]:
         """Professional-style bar chart with modern gradient design and enhanced interactivity"""
-        # Modern vibrant color palette with gradients
-        colors = [
-            'rgba(99, 102, 241, 0.8)',    # Modern Purple
-            'rgba(14, 165, 233, 0.8)',    # Sky Blue
-            'rgba(34, 197, 94, 0.8)',     # Emerald Green
-            'rgba(251, 113, 133, 0.8)',   # Rose Pink
-            'rgba(249, 115, 22, 0.8)',    # Orange
-            'rgba(139, 92, 246, 0.8)',    # Violet
-            'rgba(6, 182, 212, 0.8)',     # Cyan
-            'rgba(245, 158, 11, 0.8)',    # Amber
-            'rgba(236, 72, 153, 0.8)',    # Fuchsia
-            'rgba(16, 185, 129, 0.8)'     # Teal
-        ]
-        
         # Handle different data types for y-axis
-        if y_col in df.columns and df[y_col].dtype in ['int64', 'float64', 'float32', 'int32']:
+        if y_col in df.columns and pd.api.types.is_numeric_dtype(df[y_col].dtype) and not pd.api.types.is_bool_dtype(df[y_col].dtype):
             # Numeric data - show top 15 for better analysis
-            data = df.nlargest(15, y_col)
-            y_values = data[y_col].tolist()
+            data = _nlargest_rows(df, y_col, 15)
+            x_values = data[x_col].to_numpy()
+            y_values = data[y_col].to_numpy()
         elif y_col == "Count" and "Count" in df.columns:
             # Count column should contain the actual frequencies
             data = df.head(15)  # Already sorted by value_counts
-            y_values = data["Count"].tolist()
+            x_values = data[x_col].to_numpy()
+            y_values = data["Count"].to_numpy()
+        elif len(df) > 0:
+            # Fallback case - count only the top 15 categories on the fly
+            x_values, y_values = _top_value_counts(df[x_col], 15)
         else:
-            # Fallback case - create counts on the fly
-            data = df.head(15)
-            if len(data) > 0:
-                # Create value counts dynamically
-                original_data = df[x_col].value_counts().reset_index()
-                original_data.columns = [x_col, "Count"]
-                data = original_data.head(15)
-                y_values = data["Count"].tolist()
-            else:
-                y_values = [1] * len(data)  # Ultimate fallback
-
-        x_values = data[x_col].tolist()
+            x_values = df[x_col].to_numpy()
+            y_values = []  # Ultimate fallback
         
+        labels = _bar_chart_strings(x_col, y_col)
+        y_max = float(np.nanmax(y_values)) if len(y_values) else None
+
         # Create dynamic colors for each bar
-        bar_colors = [colors[i % len(colors)] for i in range(len(x_values))]
-
-        fig = go.Figure(data=[
-            go.Bar(
-                x=x_values,
-                y=y_values,
-                marker=dict(
-                    color=bar_colors,
-                    line=dict(color='rgba(255,255,255,0.6)', width=2),
-                    opacity=0.85,
-                    # Add gradient-like effect with pattern
-                    pattern=dict(
-                        shape="",
-                        bgcolor="rgba(255,255,255,0.1)"
-                    )
-                ),
-                hovertemplate=(
-                    f"<b>📊 {x_col}</b>: %{{x}}<br>"
-                    f"<b>📈 {y_col}</b>: %{{y:,.0f}}<br>"
-                    "<extra></extra>"
-                ),
-                hoverlabel=dict(
-                    bgcolor="rgba(37, 37, 37, 0.95)",
-                    bordercolor="rgba(255,255,255,0.2)",
-                    font=dict(color="white", size=14, family="Inter, -apple-system, sans-serif")
-                ),
-                text=[f"{val:,.0f}" for val in y_values],
-                textposition='outside',
-                textfont=dict(size=11, color='rgba(55, 65, 81, 0.9)', family="Inter, sans-serif", weight='bold'),
-                cliponaxis=False,  # Allow text to extend beyond plot area
-                texttemplate='%{text}',
-                showlegend=False
-            )
-        ])
-        
-        fig.update_layout(
-            title=dict(
-                text=f"<b style='color:#1f2937'>{y_col}</b> <span style='color:#6b7280'>분석 by</span> <b style='color:#1f2937'>{x_col}</b>",
-                font=dict(size=20, color='#1f2937', family="Inter, -apple-system, BlinkMacSystemFont, sans-serif"),
-                x=0.5, xanchor='center',
-                y=0.95, yanchor='top',
-                pad=dict(b=20)
-            ),
-            xaxis=dict(
-                title=dict(
-                    text=f"<b>{x_col}</b>",
-                    font=dict(size=14, color='#374151', family="Inter, sans-serif")
-                ),
-                tickangle=-45 if x_values and len(str(max(x_values, key=lambda x: len(str(x))))) > 8 else 0,
-                gridcolor='rgba(229, 231, 235, 0.6)',
-                gridwidth=1,
-                linecolor='rgba(156, 163, 175, 0.4)',
-                tickfont=dict(size=11, color='#6b7280', family="Inter, sans-serif"),
-                showline=True,
-                mirror=False
-            ),
-            yaxis=dict(
-                title=dict(
-                    text=f"<b>{y_col}</b>",
-                    font=dict(size=14, color='#374151', family="Inter, sans-serif")
-                ),
-                gridcolor='rgba(229, 231, 235, 0.6)',
-                gridwidth=1,
-                linecolor='rgba(156, 163, 175, 0.4)',
-                tickfont=dict(size=11, color='#6b7280', family="Inter, sans-serif"),
-                zeroline=True,
-                zerolinecolor='rgba(156, 163, 175, 0.4)',
-                showline=True,
-                mirror=False,
+        palette = self._BAR_COLORS
+        bar_colors = [palette[i % len(palette)] for i in range(len(x_values))]
+
+        bar_trace = {
+            "type": "bar",
+            "x": x_values,
+            "y": y_values,
+            "marker": {
+                "color": bar_colors,
+                "line": {"color": 'rgba(255,255,255,0.6)', "width": 2},
+                "opacity": 0.85,
+                # Add gradient-like effect with pattern
+                "pattern": {
+                    "shape": "",
+                    "bgcolor": "rgba(255,255,255,0.1)"
+                }
+            },
+            "hovertemplate": labels["hovertemplate"],
+            "hoverlabel": _HOVERLABEL_DARK,
+            "textposition": 'outside',
+            "textfont": {"size": 11, "color": 'rgba(55, 65, 81, 0.9)', "family": "Inter, sans-serif", "weight": 'bold'},
+            "cliponaxis": False,  # Allow text to extend beyond plot area
+            "texttemplate": '%{y:,.0f}',  # Formatted client-side from the y values
+            "showlegend": False
+        }
+
+        layout = {
+            "title": {
+                "text": labels["title"],
+                **_INTER_TITLE_BASE
+            },
+            "xaxis": {
+                "title": {
+                    "text": labels["x_title"],
+                    "font": _INTER_AXIS_TITLE_FONT
+                },
+                "tickangle": -45 if any(len(str(x)) > 8 for x in x_values) else 0,
+                **_INTER_AXIS_BASE,
+                "gridwidth": 1,
+                "showline": True,
+                "mirror": False
+            },
+            "yaxis": {
+                "title": {
+                    "text": labels["y_title"],
+                    "font": _INTER_AXIS_TITLE_FONT
+                },
+                **_INTER_AXIS_BASE,
+                "gridwidth": 1,
+                "zeroline": True,
+                "zerolinecolor": 'rgba(156, 163, 175, 0.4)',
+                "showline": True,
+                "mirror": False,
                 # Add extra space at the top for text labels
-                range=[0, max(y_values) * 1.15] if y_values else [0, 1]
-            ),
-            plot_bgcolor='rgba(249, 250, 251, 0.4)',
-            paper_bgcolor='white',
-            font=dict(family="Inter, -apple-system, BlinkMacSystemFont, sans-serif", size=12, color='#374151'),
-            margin=dict(l=70, r=40, t=160, b=120),
-            showlegend=False,
-            hovermode='closest',
+                "range": [0, y_max * 1.15] if len(y_values) else [0, 1]
+            },
+            "plot_bgcolor": 'rgba(249, 250, 251, 0.4)',
+            "paper_bgcolor": 'white',
+            "font": _INTER_FONT,
+            "margin": {"l": 70, "r": 40, "t": 160, "b": 120},
+            "showlegend": False,
+            "hovermode": 'closest',
             # Add subtle shadow effect
-            annotations=[
-                dict(
-                    text="",
-                    showarrow=False,
-                    x=0, y=0,
-                    xref="paper", yref="paper",
-                    xanchor="left", yanchor="bottom",
-                    xshift=-5, yshift=-5,
-                    bgcolor="rgba(0,0,0,0.02)",
-                    borderwidth=0
-                )
+            "annotations": [
+                {
+                    "text": "",
+                    "showarrow": False,
+                    "x": 0, "y": 0,
+                    "xref": "paper", "yref": "paper",
+                    "xanchor": "left", "yanchor": "bottom",
+                    "xshift": -5, "yshift": -5,
+                    "bgcolor": "rgba(0,0,0,0.02)",
+                    "borderwidth": 0
+                }
             ]
-        )
-        
-        return fig.to_dict()
+        }
+
+        return _figure_dict([bar_trace], layout)
     
     def _create_line_chart(self, df: pd.DataFrame, x_col: str, y_col: str, chart_config: Dict[str, Any]) -> Dict[str, Any]:
         """Professional-style line chart with enhanced interactivity"""
@@ -748,101 +1143,98 @@ class ChartService:
             # Ensure x column is properly converted to datetime if needed
             if not pd.api.types.is_datetime64_any_dtype(data[x_col]):
                 try:
-                    data[x_col] = pd.to_datetime(data[x_col], errors='coerce')
+                    data[x_col] = _fast_to_datetime(data[x_col])
                 except:
                     pass
             
-            # Remove any rows with invalid dates and sort
-            data = data.dropna(subset=[x_col]).sort_values(x_col).head(50)
+            # Remove any rows with invalid dates and keep the earliest 50 (bounded selection, no full sort)
+            data = data.dropna(subset=[x_col])
+            if pd.api.types.is_datetime64_any_dtype(data[x_col]):
+                data = data.nsmallest(50, x_col)
+            else:
+                data = data.sort_values(x_col).head(50)
         else:
             data = data.head(50)
         
-        fig = go.Figure(data=go.Scatter(
-            x=data[x_col].tolist(),
-            y=data[y_col].tolist(),
-            mode='lines+markers',
-            line=dict(
-                color='rgba(99, 102, 241, 1)',
-                width=4,
-                shape='spline',
-                smoothing=1.0  # Smooth line curves
-            ),
-            marker=dict(
-                color='rgba(99, 102, 241, 0.9)',
-                size=8,
-                line=dict(color='white', width=2),
-                symbol='circle'
-            ),
-            fill='tonexty',  # Add subtle area fill
-            fillcolor='rgba(99, 102, 241, 0.1)',
-            hovertemplate=(
+        line_trace = {
+            "type": "scatter",
+            "x": data[x_col].to_numpy(),
+            "y": data[y_col].to_numpy(),
+            "mode": 'lines+markers',
+            "line": {
+                "color": 'rgba(99, 102, 241, 1)',
+                "width": 4,
+                "shape": 'spline',
+                "smoothing": 1.0  # Smooth line curves
+            },
+            "marker": {
+                "color": 'rgba(99, 102, 241, 0.9)',
+                "size": 8,
+                "line": {"color": 'white', "width": 2},
+                "symbol": 'circle'
+            },
+            "fill": 'tonexty',  # Add subtle area fill
+            "fillcolor": 'rgba(99, 102, 241, 0.1)',
+            "hovertemplate": (
                 f"<b>📈 {x_col}</b>: %{{x}}<br>"
                 f"<b>📊 {y_col}</b>: %{{y:,.2f}}<br>"
                 "<extra></extra>"
             ),
-            hoverlabel=dict(
-                bgcolor="rgba(37, 37, 37, 0.95)",
-                bordercolor="rgba(99, 102, 241, 0.8)",
-                font=dict(color="white", size=14, family="Inter, -apple-system, sans-serif")
-            ),
-            name='데이터 추세'
-        ))
-        
-        fig.update_layout(
-            title=dict(
-                text=f"<b style='color:#1f2937'>{y_col}</b> <span style='color:#6b7280'>Trend over</span> <b style='color:#1f2937'>{x_col}</b>",
-                font=dict(size=20, color='#1f2937', family="Inter, -apple-system, BlinkMacSystemFont, sans-serif"),
-                x=0.5, xanchor='center',
-                y=0.95, yanchor='top',
-                pad=dict(b=20)
-            ),
-            xaxis=dict(
-                title=dict(
-                    text=f"<b>{x_col}</b>",
-                    font=dict(size=14, color='#374151', family="Inter, sans-serif")
-                ),
-                gridcolor='rgba(229, 231, 235, 0.6)',
-                linecolor='rgba(156, 163, 175, 0.4)',
-                type='date' if is_datetime_x else '-',
-                tickformat='%Y-%m-%d' if is_datetime_x else None,
-                tickfont=dict(size=11, color='#6b7280', family="Inter, sans-serif")
-            ),
-            yaxis=dict(
-                title=dict(
-                    text=f"<b>{y_col}</b>",
-                    font=dict(size=14, color='#374151', family="Inter, sans-serif")
-                ),
-                gridcolor='rgba(229, 231, 235, 0.6)',
-                linecolor='rgba(156, 163, 175, 0.4)',
-                tickfont=dict(size=11, color='#6b7280', family="Inter, sans-serif")
-            ),
-            plot_bgcolor='rgba(249, 250, 251, 0.4)',
-            paper_bgcolor='white',
-            font=dict(family="Inter, -apple-system, BlinkMacSystemFont, sans-serif", size=12, color='#374151'),
-            margin=dict(l=70, r=40, t=140, b=120),
-            hovermode='x unified'
-        )
-        
-        return fig.to_dict()
+            "hoverlabel": {**_HOVERLABEL_DARK, "bordercolor": "rgba(99, 102, 241, 0.8)"},
+            "name": '데이터 추세'
+        }
+
+        xaxis = {
+            "title": {
+                "text": f"<b>{x_col}</b>",
+                "font": _INTER_AXIS_TITLE_FONT
+            },
+            **_INTER_AXIS_BASE,
+            "type": 'date' if is_datetime_x else '-'
+        }
+        if is_datetime_x:
+            xaxis["tickformat"] = '%Y-%m-%d'
+
+        layout = {
+            "title": {
+                "text": f"<b style='color:#1f2937'>{y_col}</b> <span style='color:#6b7280'>Trend over</span> <b style='color:#1f2937'>{x_col}</b>",
+                **_INTER_TITLE_BASE
+            },
+            "xaxis": xaxis,
+            "yaxis": {
+                "title": {
+                    "text": f"<b>{y_col}</b>",
+                    "font": _INTER_AXIS_TITLE_FONT
+                },
+                **_INTER_AXIS_BASE
+            },
+            "plot_bgcolor": 'rgba(249, 250, 251, 0.4)',
+            "paper_bgcolor": 'white',
+            "font": _INTER_FONT,
+            "margin": {"l": 70, "r": 40, "t": 140, "b": 120},
+            "hovermode": 'x unified'
+        }
+
+        return _figure_dict([line_trace], layout)
     
     def _create_pie_chart(self, df: pd.DataFrame, x_col: str, y_col: str, chart_config: Dict[str, Any]) -> Dict[str, Any]:
         """Professional-style pie chart with enhanced visual appeal"""
         # Handle different data types
-        if y_col in df.columns and df[y_col].dtype in ['int64', 'float64', 'float32', 'int32']:
+        if y_col in df.columns and pd.api.types.is_numeric_dtype(df[y_col].dtype) and not pd.api.types.is_bool_dtype(df[y_col].dtype):
             # Numeric data - use actual values
-            data = df.nlargest(8, y_col)
-            values = data[y_col].tolist()
-            labels = data[x_col].tolist()
+            data = _nlargest_rows(df, y_col, 8)
+            values = data[y_col].to_numpy()
+            labels = data[x_col].to_numpy()
         elif y_col == "Count" and "Count" in df.columns:
             # Count column should contain the actual frequencies
             data = df.head(8)  # Already sorted by value_counts
-            values = data["Count"].tolist()
-            labels = data[x_col].tolist()
+            values = data["Count"].to_numpy()
+            labels = data[x_col].to_numpy()
         else:
             # Create value counts for categorical data
             value_counts = df[x_col].value_counts().head(8)
-            labels = value_counts.index.tolist()
-            values = value_counts.values.tolist()
+            labels = value_counts.index.to_numpy()
+            values = value_counts.to_numpy()
         
         # Modern gradient-style color palette with better contrast
         colors = [
@@ -856,59 +1248,53 @@ class ChartService:
             'rgba(245, 158, 11, 0.9)'     # Amber
         ]
 
-        fig = go.Figure(data=[go.Pie(
-            labels=labels,
-            values=values,
-            hole=0.5,  # Larger donut hole for modern look
-            marker=dict(
-                colors=colors[:len(labels)],
-                line=dict(color='white', width=3)  # Thicker white borders
-            ),
-            textinfo='label+percent',
-            textfont=dict(
-                size=12,
-                color='#374151',
-                family="Inter, -apple-system, sans-serif",
-                style='bold'
-            ),
-            textposition='outside',
-            hovertemplate=(
+        pie_trace = {
+            "type": "pie",
+            "labels": labels,
+            "values": values,
+            "hole": 0.5,  # Larger donut hole for modern look
+            "marker": {
+                "colors": colors[:len(labels)],
+                "line": {"color": 'white', "width": 3}  # Thicker white borders
+            },
+            "textinfo": 'label+percent',
+            "textfont": {
+                "size": 12,
+                "color": '#374151',
+                "family": "Inter, -apple-system, sans-serif",
+                "weight": 'bold'
+            },
+            "textposition": 'outside',
+            "hovertemplate": (
                 "<b>🔸 %{label}</b><br>"
                 "수량: %{value:,.0f}<br>"
                 "비율: %{percent}<br>"
                 "<extra></extra>"
             ),
-            hoverlabel=dict(
-                bgcolor="rgba(37, 37, 37, 0.95)",
-                bordercolor="rgba(255,255,255,0.2)",
-                font=dict(color="white", size=14, family="Inter, -apple-system, sans-serif")
-            ),
-            rotation=90,  # Rotate for better label positioning
-            direction='clockwise'
-        )])
-        
-        fig.update_layout(
-            title=dict(
-                text=f"<b style='color:#1f2937'>{y_col if y_col != 'Count' else 'Items'}</b> <span style='color:#6b7280'>Distribution by</span> <b style='color:#1f2937'>{x_col}</b>",
-                font=dict(size=20, color='#1f2937', family="Inter, -apple-system, BlinkMacSystemFont, sans-serif"),
-                x=0.5, xanchor='center',
-                y=0.95, yanchor='top',
-                pad=dict(b=20)
-            ),
-            paper_bgcolor='white',
-            font=dict(family="Inter, -apple-system, BlinkMacSystemFont, sans-serif", size=12, color='#374151'),
-            margin=dict(l=40, r=40, t=140, b=40),
-            showlegend=True,
-            legend=dict(
-                orientation="v",
-                yanchor="middle",
-                y=0.5,
-                xanchor="left",
-                x=1.05
-            )
-        )
-        
-        return fig.to_dict()
+            "hoverlabel": _HOVERLABEL_DARK,
+            "rotation": 90,  # Rotate for better label positioning
+            "direction": 'clockwise'
+        }
+
+        layout = {
+            "title": {
+                "text": f"<b style='color:#1f2937'>{y_col if y_col != 'Count' else 'Items'}</b> <span style='color:#6b7280'>Distribution by</span> <b style='color:#1f2937'>{x_col}</b>",
+                **_INTER_TITLE_BASE
+            },
+            "paper_bgcolor": 'white',
+            "font": _INTER_FONT,
+            "margin": {"l": 40, "r": 40, "t": 140, "b": 40},
+            "showlegend": True,
+            "legend": {
+                "orientation": "v",
+                "yanchor": "middle",
+                "y": 0.5,
+                "xanchor": "left",
+                "x": 1.05
+            }
+        }
+
+        return _figure_dict([pie_trace], layout)
     
     def _create_scatter_chart(self, df: pd.DataFrame, x_col: str, y_col: str, chart_config: Dict[str, Any]) -> Dict[str, Any]:
         """Professional-style scatter plot with enhanced interactivity"""
@@ -929,32 +1315,31 @@ class ChartService:
                 # Handle categorical vs numeric scatter plot (strip chart style)
                 print(f"🎯 Creating categorical vs numeric scatter plot: {x_col} vs {y_col}")
 
-                # Convert Y to numeric, handle non-numeric values
-                clean_data[y_col] = pd.to_numeric(clean_data[y_col], errors='coerce')
-                clean_data = clean_data.dropna()
+                # Convert Y to numeric, handle non-numeric values (limited to 1500 points for performance)
+                data = _sample_numeric_rows(clean_data, [y_col], 1500)
 
-                if len(clean_data) == 0:
+                if len(data) == 0:
                     return self._create_default_chart(df, f"No valid numeric data found in column {y_col}")
 
-                # Limit data for performance
-                data = clean_data.sample(min(1500, len(clean_data))) if len(clean_data) > 1500 else clean_data
-
                 # Create scatter plot with jitter for categorical axis
                 fig = go.Figure()
-                categories = data[x_col].unique()
+                codes, categories = pd.factorize(data[x_col])
                 colors = ['#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6', '#1abc9c', '#f1c40f', '#e67e22']
 
-                for i, category in enumerate(categories):
-                    cat_data = data[data[x_col] == category]
+                # Group row positions by category once instead of re-filtering the frame per category
+                order = np.argsort(codes, kind="stable")
+                bounds = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=len(categories)))))
+
+                # Add small random jitter to x-axis for better visualization
+                x_jittered = codes + self._rng.standard_normal(len(codes)) * 0.05
+                y_values = data[y_col].to_numpy()
 
-                    # Add small random jitter to x-axis for better visualization
-                    x_pos = [i] * len(cat_data)
-                    jitter = np.random.normal(0, 0.05, len(cat_data))  # Small jitter
-                    x_jittered = [x + j for x, j in zip(x_pos, jitter)]
+                for i, category in enumerate(categories):
+                    rows = order[bounds[i]:bounds[i + 1]]
 
                     fig.add_trace(go.Scatter(
-                        x=x_jittered,
-                        y=cat_data[y_col].tolist(),
+                        x=x_jittered[rows],
+                        y=y_values[rows],
                         mode='markers',
                         name=str(category),
                         marker=dict(
@@ -976,30 +1361,32 @@ class ChartService:
                     ticktext=[str(cat) for cat in categories]
                 )
 
+                correlation = np.nan
                 correlation_text = ""  # No correlation for categorical data
 
             else:
                 # Handle numeric vs numeric scatter plot (original logic)
-                # Convert to numeric if possible, drop non-numeric rows
-                clean_data[x_col] = pd.to_numeric(clean_data[x_col], errors='coerce')
-                clean_data[y_col] = pd.to_numeric(clean_data[y_col], errors='coerce')
+                # Convert to numeric if possible, drop non-numeric rows, limit to 1000 points for performance
+                data = _sample_numeric_rows(clean_data, [x_col, y_col], 1000)
 
-                # Remove rows with missing values
-                clean_data = clean_data.dropna()
-
-                if len(clean_data) == 0:
+                if len(data) == 0:
                     return self._create_default_chart(df, f"No valid numeric data found in columns {x_col} and {y_col}")
 
-                # Limit data for performance but ensure good representation
-                data = clean_data.sample(min(1000, len(clean_data))) if len(clean_data) > 1000 else clean_data
+                # Materialize both columns once; the centered values feed the correlation and the trend line
+                x = data[x_col].to_numpy(dtype=np.float64)
+                y = data[y_col].to_numpy(dtype=np.float64)
+                x_dev = x - x.mean()
+                y_dev = y - y.mean()
+                sxx = np.dot(x_dev, x_dev)
+                sxy = np.dot(x_dev, y_dev)
 
                 # Calculate correlation for additional insight
-                correlation = data[x_col].corr(data[y_col])
+                correlation = sxy / np.sqrt(sxx * np.dot(y_dev, y_dev))
                 correlation_text = f"상관계수: {correlation:.3f}" if not pd.isna(correlation) else ""
 
                 fig = go.Figure(data=go.Scatter(
-                    x=data[x_col].tolist(),
-                    y=data[y_col].tolist(),
+                    x=x,
+                    y=y,
                     mode='markers',
                     marker=dict(
                         size=8,
@@ -1017,14 +1404,14 @@ class ChartService:
 
                 # Add trend line if correlation is significant
                 if not pd.isna(correlation) and abs(correlation) > 0.3:
-                    # Calculate trend line
-                    z = np.polyfit(data[x_col], data[y_col], 1)
-                    p = np.poly1d(z)
+                    # Calculate trend line (closed-form least squares for a straight line)
+                    slope = sxy / sxx
+                    intercept = y.mean() - slope * x.mean()
 
                     # Add trend line
                     fig.add_trace(go.Scatter(
-                        x=data[x_col].tolist(),
-                        y=p(data[x_col]).tolist(),
+                        x=x,
+                        y=slope * x + intercept,
                         mode='lines',
                         name=f'추세선 (r={correlation:.3f})',
                         line=dict(color='#E74C3C', width=2, dash='dash'),
@@ -1080,44 +1467,51 @@ class ChartService:
             if len(data) == 0:
                 return self._create_default_chart(df, f"No numeric data found in column {x_col}")
             
-            fig = go.Figure(data=[go.Histogram(
-                x=data.tolist(),
-                nbinsx=30,  # 적절한 bin 수
-                marker=dict(
-                    color='#3498DB',
-                    opacity=0.7,
-                    line=dict(color='white', width=1)
-                ),
-                hovertemplate=(
-                    "<b>구간</b>: %{x}<br>"
+            # 서버에서 30개 구간으로 미리 집계해 원본 값 대신 구간별 빈도만 전송
+            values = data.to_numpy(dtype=np.float64)
+            counts, edges = np.histogram(values[np.isfinite(values)], bins=30)
+            
+            histogram_trace = {
+                "type": "bar",
+                "x": (edges[:-1] + edges[1:]) / 2,
+                "y": counts,
+                "width": edges[1] - edges[0],
+                "customdata": np.column_stack((edges[:-1], edges[1:])),
+                "marker": {
+                    "color": '#3498DB',
+                    "opacity": 0.7,
+                    "line": {"color": 'white', "width": 1}
+                },
+                "hovertemplate": (
+                    "<b>구간</b>: %{customdata[0]:,.4g} - %{customdata[1]:,.4g}<br>"
                     "<b>빈도</b>: %{y}<br>"
                     "<extra></extra>"
                 ),
-                name=f"{x_col} 분포"
-            )])
-            
-            fig.update_layout(
-                title=dict(
-                    text=f"<b>{x_col} 히스토그램</b>",
-                    font=dict(size=18, color='#2C3E50', family="Arial, sans-serif"),
-                    x=0.5, xanchor='center'
-                ),
-                xaxis=dict(
-                    title=dict(text=f"<b>{x_col}</b>", font=dict(size=14, color='#34495E')),
-                    gridcolor='rgba(211,211,211,0.3)'
-                ),
-                yaxis=dict(
-                    title=dict(text="<b>빈도</b>", font=dict(size=14, color='#34495E')),
-                    gridcolor='rgba(211,211,211,0.3)'
-                ),
-                plot_bgcolor='rgba(248,249,250,0.02)',
-                paper_bgcolor='white',
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                margin=dict(l=60, r=30, t=80, b=60),
-                showlegend=False
-            )
-            
-            return fig.to_dict()
+                "name": f"{x_col} 분포"
+            }
+
+            layout = {
+                "title": {
+                    "text": f"<b>{x_col} 히스토그램</b>",
+                    **_ARIAL_TITLE_BASE
+                },
+                "xaxis": {
+                    "title": {"text": f"<b>{x_col}</b>", "font": _ARIAL_AXIS_TITLE_FONT},
+                    "gridcolor": 'rgba(211,211,211,0.3)'
+                },
+                "yaxis": {
+                    "title": {"text": "<b>빈도</b>", "font": _ARIAL_AXIS_TITLE_FONT},
+                    "gridcolor": 'rgba(211,211,211,0.3)'
+                },
+                "bargap": 0,
+                "plot_bgcolor": 'rgba(248,249,250,0.02)',
+                "paper_bgcolor": 'white',
+                "font": _ARIAL_FONT,
+                "margin": _ARIAL_MARGIN,
+                "showlegend": False
+            }
+
+            return _figure_dict([histogram_trace], layout)
             
         except Exception as e:
             return self._create_default_chart(df, f"Histogram creation failed: {str(e)}")
@@ -1147,7 +1541,7 @@ class ChartService:
                 print(f"❌ {error_msg}")
                 return self._create_default_chart(df, error_msg)
             
-            fig = go.Figure()
+            box_traces = []
             
             # 카테고리별로 박스 플롯 생성
             categories = df[x_col].unique()[:10]  # 최대 10개 카테고리
@@ -1155,45 +1549,81 @@ class ChartService:
             colors = ['#3498DB', '#2ECC71', '#F39C12', '#E74C3C', '#9B59B6', 
                      '#1ABC9C', '#F1C40F', '#E67E22', '#34495E', '#95A5A6']
             
+            # 한 번의 groupby로 카테고리별 값을 모으고, 박스 통계(사분위수/울타리/이상치)는 서버에서 계산
+            valid = y_data.notna() & df[x_col].isin(categories)
+            groups = dict(list(y_data[valid].groupby(df.loc[valid, x_col], sort=False, observed=True)))
+            
             for i, category in enumerate(categories):
-                category_data = df[df[x_col] == category][y_col]
-                category_data = pd.to_numeric(category_data, errors='coerce').dropna()
+                category_data = groups.get(category)
+                if category_data is None:
+                    continue
                 
-                if len(category_data) > 0:
-                    fig.add_trace(go.Box(
-                        y=category_data.tolist(),
-                        name=str(category),
-                        marker_color=colors[i % len(colors)],
-                        boxpoints='outliers',
-                        hovertemplate=(
+                values = category_data.to_numpy(dtype=np.float64)
+                # plotly.js 기본 quartilemethod='linear'는 n*p-0.5 위치에서 보간 (numpy의 'hazen'과 동일)
+                q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75], method='hazen')
+                low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+                in_fence = (values >= low) & (values <= high)
+                name = str(category)
+                color = colors[i % len(colors)]
+                
+                box_traces.append({
+                    "type": "box",
+                    "x": [name],
+                    "q1": [q1],
+                    "median": [median],
+                    "q3": [q3],
+                    "lowerfence": [values[in_fence].min()],
+                    "upperfence": [values[in_fence].max()],
+                    "name": name,
+                    "legendgroup": name,
+                    "marker": {"color": color},
+                    "hovertemplate": (
+                        f"<b>{x_col}</b>: {category}<br>"
+                        "<b>Q1</b>: %{q1}<br>"
+                        "<b>중위값</b>: %{median}<br>"
+                        "<b>Q3</b>: %{q3}<br>"
+                        "<extra></extra>"
+                    )
+                })
+                
+                # 미리 계산된 박스는 점을 그리지 않으므로 이상치만 별도 마커로 전송
+                outliers = values[~in_fence]
+                if len(outliers) > 0:
+                    box_traces.append({
+                        "type": "scatter",
+                        "mode": "markers",
+                        "x": [name] * len(outliers),
+                        "y": outliers,
+                        "name": name,
+                        "legendgroup": name,
+                        "showlegend": False,
+                        "marker": {"color": color},
+                        "hovertemplate": (
                             f"<b>{x_col}</b>: {category}<br>"
-                            "<b>Q1</b>: %{q1}<br>"
-                            "<b>중위값</b>: %{median}<br>"
-                            "<b>Q3</b>: %{q3}<br>"
+                            f"<b>{y_col}</b>: %{{y}}<br>"
                             "<extra></extra>"
                         )
-                    ))
+                    })
             
-            fig.update_layout(
-                title=dict(
-                    text=f"<b>{x_col}별 {y_col} 박스 플롯</b>",
-                    font=dict(size=18, color='#2C3E50', family="Arial, sans-serif"),
-                    x=0.5, xanchor='center'
-                ),
-                xaxis=dict(
-                    title=dict(text=f"<b>{x_col}</b>", font=dict(size=14, color='#34495E'))
-                ),
-                yaxis=dict(
-                    title=dict(text=f"<b>{y_col}</b>", font=dict(size=14, color='#34495E')),
-                    gridcolor='rgba(211,211,211,0.3)'
-                ),
-                plot_bgcolor='rgba(248,249,250,0.02)',
-                paper_bgcolor='white',
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                margin=dict(l=60, r=30, t=80, b=60)
-            )
+            layout = {
+                "title": {
+                    "text": f"<b>{x_col}별 {y_col} 박스 플롯</b>",
+                    **_ARIAL_TITLE_BASE
+                },
+                "xaxis": {
+                    "title": {"text": f"<b>{x_col}</b>", "font": _ARIAL_AXIS_TITLE_FONT}
+                },
+                "yaxis": {
+                    "title": {"text": f"<b>{y_col}</b>", "font": _ARIAL_AXIS_TITLE_FONT},
+                    "gridcolor": 'rgba(211,211,211,0.3)'
+                },
+                "plot_bgcolor": 'rgba(248,249,250,0.02)',
+                "paper_bgcolor": 'white',
+                "font": _ARIAL_FONT,
+                "margin": _ARIAL_MARGIN
+            }
             
-            return fig.to_dict()
+            return _figure_dict(box_traces, layout)
             
         except Exception as e:
             return self._create_default_chart(df, f"Box plot creation failed: {str(e)}")
@@ -1212,43 +1642,43 @@ class ChartService:
             if len(data) == 0:
                 return self._create_default_chart(df, "No valid data for area chart")
             
-            fig = go.Figure(data=go.Scatter(
-                x=data[x_col].tolist(),
-                y=data[y_col].tolist(),
-                mode='lines',
-                fill='tonexty',
-                line=dict(color='#3498DB', width=2),
-                fillcolor='rgba(52, 152, 219, 0.3)',
-                hovertemplate=(
+            area_trace = {
+                "type": "scatter",
+                "x": data[x_col].to_numpy(),
+                "y": data[y_col].to_numpy(),
+                "mode": 'lines',
+                "fill": 'tonexty',
+                "line": {"color": '#3498DB', "width": 2},
+                "fillcolor": 'rgba(52, 152, 219, 0.3)',
+                "hovertemplate": (
                     f"<b>{x_col}</b>: %{{x}}<br>"
                     f"<b>{y_col}</b>: %{{y:,.2f}}<br>"
                     "<extra></extra>"
                 ),
-                name=f"{y_col} 영역"
-            ))
-            
-            fig.update_layout(
-                title=dict(
-                    text=f"<b>{y_col} 영역 차트 ({x_col} 기준)</b>",
-                    font=dict(size=18, color='#2C3E50', family="Arial, sans-serif"),
-                    x=0.5, xanchor='center'
-                ),
-                xaxis=dict(
-                    title=dict(text=f"<b>{x_col}</b>", font=dict(size=14, color='#34495E')),
-                    gridcolor='rgba(211,211,211,0.3)'
-                ),
-                yaxis=dict(
-                    title=dict(text=f"<b>{y_col}</b>", font=dict(size=14, color='#34495E')),
-                    gridcolor='rgba(211,211,211,0.3)'
-                ),
-                plot_bgcolor='rgba(248,249,250,0.02)',
-                paper_bgcolor='white',
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                margin=dict(l=60, r=30, t=80, b=60),
-                showlegend=False
-            )
-            
-            return fig.to_dict()
+                "name": f"{y_col} 영역"
+            }
+
+            layout = {
+                "title": {
+                    "text": f"<b>{y_col} 영역 차트 ({x_col} 기준)</b>",
+                    **_ARIAL_TITLE_BASE
+                },
+                "xaxis": {
+                    "title": {"text": f"<b>{x_col}</b>", "font": _ARIAL_AXIS_TITLE_FONT},
+                    "gridcolor": 'rgba(211,211,211,0.3)'
+                },
+                "yaxis": {
+                    "title": {"text": f"<b>{y_col}</b>", "font": _ARIAL_AXIS_TITLE_FONT},
+                    "gridcolor": 'rgba(211,211,211,0.3)'
+                },
+                "plot_bgcolor": 'rgba(248,249,250,0.02)',
+                "paper_bgcolor": 'white',
+                "font": _ARIAL_FONT,
+                "margin": _ARIAL_MARGIN,
+                "showlegend": False
+            }
+
+            return _figure_dict([area_trace], layout)
             
         except Exception as e:
             return self._create_default_chart(df, f"Area chart creation failed: {str(e)}")
@@ -1257,48 +1687,52 @@ class ChartService:
         """Professional-style heatmap for correlation analysis"""
         try:
             # 숫자형 컬럼들의 상관관계 매트릭스 생성
-            numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+            numeric_cols = self._numeric_cols(df)
             
             if len(numeric_cols) < 2:
                 return self._create_default_chart(df, "At least 2 numeric columns required for heatmap")
             
-            # 상관관계 계산
-            corr_matrix = df[numeric_cols].corr()
+            # 상관관계 계산 (결측치가 없으면 np.corrcoef 한 번으로, 있으면 pandas의 pairwise 처리 사용)
+            values = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            if np.isnan(values).any():
+                corr = df[numeric_cols].corr().to_numpy()
+            else:
+                corr = np.corrcoef(values, rowvar=False)
             
-            fig = go.Figure(data=go.Heatmap(
-                z=corr_matrix.values,
-                x=corr_matrix.columns.tolist(),
-                y=corr_matrix.columns.tolist(),
-                colorscale='RdBu',
-                zmid=0,
-                text=corr_matrix.round(3).values,
-                texttemplate="%{text}",
-                textfont={"size": 10},
-                hovertemplate=(
+            heatmap_trace = {
+                "type": "heatmap",
+                "z": corr,
+                "x": numeric_cols,
+                "y": numeric_cols,
+                "colorscale": 'RdBu',
+                "zmid": 0,
+                "text": np.round(corr, 3),
+                "texttemplate": "%{text}",
+                "textfont": {"size": 10},
+                "hovertemplate": (
                     "<b>%{y}</b> vs <b>%{x}</b><br>"
                     "상관계수: %{z:.3f}<br>"
                     "<extra></extra>"
                 )
-            ))
-            
-            fig.update_layout(
-                title=dict(
-                    text="<b>변수 간 상관관계 히트맵</b>",
-                    font=dict(size=18, color='#2C3E50', family="Arial, sans-serif"),
-                    x=0.5, xanchor='center'
-                ),
-                xaxis=dict(
-                    title=dict(text="<b>변수</b>", font=dict(size=14, color='#34495E'))
-                ),
-                yaxis=dict(
-                    title=dict(text="<b>변수</b>", font=dict(size=14, color='#34495E'))
-                ),
-                paper_bgcolor='white',
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                margin=dict(l=80, r=80, t=80, b=60)
-            )
-            
-            return fig.to_dict()
+            }
+
+            layout = {
+                "title": {
+                    "text": "<b>변수 간 상관관계 히트맵</b>",
+                    **_ARIAL_TITLE_BASE
+                },
+                "xaxis": {
+                    "title": {"text": "<b>변수</b>", "font": _ARIAL_AXIS_TITLE_FONT}
+                },
+                "yaxis": {
+                    "title": {"text": "<b>변수</b>", "font": _ARIAL_AXIS_TITLE_FONT}
+                },
+                "paper_bgcolor": 'white',
+                "font": _ARIAL_FONT,
+                "margin": {"l": 80, "r": 80, "t": 80, "b": 60}
+            }
+
+            return _figure_dict([heatmap_trace], layout)
             
         except Exception as e:
             return self._create_default_chart(df, f"Heatmap creation failed: {str(e)}")
@@ -1311,53 +1745,116 @@ class ChartService:
             if x_col not in df.columns or y_col not in df.columns:
                 return self._create_default_chart(df, f"Columns not found: {x_col}, {y_col}")
             
-            fig = px.violin(df, x=x_col, y=y_col, box=True, points='all')
-            fig.update_layout(
-                title=f"<b>{x_col}별 {y_col} 바이올린 플롯</b>",
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                paper_bgcolor='white',
-                plot_bgcolor='rgba(248,249,250,0.02)'
-            )
-            return fig.to_dict()
+            violin_trace = {
+                **_PX_TRACE_BASE,
+                "type": "violin",
+                "x": df[x_col].to_numpy(),
+                "y": df[y_col].to_numpy(),
+                "x0": " ", "y0": " ",
+                "alignmentgroup": "True", "offsetgroup": "", "scalegroup": "True",
+                "orientation": _px_orientation(df, x_col, y_col),
+                "box": {"visible": True},
+                "points": "all",
+                "marker": {"color": _PX_COLOR},
+                "hovertemplate": _px_hovertemplate(x_col, y_col),
+            }
+            layout = {
+                **_px_axes_layout(x_col, y_col),
+                "violinmode": "group",
+                "title": {"text": f"<b>{x_col}별 {y_col} 바이올린 플롯</b>"},
+                **_ARIAL_BASE_LAYOUT,
+                "plot_bgcolor": 'rgba(248,249,250,0.02)'
+            }
+            return _figure_dict([violin_trace], layout)
         except Exception as e:
             return self._create_default_chart(df, f"Violin plot creation failed: {str(e)}")
     
     def _create_strip_chart(self, df: pd.DataFrame, x_col: str, y_col: str, chart_config: Dict[str, Any]) -> Dict[str, Any]:
         """Strip plot for distribution with jitter"""
         try:
-            fig = px.strip(df, x=x_col, y=y_col)
-            fig.update_layout(
-                title=f"<b>{x_col}별 {y_col} 스트립 플롯</b>",
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                paper_bgcolor='white'
-            )
-            return fig.to_dict()
+            if x_col not in df.columns or y_col not in df.columns:
+                return self._create_default_chart(df, f"Columns not found: {x_col}, {y_col}")
+            
+            # Strip plot = box trace with only its jittered points visible
+            strip_trace = {
+                **_PX_TRACE_BASE,
+                "type": "box",
+                "x": df[x_col].to_numpy(),
+                "y": df[y_col].to_numpy(),
+                "x0": " ", "y0": " ",
+                "alignmentgroup": "True", "offsetgroup": "",
+                "orientation": _px_orientation(df, x_col, y_col),
+                "boxpoints": "all",
+                "pointpos": 0,
+                "hoveron": "points",
+                "fillcolor": "rgba(255,255,255,0)",
+                "line": {"color": "rgba(255,255,255,0)"},
+                "marker": {"color": _PX_COLOR},
+                "hovertemplate": _px_hovertemplate(x_col, y_col),
+            }
+            layout = {
+                **_px_axes_layout(x_col, y_col),
+                "boxmode": "group",
+                "title": {"text": f"<b>{x_col}별 {y_col} 스트립 플롯</b>"},
+                **_ARIAL_BASE_LAYOUT
+            }
+            return _figure_dict([strip_trace], layout)
         except Exception as e:
             return self._create_default_chart(df, f"Strip plot creation failed: {str(e)}")
     
     def _create_density_contour(self, df: pd.DataFrame, x_col: str, y_col: str, chart_config: Dict[str, Any]) -> Dict[str, Any]:
         """Density contour plot"""
         try:
-            fig = px.density_contour(df, x=x_col, y=y_col)
-            fig.update_layout(
-                title=f"<b>{x_col} vs {y_col} 밀도 등고선</b>",
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                paper_bgcolor='white'
-            )
-            return fig.to_dict()
+            if x_col not in df.columns or y_col not in df.columns:
+                return self._create_default_chart(df, f"Columns not found: {x_col}, {y_col}")
+            
+            # 등고선 모양은 샘플로도 유지되므로 큰 데이터는 샘플링
+            plot_df = _downsample_for_plot(df)
+            contour_trace = {
+                **_PX_TRACE_BASE,
+                "type": "histogram2dcontour",
+                "x": plot_df[x_col].to_numpy(),
+                "y": plot_df[y_col].to_numpy(),
+                "xbingroup": "x", "ybingroup": "y",
+                "contours": {"coloring": "none"},
+                "line": {"color": _PX_COLOR},
+                "hovertemplate": _px_hovertemplate(x_col, y_col, with_count=True),
+            }
+            layout = {
+                **_px_axes_layout(x_col, y_col),
+                "title": {"text": f"<b>{x_col} vs {y_col} 밀도 등고선</b>"},
+                **_ARIAL_BASE_LAYOUT
+            }
+            return _figure_dict([contour_trace], layout)
         except Exception as e:
             return self._create_default_chart(df, f"Density contour creation failed: {str(e)}")
     
     def _create_density_heatmap(self, df: pd.DataFrame, x_col: str, y_col: str, chart_config: Dict[str, Any]) -> Dict[str, Any]:
         """Density heatmap"""
         try:
-            fig = px.density_heatmap(df, x=x_col, y=y_col)
-            fig.update_layout(
-                title=f"<b>{x_col} vs {y_col} 밀도 히트맵</b>",
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                paper_bgcolor='white'
-            )
-            return fig.to_dict()
+            if x_col not in df.columns or y_col not in df.columns:
+                return self._create_default_chart(df, f"Columns not found: {x_col}, {y_col}")
+            
+            heatmap_trace = {
+                "type": "histogram2d",
+                "x": df[x_col].to_numpy(),
+                "y": df[y_col].to_numpy(),
+                "name": "",
+                "xaxis": "x", "yaxis": "y",
+                "xbingroup": "x", "ybingroup": "y",
+                "coloraxis": "coloraxis",
+                "hovertemplate": _px_hovertemplate(x_col, y_col, with_count=True),
+            }
+            layout = {
+                **_px_axes_layout(x_col, y_col),
+                "coloraxis": {
+                    "colorbar": {"title": {"text": "count"}},
+                    "colorscale": _default_template()["layout"]["colorscale"]["sequential"]
+                },
+                "title": {"text": f"<b>{x_col} vs {y_col} 밀도 히트맵</b>"},
+                **_ARIAL_BASE_LAYOUT
+            }
+            return _figure_dict([heatmap_trace], layout)
         except Exception as e:
             return self._create_default_chart(df, f"Density heatmap creation failed: {str(e)}")
     
@@ -1366,34 +1863,44 @@ class ChartService:
     def _create_funnel_chart(self, df: pd.DataFrame, x_col: str, y_col: str, chart_config: Dict[str, Any]) -> Dict[str, Any]:
         """Funnel chart for conversion analysis"""
         try:
-            fig = px.funnel(df, x=y_col, y=x_col)
-            fig.update_layout(
-                title=f"<b>{x_col} 깔때기 차트</b>",
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                paper_bgcolor='white'
-            )
-            return fig.to_dict()
+            if x_col not in df.columns or y_col not in df.columns:
+                return self._create_default_chart(df, f"Columns not found: {x_col}, {y_col}")
+            
+            # Values on x, stages on y (horizontal unless the stage column is numeric too)
+            funnel_trace = {
+                **_PX_TRACE_BASE,
+                "type": "funnel",
+                "x": df[y_col].to_numpy(),
+                "y": df[x_col].to_numpy(),
+                "orientation": _px_orientation(df, y_col, x_col),
+                "marker": {"color": _PX_COLOR},
+                "hovertemplate": _px_hovertemplate(y_col, x_col),
+            }
+            layout = {
+                **_px_axes_layout(y_col, x_col),
+                "title": {"text": f"<b>{x_col} 깔때기 차트</b>"},
+                **_ARIAL_BASE_LAYOUT
+            }
+            return _figure_dict([funnel_trace], layout)
         except Exception as e:
             return self._create_default_chart(df, f"Funnel chart creation failed: {str(e)}")
     
     def _create_waterfall_chart(self, df: pd.DataFrame, x_col: str, y_col: str, chart_config: Dict[str, Any]) -> Dict[str, Any]:
         """Waterfall chart for cumulative effect"""
         try:
+            # Every step is relative except the closing total
+            measure = np.full(len(df), "relative", dtype=object)
+            measure[-1] = "total"
+
             # Use Plotly's waterfall chart
-            fig = go.Figure(go.Waterfall(
+            fig = _arial_figure(go.Waterfall(
                 name="", 
                 orientation="v",
-                measure=["relative"] * (len(df) - 1) + ["total"],
-                x=df[x_col].tolist(),
-                y=df[y_col].tolist(),
+                measure=measure,
+                x=df[x_col].to_numpy(),
+                y=df[y_col].to_numpy(),
                 connector={"line": {"color": "rgb(63, 63, 63)"}},
-            ))
-            
-            fig.update_layout(
-                title=f"<b>{x_col} 폭포 차트</b>",
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                paper_bgcolor='white'
-            )
+            ), f"<b>{x_col} 폭포 차트</b>")
             return fig.to_dict()
         except Exception as e:
             return self._create_default_chart(df, f"Waterfall chart creation failed: {str(e)}")
@@ -1402,11 +1909,7 @@ class ChartService:
         """Treemap for hierarchical data"""
         try:
             fig = px.treemap(df, path=[x_col], values=y_col)
-            fig.update_layout(
-                title=f"<b>{x_col} 트리맵</b>",
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                paper_bgcolor='white'
-            )
+            fig.update_layout(title=f"<b>{x_col} 트리맵</b>", **_ARIAL_BASE_LAYOUT)
             return fig.to_dict()
         except Exception as e:
             return self._create_default_chart(df, f"Treemap creation failed: {str(e)}")
@@ -1415,11 +1918,7 @@ class ChartService:
         """Sunburst chart for hierarchical data"""
         try:
             fig = px.sunburst(df, path=[x_col], values=y_col)
-            fig.update_layout(
-                title=f"<b>{x_col} 선버스트 차트</b>",
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                paper_bgcolor='white'
-            )
+            fig.update_layout(title=f"<b>{x_col} 선버스트 차트</b>", **_ARIAL_BASE_LAYOUT)
             return fig.to_dict()
         except Exception as e:
             return self._create_default_chart(df, f"Sunburst creation failed: {str(e)}")
@@ -1430,7 +1929,7 @@ class ChartService:
         """3D scatter plot"""
         try:
             # Get third column for Z axis
-            numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+            numeric_cols = self._numeric_cols(df)
             z_col = None
             for col in numeric_cols:
                 if col not in [x_col, y_col]:
@@ -1441,11 +1940,7 @@ class ChartService:
                 z_col = y_col  # Fallback
             
             fig = px.scatter_3d(df, x=x_col, y=y_col, z=z_col)
-            fig.update_layout(
-                title=f"<b>3D 산점도: {x_col}, {y_col}, {z_col}</b>",
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                paper_bgcolor='white'
-            )
+            fig.update_layout(title=f"<b>3D 산점도: {x_col}, {y_col}, {z_col}</b>", **_ARIAL_BASE_LAYOUT)
             return fig.to_dict()
         except Exception as e:
             return self._create_default_chart(df, f"3D scatter creation failed: {str(e)}")
@@ -1454,19 +1949,18 @@ class ChartService:
         """3D surface plot"""
         try:
             # Create a pivot table for surface plot
-            numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+            numeric_cols = self._numeric_cols(df)
             if len(numeric_cols) >= 3:
                 z_col = [col for col in numeric_cols if col not in [x_col, y_col]][0]
                 
                 # Create pivot for surface
                 pivot_df = df.pivot_table(values=z_col, index=y_col, columns=x_col, aggfunc='mean')
                 
-                fig = go.Figure(data=[go.Surface(z=pivot_df.values, x=pivot_df.columns, y=pivot_df.index)])
-                fig.update_layout(
-                    title=f"<b>3D 표면 차트: {z_col}</b>",
-                    font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                    paper_bgcolor='white'
-                )
+                fig = _arial_figure([go.Surface(
+                    z=pivot_df.to_numpy(dtype=np.float64),
+                    x=pivot_df.columns.to_numpy(),
+                    y=pivot_df.index.to_numpy()
+                )], f"<b>3D 표면 차트: {z_col}</b>")
                 return fig.to_dict()
             else:
                 return self._create_default_chart(df, "Insufficient numeric columns for surface plot")
@@ -1478,32 +1972,24 @@ class ChartService:
     def _create_candlestick(self, df: pd.DataFrame, x_col: str, y_col: str, chart_config: Dict[str, Any]) -> Dict[str, Any]:
         """Candlestick chart for financial data"""
         try:
-            # Look for OHLC columns
+            # Look for OHLC columns (each column claims the first matching key; last column wins)
+            cols_lower = df.columns.astype(str).str.lower()
             ohlc_cols = {}
-            for col in df.columns:
-                col_lower = col.lower()
-                if 'open' in col_lower:
-                    ohlc_cols['open'] = col
-                elif 'high' in col_lower:
-                    ohlc_cols['high'] = col
-                elif 'low' in col_lower:
-                    ohlc_cols['low'] = col
-                elif 'close' in col_lower:
-                    ohlc_cols['close'] = col
+            claimed = np.zeros(len(cols_lower), dtype=bool)
+            for key in ('open', 'high', 'low', 'close'):
+                mask = cols_lower.str.contains(key, regex=False) & ~claimed
+                claimed |= mask
+                if mask.any():
+                    ohlc_cols[key] = df.columns[mask][-1]
             
             if len(ohlc_cols) >= 4:
-                fig = go.Figure(data=go.Candlestick(
+                fig = _arial_figure(go.Candlestick(
                     x=df[x_col],
                     open=df[ohlc_cols['open']],
                     high=df[ohlc_cols['high']],
                     low=df[ohlc_cols['low']],
                     close=df[ohlc_cols['close']]
-                ))
-                fig.update_layout(
-                    title="<b>캔들스틱 차트</b>",
-                    font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                    paper_bgcolor='white'
-                )
+                ), "<b>캔들스틱 차트</b>")
                 return fig.to_dict()
             else:
                 return self._create_default_chart(df, "OHLC columns not found for candlestick chart")
@@ -1515,14 +2001,10 @@ class ChartService:
     def _create_parallel_coordinates(self, df: pd.DataFrame, x_col: str, y_col: str, chart_config: Dict[str, Any]) -> Dict[str, Any]:
         """Parallel coordinates plot"""
         try:
-            numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()[:6]  # Limit for performance
+            numeric_cols = self._numeric_cols(df)[:6]  # Limit for performance
             if len(numeric_cols) >= 2:
-                fig = px.parallel_coordinates(df, dimensions=numeric_cols)
-                fig.update_layout(
-                    title="<b>평행 좌표 플롯</b>",
-                    font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                    paper_bgcolor='white'
-                )
+                fig = px.parallel_coordinates(_downsample_for_plot(df[numeric_cols]), dimensions=numeric_cols)
+                fig.update_layout(title="<b>평행 좌표 플롯</b>", **_ARIAL_BASE_LAYOUT)
                 return fig.to_dict()
             else:
                 return self._create_default_chart(df, "Insufficient numeric columns for parallel coordinates")
@@ -1532,14 +2014,10 @@ class ChartService:
     def _create_parallel_categories(self, df: pd.DataFrame, x_col: str, y_col: str, chart_config: Dict[str, Any]) -> Dict[str, Any]:
         """Parallel categories plot"""
         try:
-            categorical_cols = df.select_dtypes(include=['object']).columns.tolist()[:4]  # Limit for performance
+            categorical_cols = self._columns_of_dtype(df, 'object')[:4]  # Limit for performance
             if len(categorical_cols) >= 2:
-                fig = px.parallel_categories(df, dimensions=categorical_cols)
-                fig.update_layout(
-                    title="<b>평행 카테고리 플롯</b>",
-                    font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                    paper_bgcolor='white'
-                )
+                fig = px.parallel_categories(df[categorical_cols].astype('category'), dimensions=categorical_cols)
+                fig.update_layout(title="<b>평행 카테고리 플롯</b>", **_ARIAL_BASE_LAYOUT)
                 return fig.to_dict()
             else:
                 return self._create_default_chart(df, "Insufficient categorical columns for parallel categories")
@@ -1552,32 +2030,26 @@ class ChartService:
         """Radar/Spider chart"""
         try:
             # Get numeric columns for radar chart
-            numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()[:8]  # Limit to 8 axes
+            numeric_cols = self._numeric_cols(df)[:8]  # Limit to 8 axes
             
             if len(numeric_cols) < 3:
                 return self._create_default_chart(df, "Need at least 3 numeric columns for radar chart")
             
-            # Take first row or aggregate
-            if len(df) == 1:
-                values = df[numeric_cols].iloc[0].tolist()
-            else:
-                values = df[numeric_cols].mean().tolist()
+            # Take first row or aggregate (NaN-skipping column means, like DataFrame.mean)
+            arr = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            values = arr[0] if arr.shape[0] == 1 else np.nanmean(arr, axis=0)
             
-            fig = go.Figure()
-            fig.add_trace(go.Scatterpolar(
-                r=values,
-                theta=numeric_cols,
-                fill='toself',
-                name='Data'
-            ))
-            
-            fig.update_layout(
+            fig = _arial_figure(
+                go.Scatterpolar(
+                    r=values,
+                    theta=numeric_cols,
+                    fill='toself',
+                    name='Data'
+                ),
+                "<b>레이더 차트</b>",
                 polar=dict(
                     radialaxis=dict(visible=True)
-                ),
-                title="<b>레이더 차트</b>",
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                paper_bgcolor='white'
+                )
             )
             return fig.to_dict()
         except Exception as e:
@@ -1591,18 +2063,15 @@ class ChartService:
             if x_col not in df.columns:
                 return self._create_default_chart(df, f"Column {x_col} not found")
             
-            data = pd.to_numeric(df[x_col], errors='coerce').dropna()
+            data = _numeric_values(df[x_col])
+            data = data[~np.isnan(data)]
             
             if len(data) == 0:
                 return self._create_default_chart(df, f"No numeric data in column {x_col}")
             
             # Create distribution plot using figure factory
-            fig = ff.create_distplot([data.tolist()], [x_col])
-            fig.update_layout(
-                title=f"<b>{x_col} 분포 플롯</b>",
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                paper_bgcolor='white'
-            )
+            fig = ff.create_distplot([data], [x_col])
+            fig.update_layout(title=f"<b>{x_col} 분포 플롯</b>", **_ARIAL_BASE_LAYOUT)
             return fig.to_dict()
         except Exception as e:
             return self._create_default_chart(df, f"Distribution plot creation failed: {str(e)}")
@@ -1611,11 +2080,7 @@ class ChartService:
         """Empirical Cumulative Distribution Function"""
         try:
             fig = px.ecdf(df, x=x_col)
-            fig.update_layout(
-                title=f"<b>{x_col} 누적분포함수 (ECDF)</b>",
-                font=dict(family="Arial, sans-serif", size=12, color='#2C3E50'),
-                paper_bgcolor='white'
-            )
+            fig.update_layout(title=f"<b>{x_col} 누적분포함수 (ECDF)</b>", **_ARIAL_BASE_LAYOUT)
             return fig.to_dict()
         except Exception as e:
             return self._create_default_chart(df, f"ECDF creation failed: {str(e)}")
@@ -1625,15 +2090,13 @@ class ChartService:
     def _create_choropleth_chart(self, df: pd.DataFrame, x_col: str, y_col: str, chart_config: Dict[str, Any]) -> Dict[str, Any]:
         """Choropleth map for geographic data visualization"""
         try:
-            print(f"🗺️ Creating choropleth chart with X: {x_col}, Y: {y_col}")
+            logger.debug("Creating choropleth chart with X: %s, Y: %s", x_col, y_col)
 
             if x_col not in df.columns or y_col not in df.columns:
                 return self._create_default_chart(df, f"Columns not found: {x_col}, {y_col}")
 
-            # Clean and prepare data
-            data = df[[x_col, y_col]].copy()
-            data[y_col] = pd.to_numeric(data[y_col], errors='coerce')
-            data = data.dropna()
+            # Clean and prepare data (assign/dropna already return new frames, no explicit copy)
+            data = df[[x_col, y_col]].assign(**{y_col: _numeric_values(df[y_col])}).dropna()
 
             if len(data) == 0:
                 return self._create_default_chart(df, "No valid data for choropleth")
@@ -1644,120 +2107,71 @@ class ChartService:
             # Check if locations are country codes or names
             sample_locations = data[location_col].astype(str).str.upper().unique()[:5]
 
-            # Common country codes (ISO 3166-1 alpha-2 and alpha-3)
-            country_codes_2 = {'US', 'CN', 'JP', 'DE', 'GB', 'FR', 'IN', 'IT', 'BR', 'CA', 'RU', 'KR', 'ES', 'AU', 'MX', 'ID', 'NL', 'SA', 'TR', 'CH'}
-            country_codes_3 = {'USA', 'CHN', 'JPN', 'DEU', 'GBR', 'FRA', 'IND', 'ITA', 'BRA', 'CAN', 'RUS', 'KOR', 'ESP', 'AUS', 'MEX', 'IDN', 'NLD', 'SAU', 'TUR', 'CHE'}
-
-            # Korean location detection
-            korean_locations = {'서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종', '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주', '한국', '대한민국'}
-
             locationmode = None
             geo_scope = 'world'
 
             # Determine location type
-            if any(loc in country_codes_2 for loc in sample_locations):
+            if not _ISO2_COUNTRY_CODES.isdisjoint(sample_locations):
                 locationmode = 'ISO-3'  # Plotly expects ISO-3 but will handle ISO-2
-                print("📍 Detected country codes (ISO-2)")
-            elif any(loc in country_codes_3 for loc in sample_locations):
+                logger.debug("Detected country codes (ISO-2)")
+            elif not _ISO3_COUNTRY_CODES.isdisjoint(sample_locations):
                 locationmode = 'ISO-3'
-                print("📍 Detected country codes (ISO-3)")
-            elif any(loc in korean_locations for loc in sample_locations):
+                logger.debug("Detected country codes (ISO-3)")
+            elif not _KOREAN_LOCATIONS.isdisjoint(sample_locations):
                 # For Korean locations, we'll use text-based matching
                 locationmode = 'geojson-id'  # Will need custom geojson for Korean regions
                 geo_scope = 'asia'
-                print("📍 Detected Korean locations")
+                logger.debug("Detected Korean locations")
             else:
                 # Try country names
                 locationmode = 'country names'
-                print("📍 Using country names")
+                logger.debug("Using country names")
+
+            hovertemplate = _CHOROPLETH_HOVER.replace('{yname}', str(y_col))
 
             # Create choropleth map
             if locationmode == 'geojson-id' and geo_scope == 'asia':
                 # For Korean regions, create a simplified map
-                fig = go.Figure(data=go.Choropleth(
-                    locations=data[location_col],
-                    z=data[y_col],
-                    locationmode='country names',  # Fallback to country names
-                    text=data[location_col],
-                    colorscale='Viridis',
-                    colorbar=dict(
-                        title=dict(text=y_col, font=dict(size=14)),
-                        tickfont=dict(size=12)
-                    ),
-                    hovertemplate=(
-                        f"<b>%{{text}}</b><br>"
-                        f"<b>{y_col}</b>: %{{z:,.0f}}<br>"
-                        "<extra></extra>"
-                    )
-                ))
-            else:
-                fig = go.Figure(data=go.Choropleth(
-                    locations=data[location_col],
-                    z=data[y_col],
+                locationmode = 'country names'  # Fallback to country names
+
+            fig = go.Figure(
+                data=go.Choropleth(
+                    locations=data[location_col].to_numpy(),
+                    z=data[y_col].to_numpy(dtype=np.float64),
                     locationmode=locationmode,
-                    text=data[location_col],
+                    text=data[location_col].to_numpy(),
                     colorscale='Viridis',
-                    colorbar=dict(
-                        title=dict(text=y_col, font=dict(size=14)),
-                        tickfont=dict(size=12)
-                    ),
-                    hovertemplate=(
-                        f"<b>%{{text}}</b><br>"
-                        f"<b>{y_col}</b>: %{{z:,.0f}}<br>"
-                        "<extra></extra>"
-                    )
-                ))
-
-            fig.update_layout(
-                title=dict(
-                    text=f"<b>{y_col}</b> <span style='color:#6b7280'>분포 by</span> <b>{x_col}</b>",
-                    font=dict(size=20, color='#1f2937', family="Inter, -apple-system, sans-serif"),
-                    x=0.5, xanchor='center'
-                ),
-                geo=dict(
-                    scope=geo_scope,
-                    projection_type='equirectangular',
-                    showframe=False,
-                    showcoastlines=True,
-                    coastlinecolor="rgba(204,204,204,0.4)",
-                    showland=True,
-                    landcolor='rgba(243,244,246,0.3)',
-                    showocean=True,
-                    oceancolor='rgba(219,234,254,0.2)',
-                    showlakes=True,
-                    lakecolor='rgba(219,234,254,0.2)',
-                    projection=dict(
-                        rotation=dict(lon=0, lat=0)
-                    )
+                    colorbar={
+                        "title": {"text": y_col, "font": _CHOROPLETH_COLORBAR_TITLE_FONT},
+                        "tickfont": _CHOROPLETH_COLORBAR_TICKFONT
+                    },
+                    hovertemplate=hovertemplate
                 ),
-                paper_bgcolor='white',
-                font=dict(family="Inter, -apple-system, sans-serif", size=12, color='#374151'),
-                margin=dict(l=0, r=0, t=100, b=0),
-                height=600
+                layout={
+                    **_GEO_LAYOUT_BASE,
+                    "title": {**_GEO_TITLE_BASE, "text": f"<b>{y_col}</b> <span style='color:#6b7280'>분포 by</span> <b>{x_col}</b>"},
+                    "geo": {**_GEO_BASE, "scope": geo_scope, "projection": _CHOROPLETH_PROJECTION}
+                }
             )
 
-            print(f"✅ Successfully created choropleth map with {len(data)} regions")
+            logger.debug("Created choropleth map with %d regions", len(data))
             return fig.to_dict()
 
         except Exception as e:
-            print(f"❌ Choropleth creation failed: {str(e)}")
+            logger.warning("Choropleth creation failed: %s", e)
             return self._create_default_chart(df, f"Choropleth creation failed: {str(e)}")
 
     def _create_scattergeo_chart(self, df: pd.DataFrame, x_col: str, y_col: str, chart_config: Dict[str, Any]) -> Dict[str, Any]:
         """Scatter plot on geographic map"""
         try:
-            print(f"🗺️ Creating scatter geo chart with X: {x_col}, Y: {y_col}")
-
-            # Look for latitude and longitude columns
-            lat_col = None
-            lon_col = None
+            logger.debug("Creating scatter geo chart with X: %s, Y: %s", x_col, y_col)
 
-            for col in df.columns:
-                col_lower = col.lower()
-                if any(keyword in col_lower for keyword in ['lat', 'latitude', '위도']):
-                    lat_col = col
-                elif any(keyword in col_lower for keyword in ['lon', 'lng', 'longitude', '경도']):
-                    lon_col = col
+            # Look for latitude and longitude columns (last match wins)
+            cols_lower = df.columns.astype(str).str.lower()
+            lat_mask = cols_lower.str.contains('lat|위도')
+            lon_mask = cols_lower.str.contains('lon|lng|경도') & ~lat_mask
+            lat_col = df.columns[lat_mask][-1] if lat_mask.any() else None
+            lon_col = df.columns[lon_mask][-1] if lon_mask.any() else None
 
             if not lat_col or not lon_col:
                 # Try to use x_col and y_col as coordinates if they're numeric
@@ -1769,12 +2183,12 @@ class ChartService:
                     return self._create_default_chart(df, "Latitude and longitude columns not found")
 
             # Clean data
-            data = df[[lat_col, lon_col]].copy()
-            data[lat_col] = pd.to_numeric(data[lat_col], errors='coerce')
-            data[lon_col] = pd.to_numeric(data[lon_col], errors='coerce')
-            data = data.dropna()
+            lats = _numeric_values(df[lat_col])
+            lons = _numeric_values(df[lon_col])
+            valid = ~(np.isnan(lats) | np.isnan(lons))
+            lats, lons = lats[valid], lons[valid]
 
-            if len(data) == 0:
+            if len(lats) == 0:
                 return self._create_default_chart(df, "No valid coordinate data")
 
             # Add size column if available
@@ -1785,78 +2199,45 @@ class ChartService:
                     break
 
             if size_col:
-                data[size_col] = pd.to_numeric(df[size_col], errors='coerce').fillna(1)
-                sizes = data[size_col].tolist()
+                sizes = np.nan_to_num(_numeric_values(df[size_col])[valid], nan=1.0)
             else:
-                sizes = [10] * len(data)
-
-            fig = go.Figure(data=go.Scattergeo(
-                lon=data[lon_col],
-                lat=data[lat_col],
-                text=[f"({lat:.2f}, {lon:.2f})" for lat, lon in zip(data[lat_col], data[lon_col])],
-                mode='markers',
-                marker=dict(
-                    size=sizes,
-                    color='rgba(99, 102, 241, 0.8)',
-                    line=dict(width=1, color='white'),
-                    sizemode='diameter',
-                    sizeref=max(sizes) / 50 if sizes else 1
-                ),
-                hovertemplate=(
-                    f"<b>위도</b>: %{{lat}}<br>"
-                    f"<b>경도</b>: %{{lon}}<br>"
-                    f"<b>크기</b>: %{{marker.size}}<br>" if size_col else ""
-                    "<extra></extra>"
-                ),
-                name='위치'
-            ))
+                sizes = np.full(len(lats), 10)
 
-            fig.update_layout(
-                title=dict(
-                    text=f"<b>지리적 분포</b> <span style='color:#6b7280'>({lat_col}, {lon_col})</span>",
-                    font=dict(size=20, color='#1f2937', family="Inter, -apple-system, sans-serif"),
-                    x=0.5, xanchor='center'
-                ),
-                geo=dict(
-                    projection_type='natural earth',
-                    showframe=False,
-                    showcoastlines=True,
-                    coastlinecolor="rgba(204,204,204,0.4)",
-                    showland=True,
-                    landcolor='rgba(243,244,246,0.3)',
-                    showocean=True,
-                    oceancolor='rgba(219,234,254,0.2)',
-                    showlakes=True,
-                    lakecolor='rgba(219,234,254,0.2)'
+            # "(lat, lon)" 라벨을 벡터 연산으로 생성
+            coord_text = np.char.add(
+                np.char.add(np.char.add("(", np.char.mod("%.2f", lats)), ", "),
+                np.char.add(np.char.mod("%.2f", lons), ")"),
+            )
+
+            fig = go.Figure(
+                data=go.Scattergeo(
+                    lon=lons,
+                    lat=lats,
+                    text=coord_text,
+                    mode='markers',
+                    marker={
+                        **_SCATTERGEO_MARKER_BASE,
+                        "size": sizes,
+                        "sizeref": sizes.max() / 50 if len(sizes) else 1
+                    },
+                    hovertemplate=_SCATTERGEO_HOVER_WITH_SIZE if size_col else _SCATTERGEO_HOVER_NO_SIZE,
+                    name='위치'
                 ),
-                paper_bgcolor='white',
-                font=dict(family="Inter, -apple-system, sans-serif", size=12, color='#374151'),
-                margin=dict(l=0, r=0, t=100, b=0),
-                height=600
+                layout={
+                    **_GEO_LAYOUT_BASE,
+                    "title": {**_GEO_TITLE_BASE, "text": f"<b>지리적 분포</b> <span style='color:#6b7280'>({lat_col}, {lon_col})</span>"},
+                    "geo": _SCATTERGEO_GEO
+                }
             )
 
-            print(f"✅ Successfully created scatter geo chart with {len(data)} points")
+            logger.debug("Created scatter geo chart with %d points", len(lats))
             return fig.to_dict()
 
         except Exception as e:
-            print(f"❌ Scatter geo creation failed: {str(e)}")
+            logger.warning("Scatter geo creation failed: %s", e)
             return self._create_default_chart(df, f"Scatter geo creation failed: {str(e)}")
 
     def _create_default_chart(self, df: pd.DataFrame, error_msg: str) -> Dict[str, Any]:
         """기본 차트 (에러 시)"""
-        fig = go.Figure(data=[
-            go.Bar(
-                x=['Error'],
-                y=[1],
-                text=[f"Chart generation failed: {error_msg}"],
-                textposition='auto',
-                marker_color='rgb(200, 100, 100)'
-            )
-        ])
-        
-        fig.update_layout(
-            title="Chart Generation Error",
-            showlegend=False
-        )
-        
-        return fig.to_dict()
\ No newline at end of file
+        # 같은 에러 메시지는 캐시된 figure를 재사용 (_figure_dict와 같이 중첩 dict까지 복사해 캐시를 분리)
+        return _detached(_default_chart_for(error_msg))
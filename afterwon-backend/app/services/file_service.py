@@ -1,14 +1,51 @@
 import pandas as pd
+import pyarrow as pa
 import os
+import asyncio
+import codecs
+import csv
+import re
+import threading
 import uuid
-import json
-from datetime import datetime
+import orjson
+from datetime import datetime, date
 from typing import Optional, Dict, Any
+from cachetools import LRUCache
 from ..core.config import settings
 
+# Common null representations in uploaded text columns (replaced with pd.NA)
+_NULL_STRINGS = ('', 'null', 'NULL', 'None', 'NaN', 'nan', '-', 'N/A', 'n/a', 'NA')
+
+class _NumericCharTable(dict):
+    r"""str.translate table keeping decimal digits, '.' and '-' (same set as the regex [\d.-]).
+
+    Each code point is classified once on first sight and cached, so translate never re-checks it.
+    """
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        kept = codepoint if char.isdecimal() or char in '.-' else None
+        self[codepoint] = kept
+        return kept
+
+_NUMERIC_CHARS = _NumericCharTable()
+
+# Runs of whitespace inside column names collapse to a single space
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def _normalize_columns(columns) -> list:
+    """Strip column names and collapse inner whitespace in one pass (non-string names are kept as-is)"""
+    return [_WHITESPACE_RE.sub(' ', c.strip()) if isinstance(c, str) else c for c in columns]
+
 class FileService:
     _instance = None
     _file_metadata = {}
+    _metadata_dirty = False
+    _flush_task: Optional[asyncio.Task] = None
+    # Guards metadata mutation and snapshotting on the event loop; the file write itself runs in a thread
+    _metadata_lock = asyncio.Lock()
+    _save_lock = threading.Lock()
+    # file_id -> cleaned DataFrame; repeat questions on the same file skip re-reading and re-cleaning
+    _df_cache = LRUCache(maxsize=16)
     
     def __new__(cls):
         if cls._instance is None:
@@ -25,6 +62,11 @@ class FileService:
         """Get metadata for a specific file by file_id"""
         return FileService._file_metadata.get(file_id)
     
+    @staticmethod
+    def _parquet_sidecar_path(file_path: str) -> str:
+        """Path of the cleaned-DataFrame Parquet copy stored next to an upload"""
+        return file_path + '.parquet'
+    
     def _get_metadata_file_path(self):
         """Get the path for the metadata file"""
         return os.path.join(settings.UPLOAD_FOLDER, "file_metadata.json")
@@ -34,8 +76,8 @@ class FileService:
         metadata_file = self._get_metadata_file_path()
         if os.path.exists(metadata_file):
             try:
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    loaded_metadata = json.load(f)
+                with open(metadata_file, 'rb') as f:
+                    loaded_metadata = orjson.loads(f.read())
                 
                 # Validate that files still exist
                 valid_metadata = {}
@@ -54,40 +96,65 @@ class FileService:
         else:
             print("📁 No existing metadata file found")
     
-    def _save_metadata(self):
-        """Save file metadata to disk"""
+    def _save_metadata(self, metadata: Dict[str, Any]):
+        """Save a snapshot of the file metadata to disk"""
         metadata_file = self._get_metadata_file_path()
         try:
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(FileService._file_metadata, f, ensure_ascii=False, indent=2)
-            print(f"💾 Saved metadata for {len(FileService._file_metadata)} files")
+            data = orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            # 임시 파일에 쓴 뒤 교체해서 저장 중 중단돼도 기존 메타데이터가 깨지지 않도록 함
+            # (종료 시 flush와 백그라운드 flush가 같은 임시 파일을 동시에 쓰지 않도록 잠금)
+            with FileService._save_lock:
+                tmp_file = metadata_file + '.tmp'
+                with open(tmp_file, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_file, metadata_file)
+            print(f"💾 Saved metadata for {len(metadata)} files")
         except Exception as e:
             print(f"❌ Error saving metadata: {e}")
     
+    def _schedule_metadata_flush(self):
+        """Mark metadata dirty and write it once after METADATA_FLUSH_INTERVAL_MS (coalesces bursts of uploads)
+
+        Call while holding _metadata_lock.
+        """
+        FileService._metadata_dirty = True
+        if FileService._flush_task is None or FileService._flush_task.done():
+            FileService._flush_task = asyncio.get_running_loop().create_task(self._flush_metadata_later())
+    
+    async def _flush_metadata_later(self):
+        # 쓰는 도중 들어온 변경도 저장되도록, 더 이상 변경이 없을 때까지 반복
+        # (종료 판단은 잠금 안에서 하므로 그 뒤의 업로드는 새 flush 작업을 예약함)
+        while True:
+            await asyncio.sleep(settings.METADATA_FLUSH_INTERVAL_MS / 1000)
+            # 잠금 안에서 스냅샷만 떠두고, 직렬화/디스크 쓰기는 이벤트 루프 밖에서 수행
+            async with FileService._metadata_lock:
+                snapshot = self._take_metadata_snapshot()
+                if snapshot is None:
+                    return
+            await asyncio.to_thread(self._save_metadata, snapshot)
+    
+    def _take_metadata_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Copy pending metadata and clear the dirty flag; None if nothing changed"""
+        if not FileService._metadata_dirty:
+            return None
+        FileService._metadata_dirty = False
+        return dict(FileService._file_metadata)
+    
+    def flush_metadata(self):
+        """Write pending metadata changes to disk now (also called on shutdown)"""
+        snapshot = self._take_metadata_snapshot()
+        if snapshot is not None:
+            self._save_metadata(snapshot)
+    
     async def save_and_parse_file(self, file_content: bytes, filename: str) -> Dict[str, Any]:
         """파일을 저장하고 파싱하여 메타데이터 반환"""
         file_id = str(uuid.uuid4())
         file_path = os.path.join(settings.UPLOAD_FOLDER, f"{file_id}_{filename}")
         
-        # 파일 저장
-        with open(file_path, "wb") as f:
-            f.write(file_content)
-        
-        # 파일 파싱
+        # 파일 파싱 (파일 저장/파싱/정제/EDA는 CPU·디스크 작업이라 이벤트 루프를 막지 않도록 스레드에서 실행)
         try:
-            if filename.endswith('.csv'):
-                df = self._read_csv_robust(file_path)
-                    
-            elif filename.endswith(('.xlsx', '.xls')):
-                df = self._read_excel_robust(file_path)
-            else:
-                raise ValueError("지원하지 않는 파일 형식입니다.")
-            
-            # Data cleaning and preprocessing
-            df_cleaned = self._clean_dataframe(df)
-            
-            # 종합적인 EDA 수행
-            eda_results = self._perform_eda(df_cleaned)
+            df_cleaned, eda_results = await asyncio.to_thread(self._save_and_analyze, file_content, filename, file_path)
+            FileService._df_cache[file_id] = df_cleaned
             
             metadata = {
                 "file_id": file_id,
@@ -101,25 +168,55 @@ class FileService:
                 "file_path": file_path
             }
             
-            # 메타데이터 저장
-            self.file_metadata[file_id] = {
-                "filename": filename,
-                "file_path": file_path,
-                "file_size": len(file_content),  # 파일 크기 추가
-                "uploaded_at": datetime.now().isoformat()
-            }
-            
-            # 메타데이터를 디스크에 저장
-            self._save_metadata()
+            # 메타데이터 저장 (변경과 flush 예약은 잠금 안에서 함께 수행)
+            async with FileService._metadata_lock:
+                self.file_metadata[file_id] = {
+                    "filename": filename,
+                    "file_path": file_path,
+                    "file_size": len(file_content),  # 파일 크기 추가
+                    "uploaded_at": datetime.now().isoformat()
+                }
+                
+                # 메타데이터를 디스크에 저장 (짧은 시간 안의 여러 업로드는 한 번에 기록)
+                self._schedule_metadata_flush()
             
             return metadata
         
         except Exception as e:
             # 파일 삭제
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            for path in (file_path, self._parquet_sidecar_path(file_path)):
+                if os.path.exists(path):
+                    os.remove(path)
             raise e
     
+    def _save_and_analyze(self, file_content: bytes, filename: str, file_path: str) -> tuple:
+        """Write the upload to disk, parse/clean it and run EDA (synchronous; run off the event loop)"""
+        # 파일 저장
+        with open(file_path, "wb") as f:
+            f.write(file_content)
+        
+        if filename.endswith('.csv'):
+            df = self._read_csv_robust(file_path)
+                
+        elif filename.endswith(('.xlsx', '.xls')):
+            df = self._read_excel_robust(file_path)
+        else:
+            raise ValueError("지원하지 않는 파일 형식입니다.")
+        
+        # Data cleaning and preprocessing
+        df_cleaned = self._clean_dataframe(df)
+        
+        # 정제된 결과를 Parquet으로 함께 저장해 재로딩 시 파싱/정제를 건너뜀
+        try:
+            df_cleaned.to_parquet(self._parquet_sidecar_path(file_path), compression='zstd')
+        except Exception as e:
+            print(f"⚠️ Could not write Parquet copy for {filename}: {e}")
+        
+        # 종합적인 EDA 수행
+        eda_results = self._perform_eda(df_cleaned)
+        
+        return df_cleaned, eda_results
+    
     def get_dataframe(self, file_id: str) -> Optional[pd.DataFrame]:
         """파일 ID로 DataFrame 반환"""
         # 메타데이터에서 파일 정보 조회
@@ -133,63 +230,67 @@ class FileService:
         if not os.path.exists(file_path):
             return None
         
+        # 캐시된 DataFrame은 복사본을 반환해 호출 측 수정이 캐시에 남지 않도록 함
+        cached = FileService._df_cache.get(file_id)
+        if cached is not None:
+            return cached.copy()
+        
         try:
-            if filename.endswith('.csv'):
-                df = self._read_csv_robust(file_path)
-                        
-            elif filename.endswith(('.xlsx', '.xls')):
-                df = self._read_excel_robust(file_path)
+            sidecar_path = self._parquet_sidecar_path(file_path)
+            if os.path.exists(sidecar_path):
+                # Already cleaned at upload time
+                df_cleaned = pd.read_parquet(sidecar_path)
             else:
-                return None
-                
-            # Apply the same cleaning as during upload
-            return self._clean_dataframe(df)
+                if filename.endswith('.csv'):
+                    df = self._read_csv_robust(file_path)
+                            
+                elif filename.endswith(('.xlsx', '.xls')):
+                    df = self._read_excel_robust(file_path)
+                else:
+                    return None
+                    
+                # Apply the same cleaning as during upload
+                df_cleaned = self._clean_dataframe(df)
+            
+            FileService._df_cache[file_id] = df_cleaned
+            return df_cleaned.copy()
             
         except Exception:
             return None
     
     def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and preprocess the DataFrame for better AI analysis"""
-        cleaned_df = df.copy()
-        
-        # Remove completely empty rows and columns
-        cleaned_df = cleaned_df.dropna(how='all').dropna(how='all', axis=1)
+        # Remove completely empty rows and columns (dropna already returns a new frame, no upfront copy needed)
+        cleaned_df = df.dropna(how='all').dropna(how='all', axis=1)
         
         # Remove duplicate rows
         if len(cleaned_df) > 1:
             cleaned_df = cleaned_df.drop_duplicates()
         
-        # Clean column names
-        cleaned_df.columns = cleaned_df.columns.str.strip().str.replace(r'\s+', ' ', regex=True)
+        # Clean column names (readers leave headers untouched; this is the single normalization pass)
+        cleaned_df.columns = _normalize_columns(cleaned_df.columns)
         
         # Handle common data issues
         for col in cleaned_df.columns:
-            if cleaned_df[col].dtype == 'object':
+            # pandas 3 reads text as the 'str' dtype, not object
+            if pd.api.types.is_object_dtype(cleaned_df[col]) or pd.api.types.is_string_dtype(cleaned_df[col]):
                 # Strip whitespace from string columns
                 cleaned_df[col] = cleaned_df[col].astype(str).str.strip()
                 
                 # Replace common null representations with actual NaN
-                null_values = ['', 'null', 'NULL', 'None', 'NaN', 'nan', '-', 'N/A', 'n/a', 'NA']
-                cleaned_df[col] = cleaned_df[col].replace(null_values, pd.NA)
+                cleaned_df[col] = cleaned_df[col].where(~cleaned_df[col].isin(_NULL_STRINGS), pd.NA)
                 
                 # Handle mixed case inconsistencies for categorical data
-                if cleaned_df[col].nunique() < len(cleaned_df) * 0.5:  # Likely categorical
+                # (one value_counts pass gives both the unique count and the per-variant counts)
+                variant_counts = cleaned_df[col].dropna().value_counts(sort=False)
+                if len(variant_counts) < len(cleaned_df) * 0.5:  # Likely categorical
                     # Standardize case for categories with low cardinality
-                    value_counts = cleaned_df[col].str.lower().value_counts()
-                    if len(value_counts) <= 50:  # Only for reasonably sized categories
+                    lower_keys = variant_counts.index.str.lower()
+                    if lower_keys.nunique() <= 50:  # Only for reasonably sized categories
                         # Create a mapping from various cases to the most common case
-                        case_mapping = {}
-                        for value in cleaned_df[col].dropna().unique():
-                            if pd.notna(value):
-                                lower_val = str(value).lower()
-                                # Find the most common case variation
-                                similar_values = [v for v in cleaned_df[col].dropna().unique() 
-                                                if str(v).lower() == lower_val]
-                                if similar_values:
-                                    # Use the most frequent case variation
-                                    most_common = max(similar_values, key=lambda x: (cleaned_df[col] == x).sum())
-                                    for similar in similar_values:
-                                        case_mapping[similar] = most_common
+                        # (counts in first-appearance order, so ties keep the earliest variation)
+                        most_common = variant_counts.groupby(lower_keys, sort=False).idxmax()
+                        case_mapping = dict(zip(variant_counts.index, most_common.loc[lower_keys]))
                         
                         cleaned_df[col] = cleaned_df[col].map(case_mapping).fillna(cleaned_df[col])
         
@@ -198,10 +299,26 @@ class FileService:
         
         return cleaned_df
     
+    @staticmethod
+    def _to_records(df: pd.DataFrame) -> list:
+        """Row dicts via Arrow (faster than to_dict('records'); missing values become None instead of NaN)"""
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False).to_pylist()
+        except (pa.ArrowException, ValueError, TypeError):
+            # Mixed-type object columns or duplicate column names can't go through Arrow
+            return df.to_dict('records')
+    
     def _perform_eda(self, df: pd.DataFrame) -> Dict[str, Any]:
         """종합적인 탐색적 데이터 분석 수행"""
         eda = {}
         
+        # 전체 프레임을 훑는 집계는 한 번만 계산해서 재사용
+        n_rows, n_cols = df.shape
+        missing_data = df.isnull().sum()
+        total_missing = int(missing_data.sum())
+        duplicate_count = int(df.duplicated().sum())
+        missing_ratio = total_missing / (n_rows * n_cols)
+        
         # 기본 정보
         eda["basic_info"] = {
             "shape": df.shape,
@@ -212,16 +329,15 @@ class FileService:
         
         # 데이터 미리보기 - Return all data for table display
         eda["preview"] = {
-            "head": df.to_dict('records'),  # Return all rows instead of just head(5)
-            "tail": df.tail(3).to_dict('records')
+            "head": self._to_records(df),  # Return all rows instead of just head(5)
+            "tail": self._to_records(df.tail(3))
         }
         
         # 결측값 분석
-        missing_data = df.isnull().sum()
         eda["missing_data"] = {
-            "total_missing": int(missing_data.sum()),
+            "total_missing": total_missing,
             "missing_by_column": missing_data[missing_data > 0].to_dict(),
-            "missing_percentage": (missing_data / len(df) * 100)[missing_data > 0].round(2).to_dict()
+            "missing_percentage": (missing_data / n_rows * 100)[missing_data > 0].round(2).to_dict()
         }
         
         # 데이터 타입 분석
@@ -243,32 +359,36 @@ class FileService:
             numeric_stats = df[numeric_cols].describe()
             eda["numeric_statistics"] = {
                 "summary": numeric_stats.round(2).to_dict(),
-                "correlation_matrix": df[numeric_cols].corr().round(3).to_dict() if len(numeric_cols) > 1 else {}
+                # 컬럼이 너무 많으면 O(k²·n) 상관행렬은 생략
+                "correlation_matrix": df[numeric_cols].corr().round(3).to_dict() if 1 < len(numeric_cols) <= 50 else {}
             }
         
         # 범주형 컬럼 분석
         if categorical_cols:
             categorical_stats = {}
             for col in categorical_cols[:5]:  # 상위 5개 컬럼만 분석
-                value_counts = df[col].value_counts().head(10)
+                # value_counts 한 번으로 고유값 수/상위값/최빈값을 모두 계산
+                value_counts = df[col].value_counts()
+                top_count = value_counts.iloc[0] if len(value_counts) else 0
                 categorical_stats[col] = {
-                    "unique_count": df[col].nunique(),
-                    "top_values": value_counts.to_dict(),
-                    "most_frequent": df[col].mode().iloc[0] if not df[col].mode().empty else None
+                    "unique_count": int((value_counts > 0).sum()),
+                    "top_values": value_counts.head(10).to_dict(),
+                    # mode()와 동일하게 최빈값이 여러 개면 정렬 순서상 첫 값
+                    "most_frequent": value_counts.index[value_counts == top_count].sort_values()[0] if top_count > 0 else None
                 }
             eda["categorical_statistics"] = categorical_stats
         
         # 중복 데이터 분석
         eda["duplicates"] = {
-            "duplicate_rows": int(df.duplicated().sum()),
-            "duplicate_percentage": round(df.duplicated().sum() / len(df) * 100, 2)
+            "duplicate_rows": duplicate_count,
+            "duplicate_percentage": round(duplicate_count / n_rows * 100, 2)
         }
         
         # 데이터 품질 지표
         eda["data_quality"] = {
-            "completeness": round((1 - df.isnull().sum().sum() / (df.shape[0] * df.shape[1])) * 100, 2),
-            "uniqueness": round((1 - df.duplicated().sum() / len(df)) * 100, 2),
-            "overall_quality": "높음" if df.isnull().sum().sum() / (df.shape[0] * df.shape[1]) < 0.05 else "보통"
+            "completeness": round((1 - missing_ratio) * 100, 2),
+            "uniqueness": round((1 - duplicate_count / n_rows) * 100, 2),
+            "overall_quality": "높음" if missing_ratio < 0.05 else "보통"
         }
         
         # 추천 분석 방향
@@ -286,10 +406,67 @@ class FileService:
         
         return eda
     
+    _CSV_ENCODINGS = ('utf-8', 'utf-8-sig', 'cp949', 'euc-kr', 'latin-1', 'iso-8859-1')
+    _CSV_DELIMITERS = (',', ';', '\t', '|')
+    
+    def _sniff_csv_format(self, file_path: str, head_size: int = 65536) -> Optional[tuple]:
+        """Guess (encoding, delimiter) from the first 64 KB instead of probing every combination with pandas"""
+        with open(file_path, 'rb') as f:
+            head = f.read(head_size)
+        
+        for encoding in self._CSV_ENCODINGS:
+            try:
+                # Incremental decode so a multi-byte character cut at the 64 KB boundary is not an error
+                text = codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+                break
+            except UnicodeDecodeError:
+                continue
+        else:
+            return None
+        
+        # Only sniff complete lines
+        if len(head) == head_size and '\n' in text:
+            text = text[:text.rindex('\n')]
+        try:
+            dialect = csv.Sniffer().sniff(text, delimiters=''.join(self._CSV_DELIMITERS))
+        except csv.Error:
+            return None
+        return encoding, dialect.delimiter
+    
+    def _read_csv_fast(self, file_path: str, encoding: str, delimiter: str) -> pd.DataFrame:
+        """Multithreaded pyarrow CSV read, falling back to the C engine for files pyarrow rejects"""
+        try:
+            df = pd.read_csv(file_path, encoding=encoding, delimiter=delimiter, engine='pyarrow')
+        except (ImportError, ValueError, pa.ArrowException):
+            return pd.read_csv(file_path, encoding=encoding, delimiter=delimiter)
+        
+        # pyarrow keeps duplicate and empty header names as-is; the C engine mangles them ('a.1', 'Unnamed: 0')
+        # and the rest of the pipeline relies on unique column labels
+        if df.columns.has_duplicates or (df.columns == '').any():
+            return pd.read_csv(file_path, encoding=encoding, delimiter=delimiter)
+        
+        # pyarrow infers date-only columns as Python date objects; use datetime64 like the rest of the pipeline
+        for col in df.columns[df.dtypes == object]:
+            valid = df[col].dropna()
+            if len(valid) and isinstance(valid.iat[0], date):
+                df[col] = pd.to_datetime(df[col], errors='coerce')
+        return df
+    
     def _read_csv_robust(self, file_path: str) -> pd.DataFrame:
         """Robust CSV reading with encoding and delimiter detection"""
-        encodings = ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr', 'latin-1', 'iso-8859-1']
-        delimiters = [',', ';', '\t', '|']
+        # Single read with the sniffed format; the probe loop below only runs if that fails
+        sniffed = self._sniff_csv_format(file_path)
+        if sniffed is not None:
+            encoding, delimiter = sniffed
+            try:
+                df = self._read_csv_fast(file_path, encoding, delimiter)
+                if len(df.columns) > 1:
+                    return self._optimize_dtypes(df)
+            except (UnicodeDecodeError, pd.errors.EmptyDataError, pd.errors.ParserError):
+                pass
+        
+        encodings = self._CSV_ENCODINGS
+        delimiters = self._CSV_DELIMITERS
         
         # Try different combinations of encoding and delimiter
         for encoding in encodings:
@@ -300,11 +477,8 @@ class FileService:
                     
                     # Check if parsing was successful (more than 1 column or reasonable data)
                     if len(sample.columns) > 1 or (len(sample.columns) == 1 and not sample.iloc[0, 0].count(delimiter) > 2):
-                        # Read the full file
-                        df = pd.read_csv(file_path, encoding=encoding, delimiter=delimiter)
-                        
-                        # Clean column names
-                        df.columns = df.columns.str.strip()
+                        # Read the full file (pyarrow parse, same as the sniffed path)
+                        df = self._read_csv_fast(file_path, encoding, delimiter)
                         
                         # Basic data type optimization
                         df = self._optimize_dtypes(df)
@@ -317,108 +491,129 @@ class FileService:
         # If all combinations fail, try pandas' automatic detection
         try:
             df = pd.read_csv(file_path, encoding='utf-8', sep=None, engine='python')
-            df.columns = df.columns.str.strip()
             return self._optimize_dtypes(df)
         except Exception as e:
             raise ValueError(f"CSV 파일을 읽을 수 없습니다. 파일 형식을 확인해주세요. 오류: {str(e)}")
     
     def _read_excel_robust(self, file_path: str) -> pd.DataFrame:
         """Robust Excel reading with sheet detection and error handling"""
-        try:
-            # Try to read the first sheet
-            df = pd.read_excel(file_path, sheet_name=0, engine='openpyxl')
-            
-            # Clean column names
-            df.columns = df.columns.str.strip()
-            
-            # Remove completely empty rows and columns
-            df = df.dropna(how='all').dropna(how='all', axis=1)
-            
-            # Basic data type optimization
-            df = self._optimize_dtypes(df)
-            
-            return df
-            
-        except Exception as e:
-            # Try with xlrd engine for older Excel files
+        # calamine (Rust) is much faster and lighter than openpyxl; xlrd covers older .xls files
+        first_error = None
+        for engine in ('calamine', 'openpyxl', 'xlrd'):
             try:
-                df = pd.read_excel(file_path, sheet_name=0, engine='xlrd')
-                df.columns = df.columns.str.strip()
+                # Read the first sheet
+                df = pd.read_excel(file_path, sheet_name=0, engine=engine)
+                
+                # Remove completely empty rows and columns
                 df = df.dropna(how='all').dropna(how='all', axis=1)
+                
+                # Basic data type optimization
                 return self._optimize_dtypes(df)
-            except Exception:
-                raise ValueError(f"Excel 파일을 읽을 수 없습니다. 파일이 손상되었거나 지원하지 않는 형식일 수 있습니다. 오류: {str(e)}")
+                
+            except ImportError:
+                # Optional engine not installed; try the next one
+                continue
+            except Exception as e:
+                first_error = first_error or e
+        
+        raise ValueError(f"Excel 파일을 읽을 수 없습니다. 파일이 손상되었거나 지원하지 않는 형식일 수 있습니다. 오류: {str(first_error)}")
     
     def _optimize_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
         """Optimize data types for better memory usage and analysis"""
-        optimized_df = df.copy()
+        # Converted columns are collected by position and the frame is built once at the end;
+        # per-column assignment re-consolidated the BlockManager on every write
+        n_rows = len(df)
+        new_cols = {}
+        changed = False
         
-        for col in optimized_df.columns:
+        for position, col in enumerate(df.columns):
+            series = df.iloc[:, position]
+            converted = series
+            
             # Skip if column is already datetime
-            if pd.api.types.is_datetime64_any_dtype(optimized_df[col]):
-                continue
+            if pd.api.types.is_datetime64_any_dtype(series):
+                pass
                 
             # Try to convert object columns to more specific types
-            if optimized_df[col].dtype == 'object':
-                # Check if column name suggests it's a date column
-                is_likely_date = any(date_indicator in col.lower() for date_indicator in 
-                                   ['date', 'time', 'day', 'month', 'year', 'created', 'updated', 'timestamp'])
-                
-                # Try datetime conversion first if column name suggests date
-                if is_likely_date:
-                    try:
-                        datetime_version = self._smart_datetime_conversion(optimized_df[col])
-                        # For date columns, use lower threshold (60% instead of 80%)
-                        if datetime_version.notna().sum() / len(optimized_df) > 0.6:
-                            optimized_df[col] = datetime_version
-                            continue
-                    except:
-                        pass
-                
-                # Try to convert to numeric
-                try:
-                    # Remove common non-numeric characters and try conversion
-                    cleaned = optimized_df[col].astype(str).str.replace(r'[^\d.-]', '', regex=True)
-                    numeric_version = pd.to_numeric(cleaned, errors='coerce')
-                    
-                    # If more than 80% of values can be converted to numeric, use it
-                    if numeric_version.notna().sum() / len(optimized_df) > 0.8:
-                        optimized_df[col] = numeric_version
-                        continue
-                except:
-                    pass
-                
-                # Try to convert to datetime with enhanced parsing (for non-date named columns)
-                if not is_likely_date:
-                    try:
-                        datetime_version = self._smart_datetime_conversion(optimized_df[col])
-                        # If more than 80% of values can be converted to datetime, use it
-                        if datetime_version.notna().sum() / len(optimized_df) > 0.8:
-                            optimized_df[col] = datetime_version
-                            continue
-                    except:
-                        pass
-                
-                # For categorical data with few unique values, convert to category
-                unique_ratio = optimized_df[col].nunique() / len(optimized_df)
-                if unique_ratio < 0.5 and optimized_df[col].nunique() < 100:
-                    optimized_df[col] = optimized_df[col].astype('category')
+            elif series.dtype == 'object':
+                converted = self._optimize_object_column(col, series, n_rows)
             
             # Optimize numeric types
-            elif pd.api.types.is_integer_dtype(optimized_df[col]):
+            elif pd.api.types.is_integer_dtype(series):
                 # Try to downcast integers
-                optimized_df[col] = pd.to_numeric(optimized_df[col], downcast='integer')
+                converted = pd.to_numeric(series, downcast='integer')
             
-            elif pd.api.types.is_float_dtype(optimized_df[col]):
+            elif pd.api.types.is_float_dtype(series):
                 # Try to downcast floats
-                optimized_df[col] = pd.to_numeric(optimized_df[col], downcast='float')
+                converted = pd.to_numeric(series, downcast='float')
+            
+            new_cols[position] = converted
+            changed = changed or converted is not series
+        
+        if not changed:
+            return df.copy(deep=False)
         
+        optimized_df = pd.DataFrame(new_cols, index=df.index)
+        optimized_df.columns = df.columns
         return optimized_df
     
+    def _optimize_object_column(self, col, series: pd.Series, n_rows: int) -> pd.Series:
+        """Pick the best dtype for one object column (datetime, numeric or category); returns series itself if unchanged"""
+        # Check if column name suggests it's a date column
+        is_likely_date = any(date_indicator in str(col).lower() for date_indicator in 
+                           ['date', 'time', 'day', 'month', 'year', 'created', 'updated', 'timestamp'])
+        
+        # Try datetime conversion first if column name suggests date
+        if is_likely_date and self._sample_parses_as_datetime(series, 0.6):
+            try:
+                datetime_version = self._smart_datetime_conversion(series)
+                # For date columns, use lower threshold (60% instead of 80%)
+                if datetime_version.notna().sum() / n_rows > 0.6:
+                    return datetime_version
+            except:
+                pass
+        
+        # Try to convert to numeric
+        try:
+            # Remove common non-numeric characters and try conversion
+            cleaned = series.astype(str).map(lambda value: value.translate(_NUMERIC_CHARS))
+            numeric_version = pd.to_numeric(cleaned, errors='coerce')
+            
+            # If more than 80% of values can be converted to numeric, use it
+            if numeric_version.notna().sum() / n_rows > 0.8:
+                return numeric_version
+        except:
+            pass
+        
+        # Try to convert to datetime with enhanced parsing (for non-date named columns)
+        if not is_likely_date and self._sample_parses_as_datetime(series, 0.8):
+            try:
+                datetime_version = self._smart_datetime_conversion(series)
+                # If more than 80% of values can be converted to datetime, use it
+                if datetime_version.notna().sum() / n_rows > 0.8:
+                    return datetime_version
+            except:
+                pass
+        
+        # For categorical data with few unique values, convert to category
+        n_unique = series.nunique()
+        if n_unique / n_rows < 0.5 and n_unique < 100:
+            return series.astype('category')
+        
+        return series
+    
+    def _sample_parses_as_datetime(self, series: pd.Series, threshold: float, sample_size: int = 100) -> bool:
+        """Cheap pre-check on the first non-null values before parsing the whole column as dates"""
+        sample = series.dropna().head(sample_size)
+        if sample.empty:
+            return False
+        try:
+            return self._smart_datetime_conversion(sample).notna().mean() > threshold
+        except:
+            return False
+    
     def _smart_datetime_conversion(self, series: pd.Series) -> pd.Series:
         """Enhanced datetime conversion with support for various date formats"""
-        import re
-        
         # First try standard pandas datetime conversion
         try:
             standard_conversion = pd.to_datetime(series, errors='coerce')
@@ -427,63 +622,34 @@ class FileService:
         except:
             pass
         
-        # Handle custom formats like MDDYYYY, MMDDYYYY, etc.
-        def parse_custom_date(date_str):
-            if pd.isna(date_str) or date_str == '':
-                return pd.NaT
-            
-            # Convert to string and remove any non-digits
-            date_str = str(date_str).strip()
-            
-            # Handle purely numeric date formats (MDDYYYY, MMDDYYYY)
-            if re.match(r'^\d{7,8}$', date_str):
-                # Handle formats like 8292025 (MDDYYYY) or 09112025 (MMDDYYYY)
-                if len(date_str) == 7:  # MDDYYYY
-                    month = date_str[0:1]
-                    day = date_str[1:3]
-                    year = date_str[3:7]
-                elif len(date_str) == 8:  # MMDDYYYY
-                    month = date_str[0:2]
-                    day = date_str[2:4]
-                    year = date_str[4:8]
-                else:
-                    return pd.NaT
-                
-                try:
-                    # Construct proper date string
-                    formatted_date = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                    return pd.to_datetime(formatted_date, errors='coerce')
-                except:
-                    return pd.NaT
+        # Handle custom formats like MDDYYYY, MMDDYYYY, etc. (vectorized per format bucket)
+        def parse_custom_dates(values: pd.Series) -> pd.Series:
+            date_str = values.astype(str).str.strip()
+            missing = (values.isna() | (date_str == '')).to_numpy()
             
-            # Handle other potential formats
-            # YYYYMMDD
-            if re.match(r'^\d{8}$', date_str) and date_str.startswith('20'):
-                try:
-                    return pd.to_datetime(date_str, format='%Y%m%d', errors='coerce')
-                except:
-                    pass
+            # Handle purely numeric date formats: 8292025 (MDDYYYY) or 09112025 (MMDDYYYY)
+            is_mddyyyy = date_str.str.fullmatch(r'\d{7}').fillna(False).to_numpy() & ~missing
+            is_mmddyyyy = date_str.str.fullmatch(r'\d{8}').fillna(False).to_numpy() & ~missing
+            other = ~(missing | is_mddyyyy | is_mmddyyyy)
             
-            # DDMMYYYY
-            if re.match(r'^\d{8}$', date_str):
-                try:
-                    day = date_str[0:2]
-                    month = date_str[2:4]
-                    year = date_str[4:8]
-                    formatted_date = f"{year}-{month}-{day}"
-                    return pd.to_datetime(formatted_date, errors='coerce')
-                except:
-                    pass
+            parsed = pd.Series(pd.NaT, index=values.index, dtype='datetime64[us]')
+            if is_mddyyyy.any():
+                digits = date_str[is_mddyyyy]
+                iso = digits.str[3:7] + '-0' + digits.str[0:1] + '-' + digits.str[1:3]
+                parsed[is_mddyyyy] = pd.to_datetime(iso, format='%Y-%m-%d', errors='coerce').to_numpy()
+            if is_mmddyyyy.any():
+                digits = date_str[is_mmddyyyy]
+                iso = digits.str[4:8] + '-' + digits.str[0:2] + '-' + digits.str[2:4]
+                parsed[is_mmddyyyy] = pd.to_datetime(iso, format='%Y-%m-%d', errors='coerce').to_numpy()
             
-            # Default pandas parsing for other formats
-            try:
-                return pd.to_datetime(date_str, errors='coerce')
-            except:
-                return pd.NaT
+            # Default pandas parsing for other formats (each value parsed on its own, as before)
+            if other.any():
+                parsed[other] = pd.to_datetime(date_str[other], format='mixed', errors='coerce').to_numpy()
+            return parsed
         
         # Apply custom parsing
         try:
-            parsed_series = series.apply(parse_custom_date)
+            parsed_series = parse_custom_dates(series)
             return parsed_series
         except:
             # Fallback to standard conversion
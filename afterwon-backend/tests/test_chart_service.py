@@ -0,0 +1,51 @@
+import numpy as np
+import orjson
+import pandas as pd
+import pytest
+
+from app.services.chart_service import ChartRecommendationEngine, ChartService, to_json_bytes
+
+
+@pytest.fixture(scope="module")
+def chart_service():
+    return ChartService()
+
+
+@pytest.mark.parametrize("chart_type", ["bar", "pie", "funnel", "strip", "violin", "density_heatmap"])
+def test_datetime_column_with_nat_serializes(chart_service, chart_type):
+    df = pd.DataFrame({
+        "d": pd.to_datetime(["2021-01-01", None, "2021-01-03", "2021-01-04"]),
+        "v": [1.0, 2.0, 3.0, 4.0],
+    })
+    chart = chart_service.generate_plotly_chart(df, {"chart_type": chart_type, "chart_columns": {"x": "d", "y": "v"}})
+
+    # 이전에는 NaT가 들어간 datetime64 배열에서 TypeError: unrepresentable numpy.datetime64 발생
+    assert "data" in orjson.loads(to_json_bytes(chart))
+
+
+def test_to_json_bytes_datetime_array_nat_is_null():
+    values = np.array(["2021-01-01T01:02:03", "NaT"], dtype="datetime64[ns]")
+    assert orjson.loads(to_json_bytes({"x": values})) == {"x": ["2021-01-01T01:02:03", None]}
+
+
+def test_recommendation_cache_distinguishes_cardinality():
+    engine = ChartRecommendationEngine()
+    low = pd.DataFrame({"c": ["a", "b"] * 100, "v": np.arange(200.0)})
+    high = pd.DataFrame({"c": [f"x{i}" for i in range(200)], "v": np.arange(200.0)})
+
+    engine.recommend_charts(low, "q")
+    # 같은 스키마/행 수라도 카디널리티가 다르면 캐시된 추천을 재사용하면 안 됨
+    assert engine.recommend_charts(high, "q") == ChartRecommendationEngine().recommend_charts(high, "q")
+
+
+def test_figures_do_not_share_nested_dicts(chart_service):
+    df = pd.DataFrame({"c": list("abcd") * 5, "v": np.arange(20.0)})
+    config = {"chart_type": "bar", "chart_columns": {"x": "c", "y": "v"}}
+
+    first = chart_service.generate_plotly_chart(df, config)
+    first["layout"]["template"]["layout"]["font"]["color"] = "red"
+    first["layout"]["title"]["font"]["size"] = 99
+
+    second = chart_service.generate_plotly_chart(df, config)
+    assert second["layout"]["template"]["layout"]["font"]["color"] != "red"
+    assert second["layout"]["title"]["font"]["size"] != 99